@@ -17,13 +17,27 @@
 #   You should have received a copy of the GNU General Public License
 #   along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-"""Core engine module."""
+"""Core engine module.
 
-from core.app import ECSGameApp
+The application is imported lazily so that pulling in lightweight core
+modules (e.g. core.types, used by every ECS component) does not load
+pygame, the scenes and all systems as a side effect.
+"""
+
+
+def __getattr__(name: str):
+    """Resolve ECSGameApp on first access instead of at package import."""
+    if name == "ECSGameApp":
+        from core.app import ECSGameApp
+
+        return ECSGameApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main():
     """Main game entry point."""
+    from core.app import ECSGameApp
+
     app = ECSGameApp()
     app.initialize()
     app.run()
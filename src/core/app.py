@@ -40,7 +40,7 @@ from core.clock import GameClock
 from game.config import GameConfig
 from game.settings import GameSettings
 from game.services.assets import GameAssets
-from game.constants import WINDOW_TITLE
+from game.constants import DIFFICULTY_PERCENTAGES, WINDOW_TITLE
 from core.rendering.pygame_surface_renderer import PygameSurfaceRenderer
 
 
@@ -104,6 +104,7 @@ class ECSGameApp:
 
         # create renderer
         self.renderer = PygameSurfaceRenderer(self.surface)
+        self.pygame_adapter.set_redraw_handler(self.renderer.invalidate)
 
         # create scene manager
         self.scene_manager = SceneManager()
@@ -208,16 +209,7 @@ class ECSGameApp:
         """Calculate number of obstacles based on difficulty setting."""
         difficulty = self.settings.get("obstacle_difficulty")
 
-        # difficulty percentages
-        percentages = {
-            "None": 0.0,
-            "Easy": 0.04,
-            "Medium": 0.06,
-            "Hard": 0.10,
-            "Impossible": 0.15,
-        }
-
-        percentage = percentages.get(difficulty, 0.0)
+        percentage = DIFFICULTY_PERCENTAGES.get(difficulty, 0.0)
         total_cells = self.world.board.width * self.world.board.height
         return int(total_cells * percentage)
 
@@ -228,28 +220,30 @@ class ECSGameApp:
 
         self.running = True
 
+        # the clock, renderer and scene manager live as long as the app, so
+        # their methods are bound once instead of looked up every frame
+        tick = self.clock.tick
+        begin_frame = self.renderer.begin_frame
+        present = self.renderer.update
+        update_scene = self.scene_manager.update
+        render_scene = self.scene_manager.render
+
         # main game loop
         while self.running:
-            # get delta time
-            dt_ms = self.clock.tick()
+            # sleep out the rest of the previous frame and get delta time
+            dt_ms = tick()
 
             # begin rendering frame (clears command queue)
-            self.renderer.begin_frame(clear_color=(32, 32, 32, 255))  # dark gray
+            begin_frame(clear_color=(32, 32, 32, 255))  # dark gray
 
             # update scene manager (handles scene transitions and updates)
-            self.scene_manager.update(dt_ms)
+            update_scene(dt_ms)
 
             # render current scene
-            self.scene_manager.render()
-
-            # execute all queued draw commands
-            self.renderer.update()
-
-            # update display
-            self.pygame_adapter.update_display()
+            render_scene()
 
-            # cap frame rate
-            self.world.clock.tick(60)
+            # execute all queued draw commands and present the changed areas
+            present()
 
     def quit(self) -> None:
         """Quit the game application."""
@@ -27,7 +27,9 @@ class GameClock:
     """Game clock with fixed timestep and frame limiting.
 
     This class provides consistent timing for the game loop, ensuring
-    smooth gameplay regardless of frame rate variations.
+    smooth gameplay regardless of frame rate variations. It is the only
+    frame limiter of the loop: the rest of each frame is slept away by
+    pygame instead of spinning, so an idle game does not hold a core busy.
     """
 
     def __init__(self, target_fps: int = 60):
@@ -41,45 +43,32 @@ class GameClock:
         self.last_time: Optional[float] = None
         self.accumulator: float = 0.0
         self.delta_time: float = 0.0
+        self._clock = pygame.time.Clock()
 
     def tick(self, fps_limit: Optional[int] = None) -> float:
-        """Tick the clock and return delta time in milliseconds.
+        """Wait for the rest of the frame and return delta time in milliseconds.
 
         Args:
             fps_limit: Optional FPS limit override (uses target_fps if None)
 
         Returns:
-            Delta time in milliseconds since last tick
+            Delta time in milliseconds since last tick, sleep included
         """
-        current_time = pygame.time.get_ticks()
+        fps = fps_limit if fps_limit is not None else self.target_fps
 
-        if self.last_time is None:
-            self.last_time = current_time
+        # pygame sleeps (no busy wait) until the frame time is reached and
+        # returns the real elapsed time, including that sleep
+        frame_time = self._clock.tick(fps)
+
+        first_tick = self.last_time is None
+        self.last_time = pygame.time.get_ticks()
+        if first_tick:
             self.delta_time = 0.0
             return self.delta_time
 
-        # Calculate frame time
-        frame_time = current_time - self.last_time
-        self.last_time = current_time
-
-        # Apply frame limiting if specified
-        if fps_limit is not None:
-            target_frame_time = 1000.0 / fps_limit
-        else:
-            target_frame_time = self.target_frame_time
-
         # Cap frame time to prevent spiral of death
-        max_frame_time = target_frame_time * 2.0
-        frame_time = min(frame_time, max_frame_time)
-
-        # Store delta time
-        self.delta_time = frame_time
-
-        # Frame limiting
-        if frame_time < target_frame_time:
-            sleep_time = target_frame_time - frame_time
-            pygame.time.wait(int(sleep_time))
-            self.delta_time = target_frame_time
+        max_frame_time = 1000.0 / fps * 2.0
+        self.delta_time = float(min(frame_time, max_frame_time))
 
         return self.delta_time
 
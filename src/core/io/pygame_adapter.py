@@ -30,9 +30,23 @@ The adapter provides no game logic - it's purely an IO interface.
 """
 
 import pygame
-from typing import List, Tuple
+from typing import Callable, List, Optional, Tuple
 from pygame import Surface, Rect
 
+from core.rendering.sprites import clear_sprite_cache
+
+# event types the game reacts to; everything else (mouse motion, most window
+# events) is kept out of the queue so it cannot wake an idle menu
+INPUT_EVENT_TYPES = [pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP]
+
+# window events after which the display contents must be pushed again
+REDRAW_EVENT_TYPES = [
+    pygame.WINDOWEXPOSED,
+    pygame.WINDOWSHOWN,
+    pygame.WINDOWRESTORED,
+    pygame.VIDEOEXPOSE,
+]
+
 
 class PygameIOAdapter:
     """Adapter for pygame IO operations.
@@ -44,6 +58,29 @@ class PygameIOAdapter:
 
     def __init__(self):
         """Initialize the pygame IO adapter."""
+        self._redraw_handler: Optional[Callable[[], None]] = None
+
+    def set_redraw_handler(self, handler: Optional[Callable[[], None]]) -> None:
+        """Set the callback run when the window needs a full redraw.
+
+        The handler is called whenever an event in REDRAW_EVENT_TYPES is
+        read from the queue, e.g. after the window is uncovered or restored.
+
+        Args:
+            handler: Callback taking no arguments, or None to remove it
+        """
+        self._redraw_handler = handler
+
+    def _check_redraw(self, events: List[pygame.event.Event]) -> None:
+        """Run the redraw handler if any of the events asks for a redraw.
+
+        Args:
+            events: Events just read from the queue
+        """
+        if self._redraw_handler is None:
+            return
+        if any(event.type in REDRAW_EVENT_TYPES for event in events):
+            self._redraw_handler()
 
     def get_events(self) -> List[pygame.event.Event]:
         """Get all pending pygame events.
@@ -51,7 +88,9 @@ class PygameIOAdapter:
         Returns:
             List of pygame events that occurred since last call.
         """
-        return pygame.event.get()
+        events = pygame.event.get()
+        self._check_redraw(events)
+        return events
 
     def wait_for_event(self) -> pygame.event.Event:
         """Wait for a single pygame event.
@@ -61,9 +100,31 @@ class PygameIOAdapter:
         """
         return pygame.event.wait()
 
+    def wait_for_events(self, timeout_ms: int) -> List[pygame.event.Event]:
+        """Block until an event arrives or the timeout elapses.
+
+        Lets static screens sleep instead of polling the queue every frame.
+
+        Args:
+            timeout_ms: Longest time to wait, in milliseconds
+
+        Returns:
+            The event that ended the wait followed by any other pending
+            events, or an empty list on timeout
+        """
+        event = pygame.event.wait(timeout_ms)
+        if event.type == pygame.NOEVENT:
+            return []
+        events = [event] + pygame.event.get()
+        self._check_redraw(events)
+        return events
+
     def set_mode(self, size: Tuple[int, int], flags: int = 0) -> Surface:
         """Create a new display surface.
 
+        Sprites converted for the previous display are dropped, so they are
+        converted again for the new one.
+
         Args:
             size: Width and height of the display surface
             flags: Optional display flags
@@ -71,7 +132,9 @@ class PygameIOAdapter:
         Returns:
             New display surface
         """
-        return pygame.display.set_mode(size, flags)
+        surface = pygame.display.set_mode(size, flags)
+        clear_sprite_cache()
+        return surface
 
     def set_caption(self, title: str) -> None:
         """Set the window caption/title.
@@ -91,11 +154,20 @@ class PygameIOAdapter:
 
     def init(self) -> None:
         """Initialize pygame subsystems."""
+        # a small mixer buffer keeps sound effect latency low
+        pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=512)
         pygame.init()
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(INPUT_EVENT_TYPES + REDRAW_EVENT_TYPES)
 
     def init_mixer(self) -> None:
-        """Initialize pygame mixer for audio."""
+        """Initialize pygame mixer for audio.
+
+        Channel 0 is reserved so priority sound effects always have a free
+        channel to play on.
+        """
         pygame.mixer.init()
+        pygame.mixer.set_reserved(1)
 
     def create_surface(self, size: Tuple[int, int], flags: int = 0) -> Surface:
         """Create a new surface.
@@ -23,6 +23,11 @@ from typing import Protocol, Optional
 from dataclasses import dataclass
 import pygame
 
+# above this fraction of the surface, one full update beats a rect list
+FULL_UPDATE_AREA_RATIO = 0.5
+# past this many rects, per-rect overhead makes one full update cheaper
+MAX_DIRTY_RECTS = 40
+
 
 @dataclass
 class DrawCommand:
@@ -45,7 +50,8 @@ class RenderEnqueue(Protocol):
     Systems receive this interface to queue draw commands without access to
     frame control methods (begin_frame, update).
 
-    Provides only primitive drawing operations (fill, blit, draw_line, draw_rect).
+    Provides only primitive drawing operations (fill, blit, blits, draw_line,
+    draw_rect).
     Scenes/systems compose these primitives to create complex UI, following
     proper separation of concerns.
     """
@@ -65,6 +71,9 @@ class RenderEnqueue(Protocol):
         area: Optional[pygame.Rect] = None,
         special_flags: int = 0,
     ) -> None: ...
+    def blits(
+        self, blit_sequence: list[tuple[pygame.Surface, tuple[int, int] | pygame.Rect]]
+    ) -> None: ...
     def draw_line(
         self,
         color: tuple[int, int, int],
@@ -73,7 +82,10 @@ class RenderEnqueue(Protocol):
         width: int = 1,
     ) -> None: ...
     def draw_rect(
-        self, color: tuple[int, int, int], rect: pygame.Rect, width: int = 0
+        self,
+        color: tuple[int, int, int],
+        rect: pygame.Rect | tuple[int, int, int, int],
+        width: int = 0,
     ) -> None: ...
 
 
@@ -122,6 +134,11 @@ class _RendererView(RenderEnqueue):
     ) -> None:
         self._impl.blit(source, dest, area, special_flags)
 
+    def blits(
+        self, blit_sequence: list[tuple[pygame.Surface, tuple[int, int] | pygame.Rect]]
+    ) -> None:
+        self._impl.blits(blit_sequence)
+
     def draw_line(
         self,
         color: tuple[int, int, int],
@@ -132,7 +149,10 @@ class _RendererView(RenderEnqueue):
         self._impl.draw_line(color, start_pos, end_pos, width)
 
     def draw_rect(
-        self, color: tuple[int, int, int], rect: pygame.Rect, width: int = 0
+        self,
+        color: tuple[int, int, int],
+        rect: pygame.Rect | tuple[int, int, int, int],
+        width: int = 0,
     ) -> None:
         self._impl.draw_rect(color, rect, width)
 
@@ -147,6 +167,21 @@ class PygameSurfaceRenderer:
     - Full access: Main loop (can call begin_frame, update)
     - View access: Systems (can only queue commands via view())
 
+    Only the parts of the display that changed are pushed to the screen.
+    Commands that cover the whole surface (clearing, the pre-rendered
+    board background, overlays) are compared with the previous frame: if
+    they are the same operations on the same colors and surface objects,
+    they produced the same pixels, and only the areas touched by the other
+    commands, this frame and the last one, are updated. A frame whose
+    commands are all equal to the previous frame's is not drawn or pushed
+    at all. Surfaces passed to the queue must therefore not be modified
+    once queued.
+
+    The clear color set by begin_frame is only painted when the frame is
+    drawn and its first command does not already cover the whole surface,
+    so scenes that start with a full fill or background blit do not pay
+    for a second full-surface write.
+
     Attributes:
         _surface: The underlying pygame surface
         _command_queue: List of draw commands to execute
@@ -160,6 +195,11 @@ class PygameSurfaceRenderer:
         """
         self._surface = surface
         self._command_queue: list[DrawCommand] = []
+        self._clear_color: tuple | None = None
+        # whole-surface commands and partial areas of the previous frame
+        self._previous_covers: list | None = None
+        self._previous_dirty: list[pygame.Rect] = []
+        self._previous_frame: tuple | None = None
 
     # Read-only properties for display information
 
@@ -239,6 +279,25 @@ class PygameSurfaceRenderer:
             )
         )
 
+    def blits(
+        self, blit_sequence: list[tuple[pygame.Surface, tuple[int, int] | pygame.Rect]]
+    ) -> None:
+        """Queue a batch of blits executed in a single call.
+
+        Drawing many copies of the same tile this way costs one command
+        instead of one per copy.
+
+        Args:
+            blit_sequence: List of (source, dest) pairs, drawn in order
+        """
+        self._command_queue.append(
+            DrawCommand(
+                operation=self._surface.blits,
+                args=(blit_sequence,),
+                kwargs={},
+            )
+        )
+
     def draw_line(
         self,
         color: tuple[int, int, int],
@@ -263,13 +322,16 @@ class PygameSurfaceRenderer:
         )
 
     def draw_rect(
-        self, color: tuple[int, int, int], rect: pygame.Rect, width: int = 0
+        self,
+        color: tuple[int, int, int],
+        rect: pygame.Rect | tuple[int, int, int, int],
+        width: int = 0,
     ) -> None:
         """Queue a rectangle drawing operation.
 
         Args:
             color: RGB color tuple
-            rect: Rectangle to draw
+            rect: Rectangle to draw, as a Rect or an (x, y, w, h) tuple
             width: Line width (0 for filled rectangle)
         """
         self._command_queue.append(
@@ -285,36 +347,121 @@ class PygameSurfaceRenderer:
     def begin_frame(
         self, clear_color: tuple[int, int, int, int] = (0, 0, 0, 0)
     ) -> None:
-        """Begin a new frame by clearing the surface and command queue.
+        """Begin a new frame by clearing the command queue.
 
         This should be called at the start of each frame by the main rendering loop.
+        The surface itself is cleared by update(), and only if needed.
 
         Args:
             clear_color: RGBA color to clear the surface with (default: transparent black)
         """
-        self._surface.fill(clear_color)
+        self._clear_color = clear_color
         self._command_queue.clear()
 
+    def invalidate(self) -> None:
+        """Make the next update push the whole display.
+
+        Called when the window contents were lost (uncovered, shown again or
+        restored), since an unchanged frame would otherwise not be presented.
+        """
+        self._previous_frame = None
+        self._previous_covers = None
+
+    def _covers_surface(self, command: DrawCommand) -> bool:
+        """Check whether a command overwrites every pixel of the surface.
+
+        Only plain fills and opaque blits of a surface at least as large
+        as the target at (0, 0) are recognized. Surfaces with per-pixel
+        alpha (SRCALPHA, e.g. from convert_alpha) never count as opaque.
+
+        Args:
+            command: Queued command to inspect
+
+        Returns:
+            bool: True if nothing drawn before the command stays visible
+        """
+        if command.kwargs:
+            return False
+        if command.operation == self._surface.fill:
+            return len(command.args) == 1
+        if command.operation == self._surface.blit:
+            source, dest = command.args
+            if tuple(dest[:2]) != (0, 0):
+                return False
+            width, height = source.get_size()
+            target_width, target_height = self._surface.get_size()
+            return (
+                width >= target_width
+                and height >= target_height
+                and not source.get_flags() & pygame.SRCALPHA
+                and source.get_alpha() is None
+                and source.get_colorkey() is None
+            )
+        return False
+
     def update(self) -> None:
         """Execute all queued draw commands and update the display.
 
         This method:
         1. Executes all queued commands in order
         2. Clears the command queue
-        3. Updates the pygame display
+        3. Updates the changed parts of the pygame display
 
         This should be called once per frame after all systems have queued
         their draw operations. Only the main rendering loop should call this.
         """
-        # Execute all queued commands in order
+        # nothing changed since the last frame: the display is up to date
+        frame = (
+            self._surface.get_size(),
+            self._clear_color,
+            [(c.operation, c.args, c.kwargs) for c in self._command_queue],
+        )
+        if frame == self._previous_frame:
+            self._command_queue.clear()
+            return
+        self._previous_frame = frame
+
+        # paint the clear color unless the first command hides it anyway
+        if self._clear_color is not None and not (
+            self._command_queue and self._covers_surface(self._command_queue[0])
+        ):
+            self._surface.fill(self._clear_color)
+
+        surface_rect = self._surface.get_rect()
+        covers = [(self._surface.get_size(), self._clear_color)]
+        dirty: list[pygame.Rect] = []
+
+        # Execute all queued commands in order, collecting touched areas
         for command in self._command_queue:
-            command.operation(*command.args, **command.kwargs)
+            result = command.operation(*command.args, **command.kwargs)
+            if isinstance(result, pygame.Rect):
+                if result.contains(surface_rect):
+                    covers.append((command.operation, command.args))
+                else:
+                    dirty.append(result)
+            elif isinstance(result, list):
+                dirty.extend(result)
+            else:
+                # unknown area, assume the whole surface changed
+                covers.append(None)
 
         # Clear the queue for next frame
         self._command_queue.clear()
 
         # Update the display
-        pygame.display.update()
+        full_update = None in covers or covers != self._previous_covers
+        if not full_update:
+            areas = dirty + self._previous_dirty
+            changed = sum(rect.width * rect.height for rect in areas)
+            limit = surface_rect.width * surface_rect.height * FULL_UPDATE_AREA_RATIO
+            full_update = len(areas) > MAX_DIRTY_RECTS or changed > limit
+        if full_update:
+            pygame.display.update()
+        else:
+            pygame.display.update(areas)
+
+        self._previous_covers = covers
+        self._previous_dirty = dirty
 
     # View factory method
 
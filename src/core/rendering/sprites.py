@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+#
+#   Copyright (c) 2023, Monaco F. J. <monaco@usp.br>
+#
+#   This file is part of Naja.
+#
+#   Naja is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Sprite loading in the display pixel format.
+
+Images are decoded in the file's native pixel format, which makes every
+blit convert each pixel on the fly. Converting once at load time lets
+SDL blit straight into the display surface. The same applies to surfaces
+pre-rendered once and blitted every frame.
+
+Converted sprites are cached per path and shared by every caller, so they
+must not be modified after they are returned.
+"""
+
+import pygame
+
+_sprites: dict[str, pygame.Surface] = {}
+
+
+def load_sprite(path: str) -> pygame.Surface:
+    """Load an image and convert it to the display pixel format, once per path.
+
+    The conversion needs a display mode to be set; before that (e.g. in
+    headless tests) the image is returned as decoded and is not cached,
+    so it is converted when loaded again once a display exists.
+
+    Args:
+        path: Path to the image file
+
+    Returns:
+        pygame.Surface: Loaded image, with per-pixel alpha kept
+
+    Raises:
+        pygame.error: If the image cannot be loaded
+    """
+    sprite = _sprites.get(path)
+    if sprite is None:
+        sprite = to_display_format(pygame.image.load(path))
+        if pygame.display.get_surface() is not None:
+            _sprites[path] = sprite
+    return sprite
+
+
+def to_display_format(surface: pygame.Surface, alpha: bool = True) -> pygame.Surface:
+    """Convert a surface to the display pixel format, if a display exists.
+
+    Before set_mode (e.g. in headless tests) the surface is returned as is.
+
+    Args:
+        surface: Surface to convert
+        alpha: Whether to keep per-pixel alpha (convert_alpha) or not
+
+    Returns:
+        pygame.Surface: Converted surface, or the original one
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
+
+
+def clear_sprite_cache() -> None:
+    """Drop all cached sprites.
+
+    Called whenever the display mode is set, since cached sprites are in
+    the pixel format of the previous display.
+    """
+    _sprites.clear()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+#
+#   Copyright (c) 2023, Monaco F. J. <monaco@usp.br>
+#
+#   This file is part of Naja.
+#
+#   Naja is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Cached font loading and text rasterization.
+
+Menus and HUD elements redraw the same labels every frame. Opening a
+font and rasterizing glyphs through FreeType on every call dominates
+their cost, so fonts are cached per pixel size and rendered labels per
+(text, size, color, alpha). Labels are converted to the display pixel
+format once, since most of them are blitted every frame. Cached surfaces
+are shared: callers must not modify them after they are returned.
+"""
+
+import pygame
+
+from core.rendering.sprites import to_display_format
+
+FONT_PATH = "assets/font/GetVoIP-Grotesque.ttf"
+
+# upper bound on cached labels; changing labels (score, speed) are few,
+# but the cache is simply dropped if it ever grows past this
+MAX_CACHED_TEXTS = 512
+
+_fonts: dict[int, pygame.font.Font] = {}
+_texts: dict[tuple, pygame.Surface] = {}
+
+
+def get_font(size_px: int) -> pygame.font.Font:
+    """Get the game font at a given size, opening it only once.
+
+    Falls back to pygame's default font if the game font cannot be loaded.
+
+    Args:
+        size_px: Font size in pixels
+
+    Returns:
+        pygame.font.Font: Cached font for that size
+    """
+    font = _fonts.get(size_px)
+    if font is None:
+        try:
+            font = pygame.font.Font(FONT_PATH, size_px)
+        except Exception:
+            font = pygame.font.Font(None, size_px)
+        _fonts[size_px] = font
+    return font
+
+
+def render_text(
+    text: str,
+    size_px: int,
+    color,
+    alpha: int | None = None,
+    antialias: bool = True,
+) -> pygame.Surface:
+    """Render text with the game font, reusing a previous rendering.
+
+    Args:
+        text: Text to render
+        size_px: Font size in pixels
+        color: Text color (hex string, RGB(A) tuple or pygame.Color)
+        alpha: Optional surface alpha applied once after rendering
+        antialias: Whether to use antialiasing (default: True)
+
+    Returns:
+        pygame.Surface: Rendered text surface (shared, do not modify)
+    """
+    if not isinstance(color, (str, tuple)):
+        color = tuple(color)
+    key = (text, size_px, color, alpha, antialias)
+    surface = _texts.get(key)
+    if surface is None:
+        surface = to_display_format(get_font(size_px).render(text, antialias, color))
+        if alpha is not None:
+            surface.set_alpha(alpha)
+        if len(_texts) >= MAX_CACHED_TEXTS:
+            _texts.clear()
+        _texts[key] = surface
+    return surface
+
+
+def clear_text_cache() -> None:
+    """Drop all cached fonts and rendered labels (e.g. after a resize)."""
+    _fonts.clear()
+    _texts.clear()
@@ -68,12 +68,14 @@ class Board:
         height: Board height in tiles
         cell_size: Size of each cell in pixels
         is_square: True if width equals height
+        revision: Counter bumped on every tile modification
     """
 
     _grid: list[list[Tile]]
     _width: int
     _height: int
     _cell_size: int
+    _revision: int
 
     def __init__(
         self,
@@ -103,6 +105,7 @@ class Board:
         self._cell_size = cell_size
         # initialize 2D grid with default tiles (row-major order)
         self._grid = [[default_tile for _ in range(width)] for _ in range(height)]
+        self._revision = 0
 
     @property
     def width(self) -> int:
@@ -131,6 +134,18 @@ class Board:
         """
         return self._cell_size
 
+    @property
+    def revision(self) -> int:
+        """Get the tile modification counter.
+
+        Lets renderers cache anything derived from the tiles and rebuild
+        it only when the board actually changed.
+
+        Returns:
+            int: Number of tile modifications so far
+        """
+        return self._revision
+
     @property
     def is_square(self) -> bool:
         """Check if board is square.
@@ -168,7 +183,9 @@ class Board:
         Raises:
             BoardOutOfBoundsError: If position is out of bounds
         """
-        self._check_bounds(x, y)
+        # bounds check inlined, this is called for every cell on hot paths
+        if not (0 <= x < self._width and 0 <= y < self._height):
+            raise BoardOutOfBoundsError(x, y, self._width, self._height)
         return self._grid[y][x]
 
     def set_tile(self, x: int, y: int, tile: Tile) -> None:
@@ -184,8 +201,10 @@ class Board:
         Raises:
             BoardOutOfBoundsError: If position is out of bounds
         """
-        self._check_bounds(x, y)
+        if not (0 <= x < self._width and 0 <= y < self._height):
+            raise BoardOutOfBoundsError(x, y, self._width, self._height)
         self._grid[y][x] = tile
+        self._revision += 1
 
     def set_tiles(self, tile_updates: list[tuple[int, int, Tile]]) -> None:
         """Update multiple tiles at once.
@@ -213,6 +232,7 @@ class Board:
         # if all valid, apply updates
         for x, y, tile in tile_updates:
             self._grid[y][x] = tile
+        self._revision += 1
 
     def clear(self, tile: Tile = Tile.EMPTY) -> None:
         """Clear the entire board to a specific tile type.
@@ -223,6 +243,7 @@ class Board:
         for y in range(self._height):
             for x in range(self._width):
                 self._grid[y][x] = tile
+        self._revision += 1
 
     def get_row(self, y: int) -> list[Tile]:
         """Get entire row as a list.
@@ -22,12 +22,14 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Grid position of an entity.
 
     Stores the current position in pixel coordinates (aligned to grid).
     prev_x and prev_y store the previous position for interpolation.
+    Slotted because every snake tail segment is a Position, which keeps
+    long tails compact and their attribute access fast.
     Used by: Snake, Apple, Obstacle
     """
 
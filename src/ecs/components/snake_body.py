@@ -19,6 +19,7 @@
 
 """Snake body component."""
 
+from collections import deque
 from dataclasses import dataclass, field
 
 from ecs.components.position import Position
@@ -30,9 +31,15 @@ class SnakeBody:
 
     Stores the history of segment positions and pending growth.
     Head position is stored in the entity's Position component.
+    Segments are kept in a deque so the movement system can advance the
+    tail by rotating one segment from the back to the front.
+    The occupied map mirrors segments as a per-cell segment count so
+    collision checks are a single dict lookup instead of a tail scan;
+    MovementSystem keeps it in sync.
     Used by: Snake
     """
 
-    segments: list[Position] = field(default_factory=list)
+    segments: deque[Position] = field(default_factory=deque)
     size: int = 1  # Guards the size of the snake
     alive: bool = True
+    occupied: dict[tuple[int, int], int] = field(default_factory=dict)
@@ -36,7 +36,7 @@ class Snake(Entity):
     Defines the components that make up a snake entity:
     - position: head position in grid
     - velocity: movement direction and speed
-    - body: tail segments as Position list
+    - body: tail segments as a deque of Positions
     - interpolation: smooth rendering data
     - renderable: visual appearance (contains head color)
 
@@ -23,6 +23,7 @@ import random
 from typing import Optional, Literal
 
 from ecs.world import World
+from ecs.board import Tile
 from ecs.entities.obstacle_field import Obstacle
 from ecs.components.position import Position
 from ecs.components.obstacle import ObstacleTag
@@ -42,7 +43,9 @@ def create_obstacles(
 ) -> list[int]:
     """Create obstacle entities based on difficulty level.
 
-    Creates obstacles that fill a percentage of the board based on difficulty:
+    Creates obstacles that fill a percentage of the board based on difficulty
+    and marks their cells as Tile.OBSTACLE on the board, which serves as the
+    obstacle lookup index for collision detection:
     - None: 0%
     - Easy: 4%
     - Medium: 6%
@@ -99,22 +102,28 @@ def create_obstacles(
     # randomly select cells for obstacles
     obstacle_positions = random.sample(available_cells, num_obstacles)
 
+    # obstacles never change their look, so the whole field shares a
+    # single tag and renderable; only the position is per entity
+    tag = ObstacleTag()
+    renderable = Renderable(
+        shape="square",
+        color=Color.from_hex("#666666"),  # Gray color for obstacles
+        size=grid_size,
+        layer=0,
+    )
+
     # create obstacle entities
     obstacle_ids = []
-    for i, (x, y) in enumerate(obstacle_positions):
+    for x, y in obstacle_positions:
         # Create obstacle with grid coordinates (tiles), not pixels
         obstacle = Obstacle(
             position=Position(x=x, y=y, prev_x=x, prev_y=y),
-            tag=ObstacleTag(),
-            renderable=Renderable(
-                shape="square",
-                color=Color.from_hex("#666666"),  # Gray color for obstacles
-                size=grid_size,
-                layer=0,
-            ),
+            tag=tag,
+            renderable=renderable,
         )
         entity_id = world.registry.add(obstacle)
         obstacle_ids.append(entity_id)
+        board.set_tile(x, y, Tile.OBSTACLE)
 
     return obstacle_ids
 
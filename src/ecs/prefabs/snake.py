@@ -18,6 +18,7 @@
 
 """Snake entity prefab factory."""
 
+from collections import deque
 from typing import Optional
 
 from ecs.world import World
@@ -70,7 +71,7 @@ def create_snake(
     snake = Snake(
         position=Position(x=start_x, y=start_y, prev_x=start_x, prev_y=start_y),
         velocity=Velocity(dx=1, dy=0, speed=initial_speed),
-        body=SnakeBody(segments=[], size=1, alive=True),
+        body=SnakeBody(segments=deque(), size=1, alive=True),
         interpolation=Interpolation(alpha=0.0, wrapped_axis="none"),
         renderable=Renderable(
             shape="square",
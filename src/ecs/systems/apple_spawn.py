@@ -49,13 +49,23 @@ class AppleSpawnSystem(BaseSystem):
     This system runs after collision detection to respawn apples that were eaten.
     """
 
-    def __init__(self, max_spawn_attempts: int = 1000):
+    def __init__(
+        self, max_spawn_attempts: int = 1000, random_seed: Optional[int] = None
+    ):
         """Initialize the AppleSpawnSystem.
 
         Args:
-            max_spawn_attempts: Maximum attempts to find a valid spawn position
+            max_spawn_attempts: Maximum attempts to find a valid spawn position.
+                Kept for API compatibility, positions are drawn from the
+                free cells and never need a retry.
+            random_seed: Optional seed for deterministic spawning (testing)
         """
         self._max_spawn_attempts = max_spawn_attempts
+        # use instance-specific Random for deterministic behavior
+        self._random = random.Random(random_seed)
+        # every cell of the board, rebuilt only when the board size changes
+        self._board_cells: frozenset[tuple[int, int]] = frozenset()
+        self._board_size = (0, 0)
 
     def update(self, world: World) -> None:
         """Check apple count and spawn new apples if needed.
@@ -79,11 +89,15 @@ class AppleSpawnSystem(BaseSystem):
         if apples_to_spawn > 0:
             grid_size = world.board.cell_size
 
+            # build the free cells once and draw every new apple from it
+            free_cells = self._get_free_cells(world)
+
             for _ in range(apples_to_spawn):
-                position = self._find_valid_position(world)
-                if position:
-                    x, y = position
-                    create_apple(world, x=x, y=y, grid_size=grid_size, color=None)
+                position = self._draw_free_cell(free_cells)
+                if position is None:
+                    break  # board is full
+                x, y = position
+                create_apple(world, x=x, y=y, grid_size=grid_size, color=None)
 
     def _get_desired_apple_count(self, world: World) -> int:
         """Get the desired number of apples from AppleConfig component.
@@ -114,28 +128,67 @@ class AppleSpawnSystem(BaseSystem):
         - Doesn't overlap with obstacles
         - Doesn't overlap with existing apples
 
+        The position is drawn uniformly from the free cells, so a single
+        draw always succeeds unless the board is full.
+
         Args:
             world: ECS world
 
         Returns:
             (x, y) tuple if valid position found, None otherwise
         """
-        board = world.board
+        return self._draw_free_cell(self._get_free_cells(world))
 
-        # Get occupied positions
-        occupied = self._get_occupied_positions(world)
+    def _get_free_cells(self, world: World) -> list[tuple[int, int]]:
+        """Get all board cells not occupied by any game entity.
 
-        # Try to find a valid position
-        for _ in range(self._max_spawn_attempts):
-            x = random.randint(0, board.width - 1)
-            y = random.randint(0, board.height - 1)
+        Args:
+            world: ECS world
 
-            if (x, y) not in occupied:
-                return (x, y)
+        Returns:
+            List of (x, y) tuples representing free cells
+        """
+        # set difference runs in C instead of a per-cell Python loop
+        board_cells = self._get_board_cells(world.board)
+        return list(board_cells - self._get_occupied_positions(world))
+
+    def _get_board_cells(self, board) -> frozenset[tuple[int, int]]:
+        """Get every cell of the board, cached per board size.
+
+        Args:
+            board: Game board
+
+        Returns:
+            Frozenset of all (x, y) cells on the board
+        """
+        size = (board.width, board.height)
+        if size != self._board_size:
+            self._board_cells = frozenset(
+                (x, y) for x in range(board.width) for y in range(board.height)
+            )
+            self._board_size = size
+        return self._board_cells
+
+    def _draw_free_cell(
+        self, free_cells: list[tuple[int, int]]
+    ) -> Optional[tuple[int, int]]:
+        """Remove and return a random cell from the free cells list.
+
+        Args:
+            free_cells: Free cells list, updated in place
+
+        Returns:
+            (x, y) tuple, or None if no free cell is left
+        """
+        if not free_cells:
+            return None
 
-        # If we couldn't find a position after max attempts, return None
-        # This can happen in very cramped situations
-        return None
+        # swap the drawn cell with the last one so removal is O(1)
+        index = self._random.randrange(len(free_cells))
+        cell = free_cells[index]
+        free_cells[index] = free_cells[-1]
+        free_cells.pop()
+        return cell
 
     def _get_occupied_positions(self, world: World) -> set[tuple[int, int]]:
         """Get all positions currently occupied by game entities.
@@ -157,8 +210,7 @@ class AppleSpawnSystem(BaseSystem):
 
                 # Add body segments
                 if hasattr(snake, "body"):
-                    for segment in snake.body.segments:
-                        occupied.add((segment.x, segment.y))
+                    occupied.update(snake.body.occupied)
 
         # Get obstacle positions
         obstacles = world.registry.query_by_type(EntityType.OBSTACLE)
@@ -21,6 +21,7 @@
 
 import pygame
 from typing import Optional
+from core.rendering.sprites import load_sprite
 from ecs.systems.base_system import BaseSystem
 from ecs.world import World
 
@@ -71,30 +72,28 @@ class AssetsSystem(BaseSystem):
         try:
             # Big font for titles
             self._fonts["big"] = pygame.font.Font(
-                self.FONT_PATH, int(self._window_width / 8)
+                self.FONT_PATH, self._window_width // 8
             )
             # Small font for UI elements
             self._fonts["small"] = pygame.font.Font(
-                self.FONT_PATH, int(self._window_width / 20)
+                self.FONT_PATH, self._window_width // 20
             )
         except Exception as e:
             print(f"Warning: Could not load custom fonts: {e}")
             # Fallback to default pygame font
-            self._fonts["big"] = pygame.font.Font(None, int(self._window_width / 8))
-            self._fonts["small"] = pygame.font.Font(None, int(self._window_width / 20))
+            self._fonts["big"] = pygame.font.Font(None, self._window_width // 8)
+            self._fonts["small"] = pygame.font.Font(None, self._window_width // 20)
 
     def _load_sprites(self) -> None:
         """Load sprite images."""
         try:
-            self._sprites["speaker_on"] = pygame.image.load(self.SPEAKER_ON_SPRITE_PATH)
+            self._sprites["speaker_on"] = load_sprite(self.SPEAKER_ON_SPRITE_PATH)
         except pygame.error as e:
             print(f"Warning: Could not load speaker-on sprite: {e}")
             self._sprites["speaker_on"] = None
 
         try:
-            self._sprites["speaker_muted"] = pygame.image.load(
-                self.SPEAKER_MUTED_SPRITE_PATH
-            )
+            self._sprites["speaker_muted"] = load_sprite(self.SPEAKER_MUTED_SPRITE_PATH)
         except pygame.error as e:
             print(f"Warning: Could not load speaker-muted sprite: {e}")
             self._sprites["speaker_muted"] = None
@@ -169,9 +168,13 @@ class AssetsSystem(BaseSystem):
     def reload_fonts(self, new_window_width: int) -> None:
         """Reload fonts when window size changes.
 
+        Fonts are kept if the width did not change.
+
         Args:
             new_window_width: New window width for font sizing
         """
+        if new_window_width == self._window_width and self._fonts:
+            return
         self._window_width = new_window_width
         # Clear cached fonts
         self._fonts.clear()
@@ -34,6 +34,7 @@ from ecs.systems.base_system import BaseSystem
 from ecs.world import World
 from ecs.board import Tile
 from core.rendering.pygame_surface_renderer import RenderEnqueue
+from core.rendering.sprites import to_display_format
 from ecs.components.color_scheme import ColorScheme
 
 
@@ -53,6 +54,11 @@ class BoardRenderSystem(BaseSystem):
 
     This system queries for ColorScheme component to get colors,
     following ECS data-driven approach instead of hard-coding values.
+
+    The background, grid and tiles only change with the board or the
+    palette, so they are pre-rendered once into a surface that is blitted
+    every frame and rebuilt only when one of them changes. Obstacle tiles
+    are part of it, so obstacle entities need no per-frame drawing.
     """
 
     def __init__(self, renderer: RenderEnqueue):
@@ -62,6 +68,10 @@ class BoardRenderSystem(BaseSystem):
             renderer: RenderEnqueue view to queue draw commands (enqueue-only access)
         """
         self._renderer = renderer
+        self._background: pygame.Surface | None = None
+        self._background_key: tuple | None = None
+        self._grid_overlay: pygame.Surface | None = None
+        self._grid_overlay_key: tuple | None = None
 
     def _get_color_scheme(self, world: World) -> ColorScheme:
         """Get ColorScheme component from world entities.
@@ -99,21 +109,45 @@ class BoardRenderSystem(BaseSystem):
         Args:
             world: Game world containing the board
         """
+        color_scheme = self._get_color_scheme(world)
+        self._renderer.blit(self._get_grid_overlay(world, color_scheme), (0, 0))
+
+    def _get_grid_overlay(
+        self, world: World, color_scheme: ColorScheme
+    ) -> pygame.Surface:
+        """Get the transparent grid overlay, rebuilding it if it is stale.
+
+        The grid is one line per row and column (O(width + height) draw
+        calls), drawn only when the board geometry or grid color changes.
+
+        Args:
+            world: Game world containing the board
+            color_scheme: Color scheme to use
+
+        Returns:
+            pygame.Surface: Grid lines on a transparent surface
+        """
         board = world.board
         cell_size = board.cell_size
         width = board.width * cell_size
         height = board.height * cell_size
-
-        color_scheme = self._get_color_scheme(world)
         grid_color = color_scheme.grid.to_tuple()
 
-        # Draw vertical lines
-        for x in range(0, width, cell_size):
-            self._renderer.draw_line(grid_color, (x, 0), (x, height), 1)
+        key = (width, height, cell_size, grid_color)
+        if self._grid_overlay is None or key != self._grid_overlay_key:
+            overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+
+            # Draw vertical lines
+            for x in range(0, width, cell_size):
+                pygame.draw.line(overlay, grid_color, (x, 0), (x, height), 1)
+
+            # Draw horizontal lines
+            for y in range(0, height, cell_size):
+                pygame.draw.line(overlay, grid_color, (0, y), (width, y), 1)
 
-        # Draw horizontal lines
-        for y in range(0, height, cell_size):
-            self._renderer.draw_line(grid_color, (0, y), (width, y), 1)
+            self._grid_overlay = to_display_format(overlay)
+            self._grid_overlay_key = key
+        return self._grid_overlay
 
     def draw_tile(
         self, x: int, y: int, tile: Tile, cell_size: int, color_scheme: ColorScheme
@@ -143,9 +177,8 @@ class BoardRenderSystem(BaseSystem):
         if color is None:
             return  # Skip tiles without color mapping
 
-        # Draw the tile as a filled rectangle
-        rect = pygame.Rect(pixel_x, pixel_y, cell_size, cell_size)
-        self._renderer.draw_rect(color, rect)
+        # Draw the tile as a filled rectangle, a plain tuple needs no Rect
+        self._renderer.draw_rect(color, (pixel_x, pixel_y, cell_size, cell_size))
 
     def draw_board(self, world: World) -> None:
         """Draw all tiles on the board.
@@ -158,9 +191,68 @@ class BoardRenderSystem(BaseSystem):
         color_scheme = self._get_color_scheme(world)
 
         for y in range(board.height):
-            for x in range(board.width):
-                tile = board.get_tile(x, y)
-                self.draw_tile(x, y, tile, cell_size, color_scheme)
+            for x, tile in enumerate(board.get_row(y)):
+                # empty cells are never drawn, skip them without a call
+                if tile is not Tile.EMPTY:
+                    self.draw_tile(x, y, tile, cell_size, color_scheme)
+
+    def _get_background(self, world: World) -> pygame.Surface:
+        """Get the pre-rendered background, rebuilding it if it is stale.
+
+        Args:
+            world: Game world containing the board
+
+        Returns:
+            pygame.Surface: Arena fill, grid lines and tiles for this board
+        """
+        board = world.board
+        color_scheme = self._get_color_scheme(world)
+        key = (
+            self._renderer.get_size(),
+            id(board),
+            board.revision,
+            board.width,
+            board.height,
+            board.cell_size,
+            color_scheme.arena.to_tuple(),
+            color_scheme.grid.to_tuple(),
+            color_scheme.obstacle.to_tuple(),
+        )
+        if self._background is None or key != self._background_key:
+            # always a new surface: the previous one may still be queued
+            self._background = self._build_background(world, color_scheme)
+            self._background_key = key
+        return self._background
+
+    def _build_background(
+        self, world: World, color_scheme: ColorScheme
+    ) -> pygame.Surface:
+        """Render arena fill, grid lines and tiles into a new surface.
+
+        Args:
+            world: Game world containing the board
+            color_scheme: Color scheme to use
+
+        Returns:
+            pygame.Surface: The rendered background
+        """
+        board = world.board
+        cell_size = board.cell_size
+
+        background = pygame.Surface(self._renderer.get_size())
+        background.fill(color_scheme.arena.to_tuple())
+        background.blit(self._get_grid_overlay(world, color_scheme), (0, 0))
+
+        # walls and obstacles never move between board changes, so they are
+        # baked in here; other tiles belong to entity systems
+        wall_color = color_scheme.obstacle.to_tuple()
+        for y in range(board.height):
+            for x, tile in enumerate(board.get_row(y)):
+                if tile is Tile.WALL or tile is Tile.OBSTACLE:
+                    rect = (x * cell_size, y * cell_size, cell_size, cell_size)
+                    pygame.draw.rect(background, wall_color, rect)
+
+        return to_display_format(background, alpha=False)
 
     def update(self, world: World) -> None:
         """Update method required by BaseSystem.
@@ -186,7 +278,5 @@ class BoardRenderSystem(BaseSystem):
             self.clear_screen(world)
             return
 
-        # Render normal game board foundation
-        self.clear_screen(world)
-        self.draw_grid(world)
-        self.draw_board(world)
+        # Render normal game board foundation from the cached background
+        self._renderer.blit(self._get_background(world), (0, 0))
@@ -30,19 +30,27 @@ Follows proper ECS architecture by querying world directly.
 
 from typing import Optional, Any
 
+from ecs.board import Tile
 from ecs.systems.base_system import BaseSystem
 from ecs.world import World
 
 
+# log labels for each death reason reported by the collision checks
+_DEATH_CAUSE_LABELS = {
+    "wall": "Wall collision",
+    "self-bite": "Self-bite collision",
+    "obstacle": "Obstacle collision",
+}
+
+
 class CollisionSystem(BaseSystem):
     """System for detecting all types of collisions.
 
-    Reads: Position, Velocity, SnakeBody, GameState, Board
+    Reads: Position, Velocity, SnakeBody, GameState, Board (obstacle tiles)
     Writes: GameState (death), SnakeBody (size), Score, Velocity (speed)
     Queries:
         - Snake entity (EntityType.SNAKE)
         - Apple entities (EntityType.APPLE)
-        - Obstacle entities (EntityType.OBSTACLE)
         - Score entities (component "score")
         - GameState entity (component "game_state")
 
@@ -72,6 +80,8 @@ class CollisionSystem(BaseSystem):
         """
         self._settings = settings
         self._audio_service = audio_service
+        # head cell the apples were last checked against
+        self._apple_checked_cell: Optional[tuple[int, int]] = None
 
     def update(self, world: World) -> None:
         """Check for all collision types in priority order.
@@ -85,26 +95,60 @@ class CollisionSystem(BaseSystem):
         Args:
             world: ECS world to query entities
         """
-        # Check wall collision first (highest priority)
-        if self._check_wall_collision(world):
-            print("☠️  DEATH CAUSE: Wall collision")
-            self._handle_death(world, "wall")
+        # look the snake up once and share it with every check
+        snake = self._get_snake_entity(world)
+        if snake is None:
             return
 
-        # Check self-bite collision
-        if self._check_self_bite(world):
-            print("☠️  DEATH CAUSE: Self-bite collision")
-            self._handle_death(world, "self-bite")
+        # a dead or stationary snake cannot run into anything new
+        body = getattr(snake, "body", None)
+        if body is not None and not body.alive:
+            return
+        velocity = getattr(snake, "velocity", None)
+        if velocity is not None and velocity.dx == 0 and velocity.dy == 0:
             return
 
-        # Check obstacle collision
-        if self._check_obstacle_collision(world):
-            print("☠️  DEATH CAUSE: Obstacle collision")
-            self._handle_death(world, "obstacle")
+        # detection is side-effect free, death handling happens only here
+        reason = self._find_fatal_collision(world, snake)
+        if reason is not None:
+            print(f"☠️  DEATH CAUSE: {_DEATH_CAUSE_LABELS[reason]}")
+            self._handle_death(world, reason, snake)
             return
 
-        # Check apple collision (doesn't kill)
-        self._check_apple_collision(world)
+        # Check apple collision (doesn't kill). Apples never spawn under the
+        # head, so they only need scanning once each time it enters a cell.
+        head_cell = (snake.position.x, snake.position.y)
+        if head_cell != self._apple_checked_cell:
+            self._apple_checked_cell = head_cell
+            self._check_apple_collision(world, snake)
+
+    def _find_fatal_collision(self, world: World, snake) -> Optional[str]:
+        """Run the fatal collision checks in priority order.
+
+        Args:
+            world: ECS world
+            snake: Snake entity to check
+
+        Returns:
+            Death reason ("wall", "self-bite" or "obstacle"), or None if the
+            snake survives this frame
+        """
+        # both checks depend on the wall mode, so read the setting once
+        electric_walls = self._electric_walls()
+
+        # Check wall collision first (highest priority)
+        if self._check_wall_collision(world, snake, electric_walls):
+            return "wall"
+
+        # Check self-bite collision
+        if self._check_self_bite(world, snake, electric_walls):
+            return "self-bite"
+
+        # Check obstacle collision
+        if self._check_obstacle_collision(world, snake):
+            return "obstacle"
+
+        return None
 
     def _get_snake_entity(self, world: World):
         """Get the snake entity from the world.
@@ -138,7 +182,17 @@ class CollisionSystem(BaseSystem):
                 return entity.game_state
         return None
 
-    def _check_wall_collision(self, world: World) -> bool:
+    def _electric_walls(self) -> bool:
+        """Get whether walls are electric (defaults to True without settings).
+
+        Returns:
+            bool: True if hitting a wall is fatal, False if the board wraps
+        """
+        return self._settings.get("electric_walls") if self._settings else True
+
+    def _check_wall_collision(
+        self, world: World, snake=None, electric_walls: Optional[bool] = None
+    ) -> bool:
         """Check collision with walls (electric mode only).
 
         Checks if snake's CURRENT position is out of bounds.
@@ -147,18 +201,19 @@ class CollisionSystem(BaseSystem):
 
         Args:
             world: ECS world
+            snake: Snake entity, looked up from the world if None
+            electric_walls: Wall mode, read from the settings if None
 
         Returns:
             bool: True if collision detected, False otherwise
         """
-        snake = self._get_snake_entity(world)
+        if snake is None:
+            snake = self._get_snake_entity(world)
         if not snake or not hasattr(snake, "position"):
             return False
 
-        # get electric walls setting
-        electric_walls = (
-            self._settings.get("electric_walls") if self._settings else True
-        )
+        if electric_walls is None:
+            electric_walls = self._electric_walls()
 
         if not electric_walls:
             return False  # no wall collisions when walls are disabled
@@ -185,18 +240,23 @@ class CollisionSystem(BaseSystem):
 
         return False
 
-    def _check_self_bite(self, world: World) -> bool:
+    def _check_self_bite(
+        self, world: World, snake=None, electric_walls: Optional[bool] = None
+    ) -> bool:
         """Check if snake head collides with its own tail.
 
         Maintains exact logic from old code.
 
         Args:
             world: ECS world
+            snake: Snake entity, looked up from the world if None
+            electric_walls: Wall mode, read from the settings if None
 
         Returns:
             bool: True if self-bite detected, False otherwise
         """
-        snake = self._get_snake_entity(world)
+        if snake is None:
+            snake = self._get_snake_entity(world)
         if (
             not snake
             or not hasattr(snake, "position")
@@ -211,57 +271,46 @@ class CollisionSystem(BaseSystem):
         next_y = snake.position.y + snake.velocity.dy
 
         # wrap if electric walls are disabled
-        electric_walls = (
-            self._settings.get("electric_walls") if self._settings else True
-        )
+        if electric_walls is None:
+            electric_walls = self._electric_walls()
         if not electric_walls:
             next_x = next_x % world.board.width
             next_y = next_y % world.board.height
 
-        # check collision with tail segments
-        tail_positions = [(seg.x, seg.y) for seg in snake.body.segments]
-        for square in tail_positions:
-            if next_x == square[0] and next_y == square[1]:
-                return True
+        # check collision with tail segments via the occupancy map
+        return (next_x, next_y) in snake.body.occupied
 
-        return False
-
-    def _check_obstacle_collision(self, world: World) -> bool:
+    def _check_obstacle_collision(self, world: World, snake=None) -> bool:
         """Check collision with obstacles.
 
         Checks if snake's CURRENT position (after movement) collides with obstacle.
+        Uses the board tiles as obstacle index, so the lookup is O(1).
 
         Args:
-            world: ECS world to query obstacles
+            world: ECS world with the obstacle index on its board
+            snake: Snake entity, looked up from the world if None
 
         Returns:
             bool: True if collision detected, False otherwise
         """
-        snake = self._get_snake_entity(world)
+        if snake is None:
+            snake = self._get_snake_entity(world)
         if not snake or not hasattr(snake, "position"):
             return False
 
         # check current position
         current_x = snake.position.x
         current_y = snake.position.y
+        board = world.board
 
-        # query all obstacles
-        from ecs.entities.entity import EntityType
-
-        obstacles = world.registry.query_by_type(EntityType.OBSTACLE)
-
-        # check if snake's current position collides with any obstacle
-        for _, obstacle in obstacles.items():
-            if hasattr(obstacle, "position"):
-                if (
-                    current_x == obstacle.position.x
-                    and current_y == obstacle.position.y
-                ):
-                    return True
+        # out of bounds cells never hold obstacles
+        if not (0 <= current_x < board.width and 0 <= current_y < board.height):
+            return False
 
-        return False
+        # obstacle cells are indexed on the board when obstacles are created
+        return board.get_tile(current_x, current_y) is Tile.OBSTACLE
 
-    def _check_apple_collision(self, world: World) -> None:
+    def _check_apple_collision(self, world: World, snake=None) -> None:
         """Check collision with apples and handle eating.
 
         Maintains exact logic from old code.
@@ -269,8 +318,10 @@ class CollisionSystem(BaseSystem):
 
         Args:
             world: ECS world to query apples
+            snake: Snake entity, looked up from the world if None
         """
-        snake = self._get_snake_entity(world)
+        if snake is None:
+            snake = self._get_snake_entity(world)
         if not snake or not hasattr(snake, "position"):
             return
 
@@ -318,7 +369,7 @@ class CollisionSystem(BaseSystem):
 
                     break  # only eat one apple per frame
 
-    def _handle_death(self, world: World, reason: str) -> None:
+    def _handle_death(self, world: World, reason: str, snake=None) -> None:
         """Handle snake death.
 
         Modifies GameState component and plays death audio.
@@ -326,15 +377,17 @@ class CollisionSystem(BaseSystem):
         Args:
             world: ECS world
             reason: Death reason message (e.g., "wall", "self-bite", "obstacle")
+            snake: Snake entity, looked up from the world if None
         """
         # kill the snake
-        snake = self._get_snake_entity(world)
+        if snake is None:
+            snake = self._get_snake_entity(world)
         if snake and hasattr(snake, "body"):
             snake.body.alive = False
 
         # play death sound and music
         if self._audio_service:
-            self._audio_service.play_sound("assets/sound/gameover.wav")
+            self._audio_service.play_sound("assets/sound/gameover.wav", priority=True)
             self._audio_service.play_music("assets/sound/death_song.mp3")
 
         # update game state
@@ -23,12 +23,15 @@ This system follows ECS principles by querying entities based on their
 components rather than their type, making it fully data-driven.
 """
 
+from typing import Optional
+
 import pygame
 from ecs.systems.base_system import BaseSystem
 from ecs.world import World
 from ecs.components.position import Position
 from ecs.components.renderable import Renderable
 from core.rendering.pygame_surface_renderer import RenderEnqueue
+from core.rendering.sprites import to_display_format
 
 
 class EntityRenderSystem(BaseSystem):
@@ -39,6 +42,8 @@ class EntityRenderSystem(BaseSystem):
 
     Responsibilities (following SRP):
     - Render entities with Position + Renderable components
+    - Batch entities of the same layer and color into one blits call
+    - Skip obstacles, which are baked into the board background
     - Handle different shapes (circle, square, rectangle)
     - Respect rendering layers
     - Handle visibility flag
@@ -56,9 +61,56 @@ class EntityRenderSystem(BaseSystem):
             renderer: RenderEnqueue view to queue draw commands
         """
         self._renderer = renderer
+        # apples and obstacles rarely move, so their rects are kept per entity
+        self._rects: dict[int, pygame.Rect] = {}
+        # one pre-filled tile per (color, size), blitted for every entity
+        self._tiles: dict[tuple[tuple[int, ...], int], pygame.Surface] = {}
+
+    def _get_tile(self, color: tuple[int, ...], size: int) -> pygame.Surface:
+        """Get a cell-sized tile filled with a color, building it once.
+
+        Args:
+            color: Fill color tuple
+            size: Width and height in pixels
+
+        Returns:
+            pygame.Surface: Filled tile surface
+        """
+        key = (color, size)
+        tile = self._tiles.get(key)
+        if tile is None:
+            tile = to_display_format(pygame.Surface((size, size)), alpha=False)
+            tile.fill(color)
+            self._tiles[key] = tile
+        return tile
+
+    def _get_rect(
+        self, entity_id: int, pixel_x: int, pixel_y: int, size: int
+    ) -> pygame.Rect:
+        """Get the cached rect of an entity, rebuilding it if it moved.
+
+        Args:
+            entity_id: Entity ID owning the rect
+            pixel_x: Left edge in pixels
+            pixel_y: Top edge in pixels
+            size: Width and height in pixels
+
+        Returns:
+            pygame.Rect: Rect covering the entity cell
+        """
+        rect = self._rects.get(entity_id)
+        if rect is None or rect.topleft != (pixel_x, pixel_y) or rect.width != size:
+            # a new rect is built instead of mutating one that may be queued
+            rect = pygame.Rect(pixel_x, pixel_y, size, size)
+            self._rects[entity_id] = rect
+        return rect
 
     def draw_entity(
-        self, position: Position, renderable: Renderable, cell_size: int
+        self,
+        position: Position,
+        renderable: Renderable,
+        cell_size: int,
+        entity_id: Optional[int] = None,
     ) -> None:
         """Draw a single entity based on its components.
 
@@ -66,6 +118,7 @@ class EntityRenderSystem(BaseSystem):
             position: Position component
             renderable: Renderable component
             cell_size: Size of grid cells in pixels
+            entity_id: Entity ID used to reuse its cached rect, if any
         """
         # Skip if not visible
         if not renderable.visible:
@@ -79,8 +132,11 @@ class EntityRenderSystem(BaseSystem):
         color = renderable.get_color_tuple()
 
         # Render all shapes as rectangles for now
-        # (RenderEnqueue only has draw_rect and draw_line)
-        rect = pygame.Rect(pixel_x, pixel_y, cell_size, cell_size)
+        # (shapes are not distinguished yet)
+        if entity_id is None:
+            rect = (pixel_x, pixel_y, cell_size, cell_size)
+        else:
+            rect = self._get_rect(entity_id, pixel_x, pixel_y, cell_size)
         self._renderer.draw_rect(color, rect, 0)
 
     def update(self, world: World) -> None:
@@ -109,13 +165,36 @@ class EntityRenderSystem(BaseSystem):
             entities.items(), key=lambda item: getattr(item[1].renderable, "layer", 0)
         )
 
-        # Render each entity (except snakes - they have dedicated system)
+        # Group entities sharing a layer and color so each group is queued
+        # as a single blits call of one pre-filled tile
+        batches: dict[tuple[int, tuple[int, ...]], list] = {}
         for entity_id, entity in sorted_entities:
-            # Skip snakes - they are rendered by SnakeRenderSystem
-            if hasattr(entity, "get_type") and entity.get_type() == EntityType.SNAKE:
+            # Skip snakes - they are rendered by SnakeRenderSystem, and
+            # obstacles, which BoardRenderSystem bakes into the background
+            entity_type = entity.get_type() if hasattr(entity, "get_type") else None
+            if entity_type == EntityType.SNAKE or entity_type == EntityType.OBSTACLE:
                 continue
 
             position = entity.position
             renderable = entity.renderable
+            if renderable is None or not renderable.visible:
+                continue
 
-            self.draw_entity(position, renderable, cell_size)
+            color = renderable.get_color_tuple()
+            rect = self._get_rect(
+                entity_id, position.x * cell_size, position.y * cell_size, cell_size
+            )
+            batch = batches.setdefault((renderable.layer, color), [])
+            batch.append((self._get_tile(color, cell_size), rect))
+
+        # groups were created in layer order, so layering is preserved
+        for batch in batches.values():
+            self._renderer.blits(batch)
+
+        # drop rects of entities that no longer exist (eaten apples, etc.)
+        if len(self._rects) > len(entities):
+            self._rects = {
+                entity_id: rect
+                for entity_id, rect in self._rects.items()
+                if entity_id in entities
+            }
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+#
+#   Copyright (c) 2023, Monaco F. J. <monaco@usp.br>
+#
+#   This file is part of Naja.
+#
+#   Naja is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Pre-rendered HUD surfaces for UIRenderSystem.
+
+The score label, speed bar and speaker icon only change when the value
+they show or the window size changes, so each one is kept until then
+instead of being rebuilt every frame.
+"""
+
+import pygame
+from core.rendering.sprites import load_sprite, to_display_format
+from core.rendering.text_cache import render_text
+
+# speaker sprite for each music state (on / muted)
+_SPEAKER_SPRITE_PATHS = {
+    True: "assets/sprites/speaker-on.png",
+    False: "assets/sprites/speaker-muted.png",
+}
+
+
+class HudCache:
+    """Keeps the HUD surfaces of the last frame for reuse."""
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        # speaker icons scaled to the window, keyed by (music_on, icon_size)
+        self._speaker_icons: dict[tuple[bool, int], pygame.Surface | None] = {}
+        # score label and rect with the (score, width, margin) they were laid
+        # out for
+        self._score_blit: tuple[pygame.Surface, pygame.Rect] | None = None
+        self._score_key: tuple | None = None
+        # speed bar surface with the size and fill it was drawn for
+        self._speed_bar: pygame.Surface | None = None
+        self._speed_bar_key: tuple | None = None
+
+    def speaker_icon(self, music_on: bool, icon_size: int) -> pygame.Surface | None:
+        """Get the speaker icon at a given size, loading and scaling it once.
+
+        The icon size only depends on the window width, so the sprite is
+        rescaled only when the window is resized.
+
+        Args:
+            music_on: Whether background music is currently enabled
+            icon_size: Width and height of the icon in pixels
+
+        Returns:
+            pygame.Surface or None: Scaled icon, or None if it could not be loaded
+        """
+        key = (music_on, icon_size)
+        if key not in self._speaker_icons:
+            # sizes from an old window will not be requested again
+            self._speaker_icons = {
+                k: v for k, v in self._speaker_icons.items() if k[1] == icon_size
+            }
+            try:
+                sprite = load_sprite(_SPEAKER_SPRITE_PATHS[music_on])
+                icon = to_display_format(
+                    pygame.transform.scale(sprite, (icon_size, icon_size))
+                )
+            except Exception:
+                icon = None
+            self._speaker_icons[key] = icon
+        return self._speaker_icons[key]
+
+    def score_label(
+        self, score: int, surface_width: int, top_margin: int, color: tuple
+    ) -> tuple[pygame.Surface, pygame.Rect]:
+        """Get the score label and its rect, laid out again only on change.
+
+        Args:
+            score: Current score
+            surface_width: Width of the surface
+            top_margin: Distance of the label from the top edge
+            color: Label color
+
+        Returns:
+            Tuple of (label, rect) horizontally centered near the top
+        """
+        key = (score, surface_width, top_margin, color)
+        if key != self._score_key:
+            # render score text in a large font, translucent (~25% opaque)
+            label = render_text(str(score), int(surface_width / 8), color, alpha=64)
+            rect = label.get_rect()
+            rect.midtop = (surface_width // 2, top_margin)
+            self._score_blit = (label, rect)
+            self._score_key = key
+        return self._score_blit
+
+    def speed_bar(
+        self,
+        bar_width: int,
+        bar_height: int,
+        filled_width: int,
+        bar_color: tuple,
+        border_color: tuple,
+    ) -> pygame.Surface:
+        """Get the speed bar surface, redrawn only when its size or fill changes.
+
+        Args:
+            bar_width: Width of the bar in pixels
+            bar_height: Height of the bar in pixels
+            filled_width: Width of the filled portion in pixels
+            bar_color: Color of the filled portion
+            border_color: Color of the empty portion
+
+        Returns:
+            pygame.Surface: Bar surface in the display format
+        """
+        key = (bar_width, bar_height, filled_width, bar_color, border_color)
+        if key != self._speed_bar_key:
+            bar_surface = to_display_format(
+                pygame.Surface((bar_width, bar_height)), alpha=False
+            )
+            bar_surface.fill(border_color)
+
+            # draw filled portion
+            if filled_width > 0:
+                filled_rect = pygame.Rect(0, 0, filled_width, bar_height)
+                pygame.draw.rect(bar_surface, bar_color, filled_rect)
+
+            self._speed_bar = bar_surface
+            self._speed_bar_key = key
+        return self._speed_bar
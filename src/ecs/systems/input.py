@@ -29,6 +29,7 @@ import pygame
 
 from ecs.systems.base_system import BaseSystem
 from ecs.world import World
+from game.constants import DIRECTION_KEYS
 
 
 class InputSystem(BaseSystem):
@@ -105,18 +106,12 @@ class InputSystem(BaseSystem):
             self._handle_settings_menu_input(world, key)
             return
 
-        # get current direction for 180° turn prevention
-        current_dx, current_dy = self._get_current_direction(world)
-
         # movement keys - modify velocity directly with 180° turn prevention
-        if key in (pygame.K_DOWN, pygame.K_s):
-            self._set_direction(world, 0, 1, current_dx, current_dy)
-        elif key in (pygame.K_UP, pygame.K_w):
-            self._set_direction(world, 0, -1, current_dx, current_dy)
-        elif key in (pygame.K_RIGHT, pygame.K_d):
-            self._set_direction(world, 1, 0, current_dx, current_dy)
-        elif key in (pygame.K_LEFT, pygame.K_a):
-            self._set_direction(world, -1, 0, current_dx, current_dy)
+        direction = DIRECTION_KEYS.get(key)
+        if direction is not None:
+            # get current direction for 180° turn prevention
+            current_dx, current_dy = self._get_current_direction(world)
+            self._set_direction(world, *direction, current_dx, current_dy)
         # control keys
         elif key == pygame.K_q:
             self._handle_quit(world)
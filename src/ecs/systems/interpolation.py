@@ -76,32 +76,26 @@ class InterpolationSystem(BaseSystem):
             EntityType.SNAKE, "position", "interpolation", "velocity"
         )
 
-        for _, snake in snakes.items():
+        for snake in snakes.values():
             # get snake speed from velocity component (cells per second)
             # default to 12 if no velocity component or speed field
-            if hasattr(snake, "velocity") and hasattr(snake.velocity, "speed"):
-                speed = snake.velocity.speed
-            else:
-                speed = 12.0
-
-            # calculate move interval: time to move one grid cell
-            # old code: move_interval_ms = 1000.0 / snake.speed
-            move_interval_ms = 1000.0 / speed
+            velocity = getattr(snake, "velocity", None)
+            speed = getattr(velocity, "speed", 12.0)
 
             # increment alpha based on delta time (like old code)
-            # old code: snake.move_progress += dt / move_interval_ms
-            increment = dt_ms / move_interval_ms
+            # old code: snake.move_progress += dt / (1000.0 / snake.speed),
+            # folded into one multiplication
+            increment = dt_ms * speed * 0.001
 
-            snake.interpolation.alpha = min(1.0, snake.interpolation.alpha + increment)
+            interpolation = snake.interpolation
+            interpolation.alpha = min(1.0, interpolation.alpha + increment)
 
             # detect edge wrapping for special rendering
-            if hasattr(snake, "position"):
-                pos = snake.position
-                # check if movement wrapped around edges
-                wrapped_x = self._detect_wrapping(
-                    world, pos.prev_x, pos.prev_y, pos.x, pos.y
-                )
-                snake.interpolation.wrapped_axis = wrapped_x
+            pos = snake.position
+            # check if movement wrapped around edges
+            interpolation.wrapped_axis = self._detect_wrapping(
+                world, pos.prev_x, pos.prev_y, pos.x, pos.y
+            )
 
     def update_interpolation(
         self,
@@ -262,11 +256,9 @@ class InterpolationSystem(BaseSystem):
         board = world.board
         grid_size = board.cell_size
 
-        # check X axis wrapping
-        x_wraps = self._will_wrap_around(current_x, target_x, board.width, grid_size)
-
-        # check Y axis wrapping
-        y_wraps = self._will_wrap_around(current_y, target_y, board.height, grid_size)
+        # same test as _will_wrap_around, inlined since it runs every frame
+        x_wraps = abs(abs(current_x - target_x) - board.width) <= grid_size
+        y_wraps = abs(abs(current_y - target_y) - board.height) <= grid_size
 
         # return combined result
         if x_wraps and y_wraps:
@@ -21,6 +21,7 @@
 
 from __future__ import annotations
 
+from collections import deque
 from typing import Optional, Callable
 
 from ecs.systems.base_system import BaseSystem
@@ -31,11 +32,37 @@ from ecs.components.velocity import Velocity
 from ecs.components.snake_body import SnakeBody
 
 
+def _occupy(occupied: dict[tuple[int, int], int], cell: tuple[int, int]) -> None:
+    """Register one more segment on a cell of the occupancy map."""
+    occupied[cell] = occupied.get(cell, 0) + 1
+
+
+def _vacate(occupied: dict[tuple[int, int], int], cell: tuple[int, int]) -> None:
+    """Release one segment from a cell of the occupancy map."""
+    count = occupied.get(cell, 0)
+    if count > 1:
+        occupied[cell] = count - 1
+    else:
+        occupied.pop(cell, None)
+
+
+def _adopt_segments(body: SnakeBody) -> None:
+    """Store the segments in a deque and fill the occupancy map from them.
+
+    Bodies built from a plain segment list (or without an occupancy map)
+    are brought in line before their first move.
+    """
+    body.segments = deque(body.segments)
+    body.occupied.clear()
+    for seg in body.segments:
+        _occupy(body.occupied, (seg.x, seg.y))
+
+
 class MovementSystem(BaseSystem):
     """Update entity positions based on velocity and grid rules.
 
     Reads: Position, Velocity, SnakeBody, Board (size)
-    Writes: Position, SnakeBody.segments
+    Writes: Position, SnakeBody.segments, SnakeBody.occupied
 
     """
 
@@ -79,12 +106,12 @@ class MovementSystem(BaseSystem):
         # Reset accumulated time for next movement
         self._accumulated_time = 0.0
 
-        registry = world.registry
-        board = world.board
-
-        # Getting all snake entities in a dictionary
-        snakes = registry.query_by_type_and_components(
-            EntityType.SNAKE, "position", "velocity", "body"
+        # the snake query above is reused; bind per-move values once
+        board_width = world.board.width
+        board_height = world.board.height
+        # If electric walls are enabled, collision system will handle out-of-bounds
+        electric_walls = (
+            self._get_electric_walls() if self._get_electric_walls else False
         )
 
         # Updating each entity
@@ -105,48 +132,50 @@ class MovementSystem(BaseSystem):
             position.prev_x = position.x
             position.prev_y = position.y
 
-            # Update all segment positions to follow the one ahead
-            # Work backwards to avoid overwriting positions we still need
-            # This creates the "caterpillar" following effect
-
-            # Save the old positions before shifting
-            if body.segments:
-                # Shift all segments backward (each takes the position ahead)
-                for i in range(len(body.segments) - 1, 0, -1):
-                    # Save where this segment currently is (for prev)
-                    old_x = body.segments[i].x
-                    old_y = body.segments[i].y
-
-                    # Move this segment to where the segment ahead is
-                    body.segments[i].x = body.segments[i - 1].x
-                    body.segments[i].y = body.segments[i - 1].y
-
-                    # Set prev to where it was before moving
-                    body.segments[i].prev_x = old_x
-                    body.segments[i].prev_y = old_y
-
-                # First segment follows the head
-                old_x = body.segments[0].x
-                old_y = body.segments[0].y
-                body.segments[0].x = position.x  # Head's OLD position
-                body.segments[0].y = position.y
-                body.segments[0].prev_x = old_x
-                body.segments[0].prev_y = old_y
+            # bodies built outside the prefab get their deque and map here
+            if not isinstance(body.segments, deque) or (
+                body.segments and not body.occupied
+            ):
+                _adopt_segments(body)
+
+            # Advance the tail like a ring buffer: the last segment is
+            # recycled as the new first one (the head's old cell), so the
+            # segments in between keep their coordinates untouched.
+            # Each segment's prev already equals the cell of the segment
+            # behind it, so interpolation stays correct without a shift.
+            occupied = body.occupied
+            segments = body.segments
+            if segments:
+                first = segments[0]
+                first_x, first_y = first.x, first.y
+                moved = segments.pop()
+                # the last cell is vacated and the old head cell is taken
+                vacated = (moved.x, moved.y)
+                moved.x = position.x  # Head's OLD position
+                moved.y = position.y
+                moved.prev_x = first_x
+                moved.prev_y = first_y
+                segments.appendleft(moved)
+
+                _occupy(occupied, (position.x, position.y))
+                _vacate(occupied, vacated)
 
             # Maintain correct number of segments based on body size
             desired_tail_len = max(0, body.size - 1)
 
             # Add or remove segments as needed
-            if len(body.segments) > desired_tail_len:
+            if len(segments) > desired_tail_len:
                 # Snake shrunk - remove excess segments from the end
-                body.segments = body.segments[:desired_tail_len]
-            elif len(body.segments) < desired_tail_len:
+                while len(segments) > desired_tail_len:
+                    seg = segments.pop()
+                    _vacate(occupied, (seg.x, seg.y))
+            elif len(segments) < desired_tail_len:
                 # Snake grew - add new segments at the end
-                if body.segments:
+                if segments:
                     # Add segments at the last segment's PREVIOUS position
                     # This allows them to interpolate smoothly as they follow the tail
-                    last_segment = body.segments[-1]
-                    for _ in range(desired_tail_len - len(body.segments)):
+                    last_segment = segments[-1]
+                    for _ in range(desired_tail_len - len(segments)):
                         # New segment starts at last segment's previous position
                         # and will interpolate to the last segment's current position
                         new_seg = Position(
@@ -155,7 +184,8 @@ class MovementSystem(BaseSystem):
                             prev_x=last_segment.prev_x,  # No interpolation on first frame
                             prev_y=last_segment.prev_y,
                         )
-                        body.segments.append(new_seg)
+                        segments.append(new_seg)
+                        _occupy(occupied, (new_seg.x, new_seg.y))
                         # Update reference for next segment (if adding multiple)
                         last_segment = new_seg
                 else:
@@ -166,23 +196,19 @@ class MovementSystem(BaseSystem):
                         prev_x=position.x,
                         prev_y=position.y,
                     )
-                    body.segments.append(new_seg)
+                    segments.append(new_seg)
+                    _occupy(occupied, (new_seg.x, new_seg.y))
 
             # Move head by exactly one grid cell in velocity direction
             # Only wrap around if electric walls are disabled
-            # If electric walls are enabled, collision system will handle out-of-bounds
-            electric_walls = (
-                self._get_electric_walls() if self._get_electric_walls else False
-            )
-
             if electric_walls:
                 # Electric walls mode: don't wrap, let collision system detect wall hit
                 new_x = position.x + velocity.dx
                 new_y = position.y + velocity.dy
             else:
                 # Wrapping mode: wrap around board edges
-                new_x = (position.x + velocity.dx) % board.width
-                new_y = (position.y + velocity.dy) % board.height
+                new_x = (position.x + velocity.dx) % board_width
+                new_y = (position.y + velocity.dy) % board_height
 
             position.x = new_x
             position.y = new_y
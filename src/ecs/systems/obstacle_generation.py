@@ -33,6 +33,7 @@ from typing import Optional
 
 from ecs.systems.base_system import BaseSystem
 from ecs.world import World
+from ecs.board import Tile
 from ecs.entities.obstacle_field import Obstacle as ObstacleEntity
 from ecs.components.position import Position
 from ecs.components.obstacle import ObstacleTag
@@ -47,7 +48,7 @@ class ObstacleGenerationSystem(BaseSystem):
     """System for generating obstacles with connectivity and trap guarantees.
 
     Reads: Position (snake), Board (dimensions)
-    Writes: New entities (Obstacle)
+    Writes: New entities (Obstacle), Board (obstacle tiles)
     Queries: entities with Position (to determine safe zone)
 
     Responsibilities:
@@ -150,6 +151,8 @@ class ObstacleGenerationSystem(BaseSystem):
         # cleanup failed attempt
         for obstacle_id in obstacle_ids:
             world.registry.remove(obstacle_id)
+        for x, y in obstacle_positions:
+            board.set_tile(x, y, Tile.EMPTY)
         return None
 
     def generate_obstacles_by_difficulty(
@@ -191,14 +194,15 @@ class ObstacleGenerationSystem(BaseSystem):
         """Check if placing obstacle would create a trap (3+ blocked sides)."""
         new_x, new_y = new_pos
 
+        # cells blocked once the new obstacle is placed, built once per candidate
+        blocked = existing_positions | {new_pos}
+
         # check each neighbor of the new obstacle
         for dx, dy in GRID_DIRECTIONS:
-            neighbor = (new_x + dx * grid_size, new_y + dy * grid_size)
+            nx, ny = new_x + dx * grid_size, new_y + dy * grid_size
 
             # skip if neighbor already blocked
-            if self._is_blocked(
-                neighbor[0], neighbor[1], (0, 0), existing_positions, board, grid_size
-            ):
+            if self._is_blocked(nx, ny, existing_positions, board):
                 continue
 
             # count how many sides of this free neighbor would be blocked
@@ -206,12 +210,7 @@ class ObstacleGenerationSystem(BaseSystem):
                 1
                 for ndx, ndy in GRID_DIRECTIONS
                 if self._is_blocked(
-                    neighbor[0] + ndx * grid_size,
-                    neighbor[1] + ndy * grid_size,
-                    new_pos,
-                    existing_positions,
-                    board,
-                    grid_size,
+                    nx + ndx * grid_size, ny + ndy * grid_size, blocked, board
                 )
             )
 
@@ -220,21 +219,11 @@ class ObstacleGenerationSystem(BaseSystem):
 
         return False
 
-    def _is_blocked(
-        self,
-        x: int,
-        y: int,
-        new_pos: tuple[int, int],
-        existing_positions: set[tuple[int, int]],
-        board,
-        grid_size: int,
-    ) -> bool:
-        """Check if position is blocked (out of bounds, new obstacle, or existing obstacle)."""
-        return (
-            not (0 <= x < board.width and 0 <= y < board.height)
-            or (x, y) == new_pos
-            or (x, y) in existing_positions
-        )
+    @staticmethod
+    def _is_blocked(x: int, y: int, blocked: set[tuple[int, int]], board) -> bool:
+        """Check if position is out of bounds or in the blocked set."""
+        in_bounds = 0 <= x < board.width and 0 <= y < board.height
+        return not in_bounds or (x, y) in blocked
 
     def _is_grid_connected(
         self,
@@ -269,6 +258,11 @@ class ObstacleGenerationSystem(BaseSystem):
         return len(visited) == expected_free
 
     def _create_obstacle_entity(self, world: World, x: int, y: int) -> int:
-        """Create obstacle entity at specified position."""
+        """Create obstacle entity at specified position.
+
+        The cell is also marked as Tile.OBSTACLE, the board's obstacle index
+        used by collision detection.
+        """
         obstacle = ObstacleEntity(position=Position(x=x, y=y), tag=ObstacleTag())
+        world.board.set_tile(x, y, Tile.OBSTACLE)
         return world.registry.add(obstacle)
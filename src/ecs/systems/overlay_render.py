@@ -27,9 +27,17 @@ import pygame
 from ecs.systems.base_system import BaseSystem
 from ecs.world import World
 from core.rendering.pygame_surface_renderer import RenderEnqueue
+from core.rendering.sprites import to_display_format
+from core.rendering.text_cache import render_text
 from core.types.color import Color
 from game import constants
 
+# overlay colors resolved once at import instead of parsing hex every frame
+_ARENA_COLOR = Color.from_hex(constants.ARENA_COLOR).to_tuple()
+_SCORE_COLOR = Color.from_hex(constants.SCORE_COLOR).to_tuple()
+_MESSAGE_COLOR = Color.from_hex(constants.MESSAGE_COLOR).to_tuple()
+_GRID_COLOR = Color.from_hex(constants.GRID_COLOR).to_tuple()
+
 
 class OverlayRenderSystem(BaseSystem):
     """System responsible for rendering game overlays.
@@ -54,6 +62,36 @@ class OverlayRenderSystem(BaseSystem):
         self._renderer = renderer
         self._settings = settings
         self._config = config
+        # dimmed backgrounds keyed by (width, height, alpha)
+        self._overlays: dict[tuple[int, int, int], pygame.Surface] = {}
+
+    def _get_overlay(self, width: int, height: int, alpha: int) -> pygame.Surface:
+        """Get a semi-transparent arena-colored overlay, building it once.
+
+        Overlays are only rebuilt when the window size changes, so paused
+        frames reuse the same surface instead of allocating and filling a
+        full-window one every frame.
+
+        Args:
+            width: Overlay width in pixels
+            height: Overlay height in pixels
+            alpha: Surface alpha (0 transparent, 255 opaque)
+
+        Returns:
+            pygame.Surface: Shared overlay surface (do not modify)
+        """
+        key = (width, height, alpha)
+        overlay = self._overlays.get(key)
+        if overlay is None:
+            # sizes from an old window will not be requested again
+            self._overlays = {
+                k: v for k, v in self._overlays.items() if k[:2] == (width, height)
+            }
+            overlay = to_display_format(pygame.Surface((width, height)), alpha=False)
+            overlay.fill(_ARENA_COLOR)
+            overlay.set_alpha(alpha)
+            self._overlays[key] = overlay
+        return overlay
 
     def draw_pause_overlay(self, surface_width: int, surface_height: int) -> None:
         """Draw pause overlay with semi-transparent background and text.
@@ -63,24 +101,14 @@ class OverlayRenderSystem(BaseSystem):
             surface_height: Height of the surface
         """
         try:
-            # create semi-transparent overlay
-            overlay = pygame.Surface((surface_width, surface_height))
-            overlay.set_alpha(128)  # 50% transparent
-            overlay.fill(Color.from_hex(constants.ARENA_COLOR).to_tuple())
+            # semi-transparent overlay, 50% transparent
+            overlay = self._get_overlay(surface_width, surface_height, 128)
             self._renderer.blit(overlay, (0, 0))
 
             # render "PAUSED" text
             font_size = int(surface_width / 10)
-            font_path = "assets/font/GetVoIP-Grotesque.ttf"
-
-            try:
-                pause_font = pygame.font.Font(font_path, font_size)
-            except Exception:
-                pause_font = pygame.font.Font(None, font_size)
 
-            pause_text = pause_font.render(
-                "PAUSED", True, Color.from_hex(constants.SCORE_COLOR).to_tuple()
-            )
+            pause_text = render_text("PAUSED", font_size, _SCORE_COLOR)
             pause_rect = pause_text.get_rect()
             pause_rect.center = (surface_width // 2, surface_height // 2)
 
@@ -89,15 +117,10 @@ class OverlayRenderSystem(BaseSystem):
 
             # render hint text below
             hint_font_size = int(surface_width / 30)
-            try:
-                hint_font = pygame.font.Font(font_path, hint_font_size)
-            except Exception:
-                hint_font = pygame.font.Font(None, hint_font_size)
-
-            hint_text = hint_font.render(
+            hint_text = render_text(
                 "Press P to resume or ESC/M for settings",
-                True,
-                Color.from_hex(constants.MESSAGE_COLOR).to_tuple(),
+                hint_font_size,
+                _MESSAGE_COLOR,
             )
             hint_rect = hint_text.get_rect()
             hint_rect.midtop = (surface_width // 2, pause_rect.bottom + 20)
@@ -126,10 +149,8 @@ class OverlayRenderSystem(BaseSystem):
             return
 
         try:
-            # create semi-transparent overlay
-            overlay = pygame.Surface((surface_width, surface_height))
-            overlay.set_alpha(200)  # more opaque than pause
-            overlay.fill(Color.from_hex(constants.ARENA_COLOR).to_tuple())
+            # semi-transparent overlay, more opaque than pause
+            overlay = self._get_overlay(surface_width, surface_height, 200)
             self._renderer.blit(overlay, (0, 0))
 
             # draw title
@@ -147,15 +168,11 @@ class OverlayRenderSystem(BaseSystem):
 
     def _draw_settings_title(self, surface_width: int, surface_height: int) -> None:
         """Draw settings menu title."""
-        font_path = "assets/font/GetVoIP-Grotesque.ttf"
         title_font_size = int(surface_width / 12)
-        try:
-            title_font = pygame.font.Font(font_path, title_font_size)
-        except Exception:
-            title_font = pygame.font.Font(None, title_font_size)
-
-        title_text = title_font.render(
-            "Settings", True, Color.from_hex(constants.MESSAGE_COLOR).to_tuple()
+        title_text = render_text(
+            "Settings",
+            title_font_size,
+            _MESSAGE_COLOR,
         )
         title_rect = title_text.get_rect(
             center=(surface_width / 2, surface_height / 10)
@@ -166,8 +183,6 @@ class OverlayRenderSystem(BaseSystem):
         self, surface_width: int, surface_height: int, selected_index: int
     ) -> None:
         """Draw individual settings items."""
-        font_path = "assets/font/GetVoIP-Grotesque.ttf"
-
         # spacing and scroll parameters
         row_h = int(surface_height * 0.06)
         visible_rows = int(surface_height * 0.70 // row_h)
@@ -179,10 +194,6 @@ class OverlayRenderSystem(BaseSystem):
         return_to_menu_index = len(menu_fields)
 
         item_font_size = int(surface_width / 30)
-        try:
-            item_font = pygame.font.Font(font_path, item_font_size)
-        except Exception:
-            item_font = pygame.font.Font(None, item_font_size)
 
         # draw settings items
         for draw_i, field_i in enumerate(range(top_index, len(menu_fields))):
@@ -205,12 +216,10 @@ class OverlayRenderSystem(BaseSystem):
             )
 
             # render text with highlighting for selected item
-            text_color = (
-                Color.from_hex(constants.SCORE_COLOR).to_tuple()
-                if field_i == selected_index
-                else Color.from_hex(constants.MESSAGE_COLOR).to_tuple()
+            text_color = _SCORE_COLOR if field_i == selected_index else _MESSAGE_COLOR
+            text = render_text(
+                f"{f['label']}: {formatted_val}", item_font_size, text_color
             )
-            text = item_font.render(f"{f['label']}: {formatted_val}", True, text_color)
             rect = text.get_rect()
             rect.left = int(surface_width * 0.10)
             rect.top = padding_y + draw_i * row_h
@@ -220,13 +229,13 @@ class OverlayRenderSystem(BaseSystem):
         return_draw_i = len(menu_fields) - top_index
         if 0 <= return_draw_i < visible_rows:
             text_color = (
-                Color.from_hex(constants.SCORE_COLOR).to_tuple()
+                _SCORE_COLOR
                 if selected_index == return_to_menu_index
-                else Color.from_hex(constants.MESSAGE_COLOR).to_tuple()
+                else _MESSAGE_COLOR
             )
             separator_top = padding_y + return_draw_i * row_h
             # add some spacing before the option
-            return_text = item_font.render("Return to Main Menu", True, text_color)
+            return_text = render_text("Return to Main Menu", item_font_size, text_color)
             rect = return_text.get_rect()
             rect.left = int(surface_width * 0.10)
             rect.top = separator_top + int(row_h * 0.5)  # add spacing
@@ -234,17 +243,9 @@ class OverlayRenderSystem(BaseSystem):
 
     def _draw_settings_hint(self, surface_width: int, surface_height: int) -> None:
         """Draw settings menu hint footer."""
-        font_path = "assets/font/GetVoIP-Grotesque.ttf"
         hint_text = "[A/D] change   [W/S] navigate   [Enter] select   [Esc] back   [C] random colors"
         hint_font_size = int(surface_width / 50)
-        try:
-            hint_font = pygame.font.Font(font_path, hint_font_size)
-        except Exception:
-            hint_font = pygame.font.Font(None, hint_font_size)
-
-        hint_surf = hint_font.render(
-            hint_text, True, Color.from_hex(constants.GRID_COLOR).to_tuple()
-        )
+        hint_surf = render_text(hint_text, hint_font_size, _GRID_COLOR)
         hint_rect = hint_surf.get_rect(
             center=(surface_width / 2, surface_height * 0.95)
         )
@@ -25,9 +25,11 @@ and entities in real-time during gameplay.
 
 from typing import Any, Optional
 import pygame
+from ecs.board import Board, Tile
 from ecs.systems.base_system import BaseSystem
 from ecs.world import World
 from ecs.entities.entity import EntityType
+from core.rendering.sprites import clear_sprite_cache
 
 
 class SettingsApplySystem(BaseSystem):
@@ -158,12 +160,17 @@ class SettingsApplySystem(BaseSystem):
         new_height_cells = new_height_pixels // new_cell_size
 
         # create a new board with the new dimensions
-        from ecs.board import Board
-
         new_board = Board(
             width=new_width_cells, height=new_height_cells, cell_size=new_cell_size
         )
 
+        # carry the obstacle tiles that still fit over to the new board
+        obstacles = world.registry.query_by_type(EntityType.OBSTACLE)
+        for obstacle in obstacles.values():
+            x, y = obstacle.position.x, obstacle.position.y
+            if 0 <= x < new_width_cells and 0 <= y < new_height_cells:
+                new_board.set_tile(x, y, Tile.OBSTACLE)
+
         # replace the board in the world
         world.board = new_board
 
@@ -173,6 +180,7 @@ class SettingsApplySystem(BaseSystem):
             current_w, current_h = current_surface.get_size()
             if current_w != new_width_pixels or current_h != new_height_pixels:
                 pygame.display.set_mode((new_width_pixels, new_height_pixels))
+                clear_sprite_cache()
 
                 # reload fonts with new dimensions if assets available
                 if self._assets:
@@ -323,10 +331,13 @@ class SettingsApplySystem(BaseSystem):
             world: ECS world instance
             new_difficulty: New difficulty level string
         """
-        # remove all existing obstacles
+        # remove all existing obstacles and their board tiles
+        board = world.board
         obstacles = world.registry.query_by_type(EntityType.OBSTACLE)
-        obstacle_ids = list(obstacles.keys())
-        for obstacle_id in obstacle_ids:
+        for obstacle_id, obstacle in obstacles.items():
+            x, y = obstacle.position.x, obstacle.position.y
+            if 0 <= x < board.width and 0 <= y < board.height:
+                board.set_tile(x, y, Tile.EMPTY)
             world.registry.remove(obstacle_id)
 
         # generate new obstacles if difficulty is not "None"
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+#
+#   Copyright (c) 2023, Monaco F. J. <monaco@usp.br>
+#
+#   This file is part of Naja.
+#
+#   Naja is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Pixel layout of interpolated snake cells.
+
+SnakeRenderSystem places the head and every tail segment through these
+helpers, so the interpolation and edge wrapping math lives in one place.
+"""
+
+from typing import Iterable
+
+from ecs.components.position import Position
+
+
+def quantize_alpha(alpha: float, cell_size: int) -> float:
+    """Snap an interpolation factor to whole-pixel steps of a cell.
+
+    Frames whose progress differs by less than a pixel then draw exactly
+    the same positions and can reuse the previous frame's work.
+
+    Args:
+        alpha: Interpolation factor [0.0, 1.0]
+        cell_size: Size of grid cells
+
+    Returns:
+        float: Factor rounded down to a whole number of pixels
+    """
+    return int(alpha * cell_size) / cell_size
+
+
+def linear_destinations(
+    positions: Iterable[Position],
+    step: int,
+    cell_size: int,
+    grid_width: int,
+    grid_height: int,
+) -> list[tuple[int, int]]:
+    """Get the pixel positions of cells for a frame where nothing wrapped.
+
+    The interpolation factor is quantized to whole pixels, so each cell
+    moves by an integer number of pixels and its position is computed
+    with integer math only.
+
+    Args:
+        positions: Positions in grid coordinates
+        step: Pixels travelled so far in the current cell (alpha * cell_size)
+        cell_size: Size of grid cells
+        grid_width: Total grid width in pixels
+        grid_height: Total grid height in pixels
+
+    Returns:
+        List of (x, y) pixel positions, one per cell
+    """
+    return [
+        (
+            (position.prev_x * cell_size + (position.x - position.prev_x) * step)
+            % grid_width,
+            (position.prev_y * cell_size + (position.y - position.prev_y) * step)
+            % grid_height,
+        )
+        for position in positions
+    ]
+
+
+def wrapped_destinations(
+    positions: Iterable[Position],
+    alpha: float,
+    wrap_x: bool,
+    wrap_y: bool,
+    cell_size: int,
+    grid_width: int,
+    grid_height: int,
+) -> list[tuple[int, int]]:
+    """Get the pixel positions of cells for a frame where the head wrapped.
+
+    Cells that jumped across an edge keep moving in the same direction,
+    and cells near a wrapped edge get a duplicate on the opposite edge
+    for the portal effect.
+
+    Args:
+        positions: Positions in grid coordinates
+        alpha: Quantized interpolation factor [0.0, 1.0]
+        wrap_x: Whether the x axis wrapped
+        wrap_y: Whether the y axis wrapped
+        cell_size: Size of grid cells
+        grid_width: Total grid width in pixels
+        grid_height: Total grid height in pixels
+
+    Returns:
+        List of (x, y) pixel positions, each cell followed by its duplicate
+    """
+    half_width = grid_width / 2
+    half_height = grid_height / 2
+    step = alpha * cell_size
+    right_edge = grid_width - cell_size
+    bottom_edge = grid_height - cell_size
+    destinations = []
+    append = destinations.append
+
+    for position in positions:
+        current_x = position.x * cell_size
+        current_y = position.y * cell_size
+        prev_x = position.prev_x * cell_size
+        prev_y = position.prev_y * cell_size
+
+        # cells that jumped across an edge keep moving the same way
+        if wrap_x and abs(current_x - prev_x) > half_width:
+            draw_x = prev_x + step if current_x < prev_x else prev_x - step
+        else:
+            draw_x = prev_x + (current_x - prev_x) * alpha
+        if wrap_y and abs(current_y - prev_y) > half_height:
+            draw_y = prev_y + step if current_y < prev_y else prev_y - step
+        else:
+            draw_y = prev_y + (current_y - prev_y) * alpha
+        draw_x %= grid_width
+        draw_y %= grid_height
+        append((int(draw_x), int(draw_y)))
+
+        # duplicate on the opposite edge for the portal effect
+        dup_x = draw_x
+        dup_y = draw_y
+        if wrap_x:
+            if draw_x >= right_edge:
+                dup_x = draw_x - grid_width
+            elif draw_x < cell_size:
+                dup_x = draw_x + grid_width
+        if wrap_y:
+            if draw_y >= bottom_edge:
+                dup_y = draw_y - grid_height
+            elif draw_y < cell_size:
+                dup_y = draw_y + grid_height
+        if dup_x != draw_x or dup_y != draw_y:
+            append((int(dup_x), int(dup_y)))
+
+    return destinations
+
+
+def cell_destinations(
+    positions: Iterable[Position],
+    alpha: float,
+    wrapped_axis: str,
+    cell_size: int,
+    grid_width: int,
+    grid_height: int,
+) -> list[tuple[int, int]]:
+    """Get the pixel positions of interpolated cells for the current frame.
+
+    Args:
+        positions: Positions in grid coordinates
+        alpha: Quantized interpolation factor [0.0, 1.0]
+        wrapped_axis: Which axis wrapped ("none", "x", "y", "both")
+        cell_size: Size of grid cells
+        grid_width: Total grid width in pixels
+        grid_height: Total grid height in pixels
+
+    Returns:
+        List of (x, y) pixel positions, wraparound duplicates included
+    """
+    if wrapped_axis == "none":
+        # common case: plain linear interpolation in whole pixels
+        return linear_destinations(
+            positions, round(alpha * cell_size), cell_size, grid_width, grid_height
+        )
+    return wrapped_destinations(
+        positions,
+        alpha,
+        wrapped_axis in ("x", "both"),
+        wrapped_axis in ("y", "both"),
+        cell_size,
+        grid_width,
+        grid_height,
+    )
@@ -25,6 +25,7 @@ snake rendering with smooth interpolation effects.
 
 import pygame
 from ecs.systems.base_system import BaseSystem
+from ecs.systems.snake_layout import cell_destinations, quantize_alpha
 from ecs.world import World
 from ecs.entities.entity import EntityType
 from ecs.components.position import Position
@@ -32,10 +33,16 @@ from ecs.components.snake_body import SnakeBody
 from ecs.components.interpolation import Interpolation
 from ecs.components.color_scheme import ColorScheme
 from core.rendering.pygame_surface_renderer import RenderEnqueue
+from core.rendering.sprites import to_display_format
 from core.types.color import Color
 from game import constants
 
 
+# fallback colors resolved once at import instead of parsing hex every frame
+_DEFAULT_HEAD_COLOR = Color.from_hex(constants.HEAD_COLOR).to_tuple()
+_DEFAULT_TAIL_COLOR = Color.from_hex(constants.TAIL_COLOR).to_tuple()
+
+
 class SnakeRenderSystem(BaseSystem):
     """System responsible for rendering snake entities with smooth interpolation.
 
@@ -47,6 +54,11 @@ class SnakeRenderSystem(BaseSystem):
 
     This system queries entities by components (Position, SnakeBody, Interpolation)
     rather than by entity type, following ECS data-driven principles.
+
+    Tail segments all share one color and size, so they are drawn as a
+    single batch of blits of a cached tile instead of one rect per segment.
+    Interpolation is quantized to whole pixels, and the tail batch is reused
+    as long as the snake has not moved by a pixel since the last frame.
     """
 
     def __init__(self, renderer: RenderEnqueue):
@@ -56,6 +68,27 @@ class SnakeRenderSystem(BaseSystem):
             renderer: RenderEnqueue view to queue draw commands
         """
         self._renderer = renderer
+        self._tiles: dict[tuple[tuple[int, ...], int], pygame.Surface] = {}
+        # (body, key, batch) of the last tail drawn
+        self._tail_cache: tuple | None = None
+
+    def _get_tile(self, color: tuple[int, ...], size: int) -> pygame.Surface:
+        """Get a cell-sized tile filled with a color, building it once.
+
+        Args:
+            color: Fill color tuple
+            size: Width and height in pixels
+
+        Returns:
+            pygame.Surface: Filled tile surface
+        """
+        key = (color, size)
+        tile = self._tiles.get(key)
+        if tile is None:
+            tile = to_display_format(pygame.Surface((size, size)), alpha=False)
+            tile.fill(color)
+            self._tiles[key] = tile
+        return tile
 
     def _get_color_scheme(self, world: World) -> ColorScheme:
         """Get ColorScheme component from world entities.
@@ -94,9 +127,10 @@ class SnakeRenderSystem(BaseSystem):
         if not body.alive:
             return
 
-        cell_size = world.board.cell_size
-        grid_width = world.board.width * cell_size
-        grid_height = world.board.height * cell_size
+        board = world.board
+        cell_size = board.cell_size
+        grid_width = board.width * cell_size
+        grid_height = board.height * cell_size
 
         # Get colors from renderable or use constants as fallback
         if renderable and hasattr(renderable, "color"):
@@ -105,10 +139,10 @@ class SnakeRenderSystem(BaseSystem):
             if hasattr(renderable, "secondary_color") and renderable.secondary_color:
                 tail_color = renderable.secondary_color.to_tuple()
             else:
-                tail_color = Color.from_hex(constants.TAIL_COLOR).to_tuple()
+                tail_color = _DEFAULT_TAIL_COLOR
         else:
-            head_color = Color.from_hex(constants.HEAD_COLOR).to_tuple()
-            tail_color = Color.from_hex(constants.TAIL_COLOR).to_tuple()
+            head_color = _DEFAULT_HEAD_COLOR
+            tail_color = _DEFAULT_TAIL_COLOR
 
         # Draw tail segments with interpolation
         self._draw_snake_tail(
@@ -145,34 +179,18 @@ class SnakeRenderSystem(BaseSystem):
             grid_height: Total grid height in pixels
             color: Head color as (r, g, b) tuple
         """
-        # Calculate smooth interpolated position
-        draw_x, draw_y = self._calculate_interpolated_position(
-            position.x * cell_size,
-            position.y * cell_size,
-            position.prev_x * cell_size,
-            position.prev_y * cell_size,
-            interpolation.alpha,
+        # the head and its wraparound duplicate, laid out like the tail
+        destinations = cell_destinations(
+            (position,),
+            quantize_alpha(interpolation.alpha, cell_size),
             interpolation.wrapped_axis,
             cell_size,
             grid_width,
             grid_height,
         )
-
-        # Draw head rectangle at interpolated position
-        rect = pygame.Rect(int(draw_x), int(draw_y), cell_size, cell_size)
-        self._renderer.draw_rect(color, rect, 0)
-
-        # Draw wraparound duplicate for smooth portal effect
-        if interpolation.wrapped_axis != "none":
-            self._draw_wraparound_duplicate(
-                draw_x,
-                draw_y,
-                cell_size,
-                grid_width,
-                grid_height,
-                interpolation.wrapped_axis,
-                color,
-            )
+        for draw_x, draw_y in destinations:
+            # plain tuple rect at the interpolated position
+            self._renderer.draw_rect(color, (draw_x, draw_y, cell_size, cell_size), 0)
 
     def _draw_snake_tail(
         self,
@@ -195,136 +213,43 @@ class SnakeRenderSystem(BaseSystem):
             grid_height: Total grid height in pixels
             color: Tail color as (r, g, b) tuple
         """
-        if not body.segments:
+        segments = body.segments
+        if not segments:
             return
 
-        # Draw each tail segment with interpolation
-        for segment in body.segments:
-            draw_x, draw_y = self._calculate_interpolated_position(
-                segment.x * cell_size,
-                segment.y * cell_size,
-                segment.prev_x * cell_size,
-                segment.prev_y * cell_size,
-                interpolation.alpha,
-                interpolation.wrapped_axis,
-                cell_size,
-                grid_width,
-                grid_height,
-            )
+        alpha = quantize_alpha(interpolation.alpha, cell_size)
+        wrapped_axis = interpolation.wrapped_axis
+
+        # segments only change when the head moves, so the head cells, the
+        # tail length and the quantized progress identify the whole batch
+        key = (
+            len(segments),
+            head_position.x,
+            head_position.y,
+            head_position.prev_x,
+            head_position.prev_y,
+            alpha,
+            wrapped_axis,
+            cell_size,
+            grid_width,
+            grid_height,
+            color,
+        )
+        cached = self._tail_cache
+        if cached is not None and cached[0] is body and cached[1] == key:
+            self._renderer.blits(cached[2])
+            return
 
-            segment_rect = pygame.Rect(
-                int(draw_x),
-                int(draw_y),
-                cell_size,
-                cell_size,
+        tile = self._get_tile(color, cell_size)
+        batch = [
+            (tile, destination)
+            for destination in cell_destinations(
+                segments, alpha, wrapped_axis, cell_size, grid_width, grid_height
             )
-            self._renderer.draw_rect(color, segment_rect, 0)
-
-            # Draw wraparound duplicate
-            if interpolation.wrapped_axis != "none":
-                self._draw_wraparound_duplicate(
-                    draw_x,
-                    draw_y,
-                    cell_size,
-                    grid_width,
-                    grid_height,
-                    interpolation.wrapped_axis,
-                    color,
-                )
-
-    def _calculate_interpolated_position(
-        self,
-        current_x: int,
-        current_y: int,
-        prev_x: int,
-        prev_y: int,
-        alpha: float,
-        wrapped_axis: str,
-        cell_size: int,
-        grid_width: int,
-        grid_height: int,
-    ) -> tuple[float, float]:
-        """Calculate interpolated position with edge wrapping support.
-
-        Args:
-            current_x: Current x position
-            current_y: Current y position
-            prev_x: Previous x position
-            prev_y: Previous y position
-            alpha: Interpolation factor [0.0, 1.0]
-            wrapped_axis: Which axis wrapped ("none", "x", "y", "both")
-            cell_size: Size of grid cells
-            grid_width: Total grid width in pixels
-            grid_height: Total grid height in pixels
-
-        Returns:
-            Tuple of (interpolated_x, interpolated_y)
-        """
-        draw_x = prev_x + (current_x - prev_x) * alpha
-        draw_y = prev_y + (current_y - prev_y) * alpha
-
-        # Handle wrapping on x-axis
-        if wrapped_axis in ("x", "both"):
-            if abs(current_x - prev_x) > grid_width / 2:
-                if current_x < prev_x:
-                    draw_x = prev_x + alpha * cell_size
-                else:
-                    draw_x = prev_x - alpha * cell_size
-
-        # Handle wrapping on y-axis
-        if wrapped_axis in ("y", "both"):
-            if abs(current_y - prev_y) > grid_height / 2:
-                if current_y < prev_y:
-                    draw_y = prev_y + alpha * cell_size
-                else:
-                    draw_y = prev_y - alpha * cell_size
-
-        # Wrap coordinates to stay within grid bounds
-        draw_x = draw_x % grid_width
-        draw_y = draw_y % grid_height
-
-        return (draw_x, draw_y)
-
-    def _draw_wraparound_duplicate(
-        self,
-        draw_x: float,
-        draw_y: float,
-        cell_size: int,
-        grid_width: int,
-        grid_height: int,
-        wrapped_axis: str,
-        color: tuple,
-    ) -> None:
-        """Draw duplicate of segment on opposite edge for smooth wraparound.
+        ]
 
-        Args:
-            draw_x: Current X position
-            draw_y: Current Y position
-            cell_size: Size of grid cells
-            grid_width: Total grid width in pixels
-            grid_height: Total grid height in pixels
-            wrapped_axis: Which axis wrapped
-            color: Segment color
-        """
-        dup_x = draw_x
-        dup_y = draw_y
-
-        if wrapped_axis in ("x", "both"):
-            if draw_x >= grid_width - cell_size:
-                dup_x = draw_x - grid_width
-            elif draw_x < cell_size:
-                dup_x = draw_x + grid_width
-
-        if wrapped_axis in ("y", "both"):
-            if draw_y >= grid_height - cell_size:
-                dup_y = draw_y - grid_height
-            elif draw_y < cell_size:
-                dup_y = draw_y + grid_height
-
-        # Only draw duplicate if position actually changed
-        if dup_x != draw_x or dup_y != draw_y:
-            dup_rect = pygame.Rect(int(dup_x), int(dup_y), cell_size, cell_size)
-            self._renderer.draw_rect(color, dup_rect, 0)
+        self._tail_cache = (body, key, batch)
+        self._renderer.blits(batch)
 
     def update(self, world: World) -> None:
         """Update method required by BaseSystem.
@@ -30,6 +30,17 @@ from game.commands import (
     ToggleMusicCommand,
     RandomizePaletteCommand,
 )
+from game.constants import DIRECTION_KEYS
+
+# control keys mapped to the command they issue
+_ACTION_KEYS = {
+    pygame.K_q: QuitCommand,
+    pygame.K_p: PauseCommand,
+    pygame.K_m: OpenSettingsCommand,
+    pygame.K_ESCAPE: OpenSettingsCommand,
+    pygame.K_n: ToggleMusicCommand,
+    pygame.K_c: RandomizePaletteCommand,
+}
 
 
 class CommandConverter:
@@ -73,42 +84,19 @@ class CommandConverter:
 
         # Handle keyboard events
         if event.type == pygame.KEYDOWN:
-            key = event.key
-
             # Movement keys - check for 180° turn prevention
-            current_dx, current_dy = self._get_current_direction_safe()
-
-            if key in (pygame.K_DOWN, pygame.K_s):
-                if self._is_direction_valid(0, 1, current_dx, current_dy):
-                    commands.append(MoveCommand(dx=0, dy=1))
-
-            elif key in (pygame.K_UP, pygame.K_w):
-                if self._is_direction_valid(0, -1, current_dx, current_dy):
-                    commands.append(MoveCommand(dx=0, dy=-1))
-
-            elif key in (pygame.K_RIGHT, pygame.K_d):
-                if self._is_direction_valid(1, 0, current_dx, current_dy):
-                    commands.append(MoveCommand(dx=1, dy=0))
-
-            elif key in (pygame.K_LEFT, pygame.K_a):
-                if self._is_direction_valid(-1, 0, current_dx, current_dy):
-                    commands.append(MoveCommand(dx=-1, dy=0))
+            direction = DIRECTION_KEYS.get(event.key)
+            if direction is not None:
+                dx, dy = direction
+                current_dx, current_dy = self._get_current_direction_safe()
+                if self._is_direction_valid(dx, dy, current_dx, current_dy):
+                    commands.append(MoveCommand(dx=dx, dy=dy))
 
             # Control keys
-            elif key == pygame.K_q:
-                commands.append(QuitCommand())
-
-            elif key == pygame.K_p:
-                commands.append(PauseCommand())
-
-            elif key in (pygame.K_m, pygame.K_ESCAPE):
-                commands.append(OpenSettingsCommand())
-
-            elif key == pygame.K_n:
-                commands.append(ToggleMusicCommand())
-
-            elif key == pygame.K_c:
-                commands.append(RandomizePaletteCommand())
+            else:
+                command = _ACTION_KEYS.get(event.key)
+                if command is not None:
+                    commands.append(command())
 
         return commands
 
@@ -223,16 +223,16 @@ class SettingsApplicator:
 
             # Create multiple apples
             self._state.apples = []
+            apple_cells = set()  # cells already taken by an apple, O(1) lookup
             for _ in range(num_apples):
                 apple = Apple(width, height, grid_size)
                 apple.ensure_valid_position(self._state.snake, self._state.obstacles)
                 # Also ensure it doesn't overlap with existing apples
-                while any(
-                    apple.x == a.x and apple.y == a.y for a in self._state.apples
-                ):
+                while (apple.x, apple.y) in apple_cells:
                     apple.ensure_valid_position(
                         self._state.snake, self._state.obstacles
                     )
+                apple_cells.add((apple.x, apple.y))
                 self._state.apples.append(apple)
 
     def get_critical_settings_list(self) -> list[str]:
@@ -27,10 +27,17 @@ import pygame
 from ecs.systems.base_system import BaseSystem
 from ecs.world import World
 from ecs.entities.entity import EntityType
+from ecs.systems.hud_cache import HudCache
 from core.rendering.pygame_surface_renderer import RenderEnqueue
+from core.rendering.text_cache import render_text
 from core.types.color import Color
 from game import constants
 
+# HUD colors resolved once at import instead of parsing hex every frame
+_SCORE_COLOR = Color.from_hex(constants.SCORE_COLOR).to_tuple()
+_MESSAGE_COLOR = Color.from_hex(constants.MESSAGE_COLOR).to_tuple()
+_GRID_COLOR = Color.from_hex(constants.GRID_COLOR).to_tuple()
+
 
 class UIRenderSystem(BaseSystem):
     """System responsible for rendering basic HUD elements.
@@ -55,6 +62,8 @@ class UIRenderSystem(BaseSystem):
         """
         self._renderer = renderer
         self._settings = settings
+        # score label, speed bar and speaker icon, kept until they change
+        self._hud = HudCache()
 
     def draw_score(self, world: World, surface_width: int, surface_height: int) -> None:
         """Draw score counter horizontally centered near the top, semi-transparent.
@@ -77,30 +86,16 @@ class UIRenderSystem(BaseSystem):
         current_score = score_entity.score.current
 
         try:
-            # large font size
-            font_size = int(surface_width / 8)
-            font_path = "assets/font/GetVoIP-Grotesque.ttf"
-
-            try:
-                score_font = pygame.font.Font(font_path, font_size)
-            except Exception:
-                score_font = pygame.font.Font(None, font_size)
-
-            # get color from constants
-            score_color = Color.from_hex(constants.MESSAGE_COLOR).to_tuple()
-
-            # render score text
-            score_text = score_font.render(str(current_score), True, score_color)
-
-            # make it translucent (~25% opaque)
-            score_text.set_alpha(64)
-
             # horizontal center; vertically near the top with margin
             top_margin = getattr(
                 world.board, "cell_size", max(10, surface_height // 20)
             )
-            score_rect = score_text.get_rect()
-            score_rect.midtop = (surface_width // 2, top_margin)
+
+            # translucent label, laid out again only when the score or the
+            # window changes
+            score_text, score_rect = self._hud.score_label(
+                current_score, surface_width, top_margin, _MESSAGE_COLOR
+            )
 
             # blit to main surface
             self._renderer.blit(score_text, score_rect)
@@ -158,22 +153,18 @@ class UIRenderSystem(BaseSystem):
             int(255 * (1 - ratio)),
             0,
         )
-        border_color = Color.from_hex(constants.GRID_COLOR).to_tuple()
-        text_color = Color.from_hex(constants.MESSAGE_COLOR).to_tuple()
+        border_color = _GRID_COLOR
+        text_color = _MESSAGE_COLOR
 
         # bar position
         bar_x = padding_x
         bar_y = padding_y
 
-        # create temporary surface for the speed bar
-        bar_surface = pygame.Surface((bar_width, bar_height))
-        bar_surface.fill(border_color)
-
-        # draw filled portion
-        filled_width = int(bar_width * ratio)
-        if filled_width > 0:
-            filled_rect = pygame.Rect(0, 0, filled_width, bar_height)
-            pygame.draw.rect(bar_surface, bar_color, filled_rect)
+        # the speed only changes when an apple is eaten, so the bar surface
+        # is kept until its size or filled portion changes
+        bar_surface = self._hud.speed_bar(
+            bar_width, bar_height, int(bar_width * ratio), bar_color, border_color
+        )
 
         # blit bar to screen
         self._renderer.blit(bar_surface, (bar_x, bar_y))
@@ -181,14 +172,8 @@ class UIRenderSystem(BaseSystem):
         # draw text label below
         label_text = f"Speed: {current_speed:.1f}"
         font_size = int(surface_width / 50)
-        font_path = "assets/font/GetVoIP-Grotesque.ttf"
 
-        try:
-            font = pygame.font.Font(font_path, font_size)
-        except Exception:
-            font = pygame.font.Font(None, font_size)
-
-        label_surf = font.render(label_text, True, text_color)
+        label_surf = render_text(label_text, font_size, text_color)
         label_rect = label_surf.get_rect()
         label_rect.midtop = (bar_x + bar_width // 2, bar_y + bar_height + gap)
 
@@ -212,31 +197,15 @@ class UIRenderSystem(BaseSystem):
             icon_size = int(surface_width / 25)
             gap = 4
 
-            # load speaker sprites
-            try:
-                if music_on:
-                    sprite = pygame.image.load("assets/sprites/speaker-on.png")
-                else:
-                    sprite = pygame.image.load("assets/sprites/speaker-muted.png")
-            except Exception:
-                sprite = None
+            # speaker sprite, pre-scaled to the icon size
+            icon = self._hud.speaker_icon(music_on, icon_size)
 
             # render hint text - white when on, dim grid color when off
-            hint_color = (
-                Color.from_hex(constants.SCORE_COLOR).to_tuple()
-                if music_on
-                else Color.from_hex(constants.GRID_COLOR).to_tuple()
-            )
+            hint_color = _SCORE_COLOR if music_on else _GRID_COLOR
             hint_text = "[N]"
             hint_font_size = int(surface_width / 50)
-            font_path = "assets/font/GetVoIP-Grotesque.ttf"
-
-            try:
-                hint_font = pygame.font.Font(font_path, hint_font_size)
-            except Exception:
-                hint_font = pygame.font.Font(None, hint_font_size)
 
-            hint_surf = hint_font.render(hint_text, True, hint_color)
+            hint_surf = render_text(hint_text, hint_font_size, hint_color)
             hint_rect = hint_surf.get_rect()
 
             # calculate total widget height
@@ -246,10 +215,9 @@ class UIRenderSystem(BaseSystem):
             icon_x = surface_width - padding_x - icon_size
             icon_y = surface_height - padding_y - total_widget_height
 
-            # scale and draw sprite
-            if sprite is not None:
-                scaled_sprite = pygame.transform.scale(sprite, (icon_size, icon_size))
-                self._renderer.blit(scaled_sprite, (icon_x, icon_y))
+            # draw sprite
+            if icon is not None:
+                self._renderer.blit(icon, (icon_x, icon_y))
 
             # position and draw text hint below the icon
             hint_rect.centerx = icon_x + icon_size // 2
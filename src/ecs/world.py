@@ -19,10 +19,16 @@
 
 """World composition class containing game state components."""
 
-import pygame
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from ecs.entity_registry import EntityRegistry
 from ecs.board import Board
 
+if TYPE_CHECKING:
+    import pygame
+
 __all__ = ["World"]
 
 
@@ -67,6 +73,9 @@ class World:
         Args:
             board: Board instance for spatial indexing and collision detection
         """
+        # imported here so importing the ecs package does not load pygame
+        import pygame
+
         self._registry = EntityRegistry()
         self._board = board
         self._clock = pygame.time.Clock()
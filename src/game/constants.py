@@ -5,32 +5,51 @@ before runtime and never changed
 """
 
 import random
+from types import MappingProxyType
+from typing import Final
 
+import pygame
 
-HEAD_COLOR = "#00aa00"  # Color of the snake's head.
-DEAD_HEAD_COLOR = "#4b0082"  # Color of the dead snake's head.
-TAIL_COLOR = "#00ff00"  # Color of the snake's tail.
-OBSTACLE_COLOR = "#666666"  # Color of the obstacles.
-APPLE_COLOR = "#aa0000"  # Color of the apple.
-ARENA_COLOR = "#202020"  # Color of the ground.
-GRID_COLOR = "#3c3c3b"  # Color of the grid lines.
-SCORE_COLOR = "#ffffff"  # Color of the scoreboard.
-MESSAGE_COLOR = "#808080"  # Color of the game-over message.
+HEAD_COLOR: Final = "#00aa00"  # Color of the snake's head.
+DEAD_HEAD_COLOR: Final = "#4b0082"  # Color of the dead snake's head.
+TAIL_COLOR: Final = "#00ff00"  # Color of the snake's tail.
+OBSTACLE_COLOR: Final = "#666666"  # Color of the obstacles.
+APPLE_COLOR: Final = "#aa0000"  # Color of the apple.
+ARENA_COLOR: Final = "#202020"  # Color of the ground.
+GRID_COLOR: Final = "#3c3c3b"  # Color of the grid lines.
+SCORE_COLOR: Final = "#ffffff"  # Color of the scoreboard.
+MESSAGE_COLOR: Final = "#808080"  # Color of the game-over message.
 
-WINDOW_TITLE = "KobraPy"  # Window title.
-CLOCK_TICKS = 4  # How fast the snake moves.
+WINDOW_TITLE: Final = "KobraPy"  # Window title.
+CLOCK_TICKS: Final = 4  # How fast the snake moves.
 
-# Difficulty percentages for obstacle count
-DIFFICULTY_PERCENTAGES = {
-    "None": 0.0,
-    "Easy": 0.04,
-    "Medium": 0.06,
-    "Hard": 0.10,
-    "Impossible": 0.15,
-}
+# Difficulty percentages for obstacle count (read-only, shared by all callers)
+DIFFICULTY_PERCENTAGES: Final = MappingProxyType(
+    {
+        "None": 0.0,
+        "Easy": 0.04,
+        "Medium": 0.06,
+        "Hard": 0.10,
+        "Impossible": 0.15,
+    }
+)
+
+# Movement keys mapped to their (dx, dy) direction (read-only)
+DIRECTION_KEYS: Final = MappingProxyType(
+    {
+        pygame.K_DOWN: (0, 1),
+        pygame.K_s: (0, 1),
+        pygame.K_UP: (0, -1),
+        pygame.K_w: (0, -1),
+        pygame.K_RIGHT: (1, 0),
+        pygame.K_d: (1, 0),
+        pygame.K_LEFT: (-1, 0),
+        pygame.K_a: (-1, 0),
+    }
+)
 
 # Color palettes for snake customization
-SNAKE_COLOR_PALETTES = [
+SNAKE_COLOR_PALETTES: Final = [
     # Classic Green
     {"head": "#00aa00", "tail": "#00ff00", "name": "Classic Green"},
     # Fire
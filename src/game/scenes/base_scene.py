@@ -27,6 +27,9 @@ from typing import Optional
 from core.io.pygame_adapter import PygameIOAdapter
 from core.rendering.pygame_surface_renderer import RenderEnqueue
 
+# longest time a static screen sleeps waiting for input before redrawing
+IDLE_EVENT_TIMEOUT_MS = 100
+
 
 class BaseScene(ABC):
     """Base class for all game scenes.
@@ -55,6 +58,7 @@ class BaseScene(ABC):
         self._width = width
         self._height = height
         self._next_scene: Optional[str] = None
+        self._first_frame = True
 
     @abstractmethod
     def update(self, dt_ms: float) -> Optional[str]:
@@ -77,6 +81,32 @@ class BaseScene(ABC):
         """Called when entering this scene."""
         pass
 
+    def reset_input_wait(self) -> None:
+        """Make the next input poll return immediately.
+
+        Called by the scene manager when this scene becomes current, so its
+        first frame is drawn without waiting for input.
+        """
+        self._first_frame = True
+
+    def _get_input_events(self, can_wait: bool = True) -> list:
+        """Get pending input events, sleeping until input if the screen is idle.
+
+        Static screens only change in response to input, so after their
+        first frame they block on the event queue (up to
+        IDLE_EVENT_TIMEOUT_MS) instead of polling it every frame.
+
+        Args:
+            can_wait: Whether the scene has nothing to animate and may block
+
+        Returns:
+            List of pygame events
+        """
+        if self._first_frame or not can_wait:
+            self._first_frame = False
+            return self._pygame_adapter.get_events()
+        return self._pygame_adapter.wait_for_events(IDLE_EVENT_TIMEOUT_MS)
+
     def on_exit(self) -> None:
         """Called when exiting this scene."""
         pass
@@ -44,6 +44,7 @@ import pygame
 import sys
 from typing import Optional
 
+from core.rendering.text_cache import render_text
 from game.scenes.base_scene import BaseScene
 from game.services.assets import GameAssets
 from game.constants import ARENA_COLOR
@@ -88,7 +89,7 @@ class GameOverScene(BaseScene):
             Next scene name or None
         """
         # Handle input
-        for event in self._pygame_adapter.get_events():
+        for event in self._get_input_events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -112,30 +113,22 @@ class GameOverScene(BaseScene):
             big_font_size = int(self._width / 8)
             small_font_size = int(self._width / 25)
 
-            # create fonts with same font file and sizing as old code
-            font_path = "assets/font/GetVoIP-Grotesque.ttf"
-
-            try:
-                # try to load the same font as old code
-                big_font = pygame.font.Font(font_path, big_font_size)
-                small_font = pygame.font.Font(font_path, small_font_size)
-            except Exception:
-                # fallback to default font if GetVoIP font not found
-                big_font = pygame.font.Font(None, big_font_size)
-                small_font = pygame.font.Font(None, small_font_size)
-
             # MESSAGE_COLOR from old code: "#808080" (gray)
             message_color = (128, 128, 128)  # #808080
 
             # "Game Over" text centered (exactly like old code)
-            game_over_text = big_font.render("Game Over", True, message_color)
+            # (labels come from the shared text cache, which falls back to
+            # the default font if the GetVoIP font is not found)
+            game_over_text = render_text("Game Over", big_font_size, message_color)
             game_over_rect = game_over_text.get_rect(
                 center=(self._width // 2, self._height / 2.6)
             )
 
             # "Press Enter/Space to restart • Q to menu" text below (exactly like old code)
-            restart_text = small_font.render(
-                "Press Enter/Space to play again • Q to menu", True, message_color
+            restart_text = render_text(
+                "Press Enter/Space to play again • Q to menu",
+                small_font_size,
+                message_color,
             )
             restart_rect = restart_text.get_rect(
                 center=(self._width // 2, self._height / 1.8)
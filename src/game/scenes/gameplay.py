@@ -27,6 +27,7 @@ from typing import Optional, Any, List
 
 from game.scenes.base_scene import BaseScene
 from game.services.game_initializer import GameInitializer
+from game.services.assets import GameAssets
 from game.services.audio_service import AudioService
 from game.services.sfx_queue_service import SfxQueueService
 from ecs.world import World
@@ -34,6 +35,7 @@ from ecs.systems.base_system import BaseSystem
 from ecs.systems.input import InputSystem
 from ecs.systems.movement import MovementSystem
 from ecs.systems.collision import CollisionSystem
+from ecs.systems.apple_spawn import AppleSpawnSystem
 from ecs.systems.spawn import SpawnSystem
 from ecs.systems.scoring import ScoringSystem
 from ecs.systems.audio import AudioSystem
@@ -90,8 +92,15 @@ class GameplayScene(BaseScene):
         self._entity_render_system: Optional[EntityRenderSystem] = None
         self._ui_render_system: Optional[UIRenderSystem] = None
         self._overlay_render_system: Optional[OverlayRenderSystem] = None
-        self._game_initializer = GameInitializer(settings=settings)
+        # shared with the initializer so initial apples use the same RNG
+        self._apple_spawn_system = AppleSpawnSystem(1000)
+        self._game_initializer = GameInitializer(
+            settings=settings, apple_spawn_system=self._apple_spawn_system
+        )
         self._audio_service = AudioService(settings=settings)
+        self._audio_service.preload_sounds(
+            GameAssets.EAT_SOUND, GameAssets.GAMEOVER_SOUND_PATH
+        )
         self._sfx_queue_service = SfxQueueService()
 
     def on_attach(self) -> None:
@@ -106,8 +115,6 @@ class GameplayScene(BaseScene):
         self._systems.clear()
 
         # game logic systems (indices 0-7, paused during pause)
-        from ecs.systems.apple_spawn import AppleSpawnSystem
-
         self._systems.extend(
             [
                 InputSystem(
@@ -119,7 +126,7 @@ class GameplayScene(BaseScene):
                 CollisionSystem(
                     self._settings, self._audio_service
                 ),  # 2: detect collisions (wall, self-bite, obstacles, apples)
-                AppleSpawnSystem(1000),  # 3: maintain correct number of apples on board
+                self._apple_spawn_system,  # 3: maintain correct number of apples on board
                 SpawnSystem(
                     1000, (255, 0, 0), None
                 ),  # 4: create new entities at valid positions
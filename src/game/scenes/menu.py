@@ -76,6 +76,9 @@ class MenuScene(BaseScene):
         self._settings = settings
         self._selected_index = 0
         self._menu_items = ["Start Game", "Settings", "Quit"]
+        # labels of the last drawn menu and the state they were built from
+        self._menu_blits: list = []
+        self._menu_key: Optional[tuple] = None
 
     def update(self, dt_ms: float) -> Optional[str]:
         """Update menu logic.
@@ -87,7 +90,7 @@ class MenuScene(BaseScene):
             Next scene name or None
         """
         # Handle input
-        for event in self._pygame_adapter.get_events():
+        for event in self._get_input_events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 exit()
@@ -116,16 +119,32 @@ class MenuScene(BaseScene):
         return None
 
     def render(self) -> None:
-        """Render the menu."""
+        """Render the menu.
+
+        The labels and their rects are laid out again only when the
+        selection or the scene size changed.
+        """
+        key = (self._selected_index, self._width, self._height)
+        if key != self._menu_key:
+            self._menu_blits = self._build_menu_blits()
+            self._menu_key = key
+
         # Clear screen
         self._renderer.fill(ARENA_COLOR)
+        self._renderer.blits(self._menu_blits)
+
+    def _build_menu_blits(self) -> list:
+        """Render the title and items of the menu.
 
+        Returns:
+            List of (surface, rect) pairs in drawing order
+        """
         # Draw title
         title = self._assets.render_custom(
             WINDOW_TITLE, MESSAGE_COLOR, int(self._width / 12)
         )
         title_rect = title.get_rect(center=(self._width / 2, self._height / 4))
-        self._renderer.blit(title, title_rect)
+        blits = [(title, title_rect)]
 
         # Draw menu items
         for i, item in enumerate(self._menu_items):
@@ -134,7 +153,9 @@ class MenuScene(BaseScene):
             rect = text.get_rect(
                 center=(self._width / 2, self._height / 2 + i * (self._height * 0.12))
             )
-            self._renderer.blit(text, rect)
+            blits.append((text, rect))
+
+        return blits
 
     def on_enter(self) -> None:
         """Called when entering menu."""
@@ -91,6 +91,7 @@ class SceneManager:
 
         # Enter new scene
         self._current_scene = self._scenes[name]
+        self._current_scene.reset_input_wait()
         self._current_scene.on_enter()
 
         print(f"Now in scene: {name}")
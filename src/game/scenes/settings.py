@@ -59,6 +59,9 @@ class SettingsScene(BaseScene):
         self._settings = settings
         self._config = config
         self._selected_index = 0
+        # labels of the last drawn menu and the state they were built from
+        self._menu_blits: list = []
+        self._menu_key: Optional[tuple] = None
 
     def update(self, dt_ms: float) -> Optional[str]:
         """Update settings logic.
@@ -75,8 +78,10 @@ class SettingsScene(BaseScene):
             current_field = self._settings.MENU_FIELDS[self._selected_index]
             self._apply_audio_setting_if_changed(current_field["key"])
 
-        # Handle input
-        for event in self._pygame_adapter.get_events():
+        # Handle input (only sleep while no key is held, since holding
+        # keeps stepping the value without new events)
+        holding = self._settings.key_hold_state["active"]
+        for event in self._get_input_events(can_wait=not holding):
             if event.type == pygame.QUIT:
                 pygame.quit()
                 exit()
@@ -138,16 +143,40 @@ class SettingsScene(BaseScene):
                 pygame.mixer.pause()
 
     def render(self) -> None:
-        """Render the settings screen."""
+        """Render the settings screen.
+
+        The menu only changes with the selection or a setting value, so its
+        labels are laid out again only when one of them changed and are
+        otherwise queued as the previous batch of blits.
+        """
+        key = (
+            self._selected_index,
+            self._width,
+            self._height,
+            tuple(self._settings.get(f["key"]) for f in self._settings.MENU_FIELDS),
+        )
+        if key != self._menu_key:
+            self._menu_blits = self._build_menu_blits()
+            self._menu_key = key
+
         # Clear screen
         self._renderer.fill(ARENA_COLOR)
+        self._renderer.blits(self._menu_blits)
+
+    def _build_menu_blits(self) -> list:
+        """Render the title, visible rows and hint of the settings menu.
+
+        Returns:
+            List of (surface, rect) pairs in drawing order
+        """
+        blits = []
 
         # Draw title
         title = self._assets.render_custom(
             "Settings", MESSAGE_COLOR, int(self._width / 12)
         )
         title_rect = title.get_rect(center=(self._width / 2, self._height / 10))
-        self._renderer.blit(title, title_rect)
+        blits.append((title, title_rect))
 
         # Spacing and scroll parameters
         row_h = int(self._height * 0.06)
@@ -155,6 +184,12 @@ class SettingsScene(BaseScene):
         top_index = max(0, self._selected_index - visible_rows + 3)
         padding_y = int(self._height * 0.22)
 
+        # Calculate current grid size for display
+        current_grid_size = 20  # default fallback
+        if self._config:
+            desired_cells = max(10, int(self._settings.get("cells_per_side")))
+            current_grid_size = self._config.get_optimal_grid_size(desired_cells)
+
         # Draw visible rows
         for draw_i, field_i in enumerate(
             range(top_index, len(self._settings.MENU_FIELDS))
@@ -164,12 +199,6 @@ class SettingsScene(BaseScene):
             f = self._settings.MENU_FIELDS[field_i]
             val = self._settings.get(f["key"])
 
-            # Calculate current grid size for display
-            current_grid_size = 20  # default fallback
-            if self._config:
-                desired_cells = max(10, int(self._settings.get("cells_per_side")))
-                current_grid_size = self._config.get_optimal_grid_size(desired_cells)
-
             formatted_val = self._settings.format_setting_value(
                 f,
                 val,
@@ -184,15 +213,17 @@ class SettingsScene(BaseScene):
             rect = text.get_rect()
             rect.left = int(self._width * 0.10)
             rect.top = padding_y + draw_i * row_h
-            self._renderer.blit(text, rect)
+            blits.append((text, rect))
 
         # Hint footer
         hint_text = "[A/D] change   [W/S] select   [Enter/Esc] back   [C] random colors"
         hint = self._assets.render_custom(hint_text, GRID_COLOR, int(self._width / 50))
-        self._renderer.blit(
-            hint, hint.get_rect(center=(self._width / 2, self._height * 0.95))
+        blits.append(
+            (hint, hint.get_rect(center=(self._width / 2, self._height * 0.95)))
         )
 
+        return blits
+
     def on_enter(self) -> None:
         """Called when entering settings."""
         self._selected_index = 0
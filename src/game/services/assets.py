@@ -19,6 +19,9 @@
 
 import pygame
 
+from core.rendering.sprites import load_sprite
+from core.rendering.text_cache import clear_text_cache, get_font, render_text
+
 
 class GameAssets:
     """Manages loading and reloading of game assets (sounds, sprites, fonts)."""
@@ -62,30 +65,24 @@ class GameAssets:
         self.load_sounds()
 
     def load_fonts(self) -> None:
-        """Load game fonts with sizes based on window width."""
-        try:
-            self.big_font = pygame.font.Font(self.FONT_PATH, int(self.window_width / 8))
-            self.small_font = pygame.font.Font(
-                self.FONT_PATH, int(self.window_width / 20)
-            )
-        except Exception as e:
-            print(f"Error loading fonts: {e}")
-            # Fallback to default font
-            self.big_font = pygame.font.Font(None, int(self.window_width / 8))
-            self.small_font = pygame.font.Font(None, int(self.window_width / 20))
+        """Load game fonts with sizes based on window width.
+
+        Fonts come from the shared text cache, which opens each size once
+        and falls back to pygame's default font if the game font fails.
+        """
+        self.big_font = get_font(self.window_width // 8)
+        self.small_font = get_font(self.window_width // 20)
 
     def load_sprites(self) -> None:
         """Load sprite images."""
         try:
-            self.speaker_on_sprite = pygame.image.load(self.SPEAKER_ON_SPRITE_PATH)
+            self.speaker_on_sprite = load_sprite(self.SPEAKER_ON_SPRITE_PATH)
         except pygame.error as e:
             print(f"Warning: Could not load speaker-on sprite: {e}")
             self.speaker_on_sprite = None
 
         try:
-            self.speaker_muted_sprite = pygame.image.load(
-                self.SPEAKER_MUTED_SPRITE_PATH
-            )
+            self.speaker_muted_sprite = load_sprite(self.SPEAKER_MUTED_SPRITE_PATH)
         except pygame.error as e:
             print(f"Warning: Could not load speaker-muted sprite: {e}")
             self.speaker_muted_sprite = None
@@ -107,10 +104,17 @@ class GameAssets:
     def reload_fonts(self, new_window_width: int) -> None:
         """Reload fonts with new window width.
 
+        Nothing is done if the width did not change, so the fonts and the
+        labels rendered with them stay cached.
+
         Args:
             new_window_width: New window width for font sizing
         """
+        if new_window_width == self.window_width and self.big_font is not None:
+            return
         self.window_width = new_window_width
+        # labels rendered at the old sizes will not be requested again
+        clear_text_cache()
         self.load_fonts()
 
     def reload_all(self, new_window_width: int = None) -> None:
@@ -126,6 +130,8 @@ class GameAssets:
     def render_big(self, text: str, color, antialias: bool = True):
         """Render text using the big font.
 
+        The surface is cached and shared between calls; do not modify it.
+
         Args:
             text: Text to render
             color: Text color
@@ -134,11 +140,13 @@ class GameAssets:
         Returns:
             Rendered text surface
         """
-        return self.big_font.render(text, antialias, color)
+        return render_text(text, self.window_width // 8, color, None, antialias)
 
     def render_small(self, text: str, color, antialias: bool = True):
         """Render text using the small font.
 
+        The surface is cached and shared between calls; do not modify it.
+
         Args:
             text: Text to render
             color: Text color
@@ -147,11 +155,13 @@ class GameAssets:
         Returns:
             Rendered text surface
         """
-        return self.small_font.render(text, antialias, color)
+        return render_text(text, self.window_width // 20, color, None, antialias)
 
     def render_custom(self, text: str, color, size_px: int, antialias: bool = True):
         """Render text using a custom font size.
 
+        The surface is cached and shared between calls; do not modify it.
+
         Args:
             text: Text to render
             color: Text color
@@ -161,13 +171,7 @@ class GameAssets:
         Returns:
             Rendered text surface
         """
-        try:
-            custom_font = pygame.font.Font(self.FONT_PATH, size_px)
-            return custom_font.render(text, antialias, color)
-        except Exception as e:
-            print(f"Error creating custom font: {e}")
-            fallback_font = pygame.font.Font(None, size_px)
-            return fallback_font.render(text, antialias, color)
+        return render_text(text, size_px, color, None, antialias)
 
     @staticmethod
     def init_music(volume: float = 0.2, start_playing: bool = True) -> None:
@@ -38,8 +38,16 @@ class AudioService:
     Architecture note: While we have an AudioSystem for ECS-based audio,
     this service is needed for scene-level audio control (background music,
     UI sounds, etc.) that don't fit well into the ECS update loop.
+
+    Sound effects are decoded once and kept in memory, so playing one does
+    not read and decompress the file at the moment it is needed. Priority
+    effects (e.g. game over) play on a reserved mixer channel so they never
+    wait for a free one.
     """
 
+    # mixer channel reserved for priority effects (see PygameIOAdapter)
+    PRIORITY_CHANNEL = 0
+
     def __init__(self, settings=None):
         """Initialize the audio service.
 
@@ -47,12 +55,48 @@ class AudioService:
             settings: Game settings object with audio preferences
         """
         self._settings = settings
+        self._sounds: dict[str, pygame.mixer.Sound] = {}
+
+    def _get_sound(self, sound_path: str) -> pygame.mixer.Sound:
+        """Get a decoded sound, loading it on first use.
 
-    def play_sound(self, sound_path: str) -> bool:
+        Args:
+            sound_path: Path to sound file (relative to project root)
+
+        Returns:
+            The cached sound
+
+        Raises:
+            pygame.error: If the mixer is not ready or the file cannot be loaded
+            FileNotFoundError: If the file does not exist
+        """
+        sound = self._sounds.get(sound_path)
+        if sound is None:
+            sound = pygame.mixer.Sound(sound_path)
+            self._sounds[sound_path] = sound
+        return sound
+
+    def preload_sounds(self, *sound_paths: str) -> None:
+        """Decode sound effects ahead of time.
+
+        A sound that cannot be loaded is reported and retried when first
+        played; other errors propagate.
+
+        Args:
+            *sound_paths: Paths to sound files (relative to project root)
+        """
+        for sound_path in sound_paths:
+            try:
+                self._get_sound(sound_path)
+            except (pygame.error, FileNotFoundError) as e:
+                print(f"Warning: Could not preload sound {sound_path}: {e}")
+
+    def play_sound(self, sound_path: str, priority: bool = False) -> bool:
         """Play a sound effect if sound effects are enabled.
 
         Args:
             sound_path: Path to sound file (relative to project root)
+            priority: Play on the reserved channel instead of any free one
 
         Returns:
             True if sound was played, False otherwise
@@ -62,8 +106,11 @@ class AudioService:
             return False
 
         try:
-            sound = pygame.mixer.Sound(sound_path)
-            sound.play()
+            sound = self._get_sound(sound_path)
+            if priority:
+                pygame.mixer.Channel(self.PRIORITY_CHANNEL).play(sound)
+            else:
+                sound.play()
             return True
         except Exception:
             # Silently ignore missing files or playback errors
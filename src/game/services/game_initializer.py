@@ -22,10 +22,10 @@ This service is responsible for initializing and resetting the game world,
 creating initial entities, and managing game state transitions.
 """
 
-import random
 from typing import Any, Optional
 
 from ecs.world import World
+from ecs.systems.apple_spawn import AppleSpawnSystem
 from core.types.color_utils import hex_to_rgb
 
 
@@ -42,13 +42,20 @@ class GameInitializer:
     of concerns and make the code more testable.
     """
 
-    def __init__(self, settings: Optional[Any] = None):
+    def __init__(
+        self,
+        settings: Optional[Any] = None,
+        apple_spawn_system: Optional[AppleSpawnSystem] = None,
+    ):
         """Initialize the game initializer.
 
         Args:
             settings: Game settings object (Settings instance)
+            apple_spawn_system: Apple spawn system whose free cells and random
+                generator place the initial apples; a new one if None
         """
         self._settings = settings
+        self._apple_spawn_system = apple_spawn_system or AppleSpawnSystem()
         self._game_over = False
         self._death_reason = ""
 
@@ -61,8 +68,9 @@ class GameInitializer:
         Args:
             world: ECS world instance to reset
         """
-        # clear all entities from the world
+        # clear all entities from the world and their board tiles
         world.registry.clear()
+        world.board.clear()
 
         # reset game over state
         self._game_over = False
@@ -101,7 +109,7 @@ class GameInitializer:
         self._create_apple_config(world)
 
         # create initial apples
-        self._create_initial_apples(world, grid_size)
+        self._create_initial_apples(world)
 
         # create obstacles based on difficulty
         self._create_obstacles(world, grid_size)
@@ -206,49 +214,20 @@ class GameInitializer:
         apple_config_entity = AppleConfigEntity(desired_apples)
         world.registry.add(apple_config_entity)
 
-    def _create_initial_apples(self, world: World, grid_size: int) -> None:
+    def _create_initial_apples(self, world: World) -> None:
         """Create initial apples at random valid positions.
 
+        Apples are placed by the apple spawn system, so they come from the
+        same free cells and seeded random generator as later spawns.
+
         Args:
             world: ECS world instance
-            grid_size: Size of grid cells in pixels
         """
-        from ecs.prefabs.apple import create_apple
-        from ecs.entities.entity import EntityType
-
-        # get desired apple count from config entity
-        apple_configs = world.registry.query_by_component("apple_config")
-        if not apple_configs:
+        # without a config entity there is no desired apple count yet
+        if not world.registry.query_by_component("apple_config"):
             return
 
-        config_entity = list(apple_configs.values())[0]
-        desired_apples = config_entity.apple_config.desired_count
-
-        # get occupied positions (snake)
-        occupied_positions = set()
-        snakes = world.registry.query_by_type(EntityType.SNAKE)
-        for _, snake in snakes.items():
-            if hasattr(snake, "position"):
-                occupied_positions.add((snake.position.x, snake.position.y))
-                if hasattr(snake, "body"):
-                    for segment in snake.body.segments:
-                        occupied_positions.add((segment.x, segment.y))
-
-        # spawn initial apples
-        for _ in range(desired_apples):
-            # try to find a valid position
-            attempts = 0
-            max_attempts = 1000
-            while attempts < max_attempts:
-                x = random.randint(0, world.board.width - 1)
-                y = random.randint(0, world.board.height - 1)
-
-                if (x, y) not in occupied_positions:
-                    create_apple(world, x=x, y=y, grid_size=grid_size, color=None)
-                    occupied_positions.add((x, y))
-                    break
-
-                attempts += 1
+        self._apple_spawn_system.update(world)
 
     def _create_obstacles(self, world: World, grid_size: int) -> None:
         """Create obstacles based on difficulty setting.
@@ -22,6 +22,7 @@
 import pytest
 import pygame
 from unittest.mock import Mock, MagicMock, patch
+from core.io.pygame_adapter import PygameIOAdapter
 from core.rendering.pygame_surface_renderer import (
     PygameSurfaceRenderer,
     _RendererView,
@@ -174,6 +175,20 @@ class TestCommandQueueing:
         cmd = renderer._command_queue[0]
         assert cmd.kwargs == {"special_flags": flags}
 
+    def test_blits_queues_single_command(self, renderer):
+        """Test that blits queues one command for the whole sequence."""
+        source = Mock(spec=pygame.Surface)
+        sequence = [(source, (0, 0)), (source, (10, 0))]
+
+        renderer.blits(sequence)
+
+        assert len(renderer._command_queue) == 1
+        cmd = renderer._command_queue[0]
+        assert cmd.operation == renderer._surface.blits
+        assert cmd.args == (sequence,)
+        # the touched rects are needed for the dirty-rect display update
+        assert cmd.kwargs.get("doreturn", True)
+
     def test_draw_line_queues_command(self, renderer):
         """Test that draw_line queues a line drawing command."""
         color = (255, 255, 0)
@@ -237,11 +252,15 @@ class TestCommandQueueing:
 class TestFrameControl:
     """Tests for frame control methods."""
 
-    def test_begin_frame_clears_surface(self, renderer):
-        """Test that begin_frame clears the surface."""
+    @patch("pygame.display.update")
+    def test_update_clears_surface(self, mock_display_update, renderer):
+        """Test that the clear color is painted when the frame is drawn."""
         clear_color = (50, 50, 50, 255)
 
         renderer.begin_frame(clear_color)
+        renderer._surface.fill.assert_not_called()
+        renderer.blits([])
+        renderer.update()
 
         renderer._surface.fill.assert_called_once_with(clear_color)
 
@@ -256,12 +275,67 @@ class TestFrameControl:
 
         assert len(renderer._command_queue) == 0
 
-    def test_begin_frame_default_color(self, renderer):
+    @patch("pygame.display.update")
+    def test_begin_frame_default_color(self, mock_display_update, renderer):
         """Test that begin_frame uses default transparent black."""
         renderer.begin_frame()
+        renderer.update()
 
         renderer._surface.fill.assert_called_once_with((0, 0, 0, 0))
 
+    @patch("pygame.display.update")
+    def test_clear_skipped_under_full_fill(self, mock_display_update, renderer):
+        """Test that a frame starting with a full fill is not cleared first."""
+        renderer.begin_frame((50, 50, 50, 255))
+        renderer.fill((1, 2, 3))
+        renderer.update()
+
+        renderer._surface.fill.assert_called_once_with((1, 2, 3))
+
+    @patch("pygame.display.update")
+    def test_clear_skipped_under_opaque_background(
+        self, mock_display_update, real_surface
+    ):
+        """Test that an opaque full-size background blit replaces the clear."""
+        renderer = PygameSurfaceRenderer(real_surface)
+        real_surface.fill((9, 9, 9))
+        background = pygame.Surface((800, 600))
+        background.fill((1, 2, 3))
+        background.fill((200, 0, 0), pygame.Rect(0, 0, 10, 10))
+
+        with patch.object(renderer, "_surface", wraps=real_surface) as surface:
+            renderer.begin_frame((50, 50, 50, 255))
+            renderer.blit(background, (0, 0))
+            renderer.update()
+            surface.fill.assert_not_called()
+
+        assert real_surface.get_at((0, 0))[:3] == (200, 0, 0)
+        assert real_surface.get_at((400, 300))[:3] == (1, 2, 3)
+
+    @patch("pygame.display.update")
+    def test_clear_kept_under_translucent_blit(self, mock_display_update, real_surface):
+        """Test that a per-pixel alpha overlay does not skip the clear."""
+        renderer = PygameSurfaceRenderer(real_surface)
+        overlay = pygame.Surface((800, 600), pygame.SRCALPHA)
+
+        renderer.begin_frame((50, 50, 50, 255))
+        renderer.blit(overlay, (0, 0))
+        renderer.update()
+
+        assert real_surface.get_at((400, 300))[:3] == (50, 50, 50)
+
+    def test_per_pixel_alpha_source_never_covers(self, renderer):
+        """Test that a full-size SRCALPHA source is not taken as opaque."""
+        source = MagicMock(spec=pygame.Surface)
+        source.get_size.return_value = (800, 600)
+        source.get_flags.return_value = pygame.SRCALPHA
+        source.get_alpha.return_value = None
+        source.get_colorkey.return_value = None
+
+        renderer.blit(source, (0, 0))
+
+        assert not renderer._covers_surface(renderer._command_queue[0])
+
     @patch("pygame.display.update")
     def test_update_executes_commands(self, mock_display_update, real_surface):
         """Test that update executes all queued commands."""
@@ -345,6 +419,7 @@ class TestRendererView:
         assert hasattr(view, "get_size")
         assert hasattr(view, "fill")
         assert hasattr(view, "blit")
+        assert hasattr(view, "blits")
         assert hasattr(view, "draw_line")
         assert hasattr(view, "draw_rect")
 
@@ -378,6 +453,17 @@ class TestRendererView:
         assert len(renderer._command_queue) == 1
         assert renderer._command_queue[0].args == (source, dest)
 
+    def test_view_blits_delegates_to_renderer(self, renderer):
+        """Test that view.blits queues command in renderer."""
+        view = renderer.view()
+        source = Mock(spec=pygame.Surface)
+        sequence = [(source, (50, 50))]
+
+        view.blits(sequence)
+
+        assert len(renderer._command_queue) == 1
+        assert renderer._command_queue[0].args == (sequence,)
+
     def test_view_draw_line_delegates_to_renderer(self, renderer):
         """Test that view.draw_line queues command in renderer."""
         view = renderer.view()
@@ -486,3 +572,190 @@ class TestIntegration:
 
         # Display updated twice
         assert mock_display_update.call_count == 2
+
+
+class TestDirtyRectUpdate:
+    """Test that only changed display areas are updated."""
+
+    @patch("pygame.display.update")
+    def test_first_frame_updates_whole_display(self, mock_display_update, real_surface):
+        """Test that the first frame is always a full update."""
+        renderer = PygameSurfaceRenderer(real_surface)
+
+        renderer.begin_frame()
+        renderer.draw_rect((255, 0, 0), pygame.Rect(10, 10, 20, 20))
+        renderer.update()
+
+        mock_display_update.assert_called_once_with()
+
+    @patch("pygame.display.update")
+    def test_unchanged_background_updates_only_drawn_areas(
+        self, mock_display_update, real_surface
+    ):
+        """Test that a repeated background only pushes small areas."""
+        renderer = PygameSurfaceRenderer(real_surface)
+        background = pygame.Surface(real_surface.get_size())
+
+        for x in (10, 50):
+            renderer.begin_frame()
+            renderer.blit(background, (0, 0))
+            renderer.draw_rect((255, 0, 0), pygame.Rect(x, 10, 20, 20))
+            renderer.update()
+
+        (areas,), _ = mock_display_update.call_args
+        # the new square and the one drawn in the previous frame
+        assert areas == [pygame.Rect(50, 10, 20, 20), pygame.Rect(10, 10, 20, 20)]
+
+    @patch("pygame.display.update")
+    def test_changed_background_updates_whole_display(
+        self, mock_display_update, real_surface
+    ):
+        """Test that a new full-surface blit forces a full update."""
+        renderer = PygameSurfaceRenderer(real_surface)
+
+        for _ in range(2):
+            renderer.begin_frame()
+            renderer.blit(pygame.Surface(real_surface.get_size()), (0, 0))
+            renderer.update()
+
+        assert mock_display_update.call_args_list[-1] == ((),)
+
+    @patch("pygame.display.update")
+    def test_changed_clear_color_updates_whole_display(
+        self, mock_display_update, real_surface
+    ):
+        """Test that clearing with another color forces a full update."""
+        renderer = PygameSurfaceRenderer(real_surface)
+
+        for color in ((0, 0, 0, 255), (9, 9, 9, 255)):
+            renderer.begin_frame(clear_color=color)
+            renderer.update()
+
+        assert mock_display_update.call_args_list[-1] == ((),)
+
+    @patch("pygame.display.update")
+    def test_large_change_falls_back_to_full_update(
+        self, mock_display_update, real_surface
+    ):
+        """Test that changes over half the surface use one full update."""
+        renderer = PygameSurfaceRenderer(real_surface)
+
+        for color in ((255, 0, 0), (0, 255, 0)):
+            renderer.begin_frame()
+            renderer.draw_rect(color, pygame.Rect(0, 0, 700, 500))
+            renderer.update()
+
+        assert mock_display_update.call_count == 2
+        assert mock_display_update.call_args_list[-1] == ((),)
+
+    @patch("pygame.display.update")
+    def test_many_small_rects_fall_back_to_full_update(
+        self, mock_display_update, real_surface
+    ):
+        """Test that a long list of small areas uses one full update."""
+        renderer = PygameSurfaceRenderer(real_surface)
+        background = pygame.Surface(real_surface.get_size())
+        tile = pygame.Surface((2, 2))
+
+        for y in (0, 10):
+            renderer.begin_frame()
+            renderer.blit(background, (0, 0))
+            renderer.blits([(tile, (x * 4, y)) for x in range(30)])
+            renderer.update()
+
+        assert mock_display_update.call_args_list[-1] == ((),)
+
+    @patch("pygame.display.update")
+    def test_blits_areas_are_tracked(self, mock_display_update, real_surface):
+        """Test that every blit of a batch contributes its area."""
+        renderer = PygameSurfaceRenderer(real_surface)
+        tile = pygame.Surface((10, 10))
+
+        for x in (30, 60):
+            renderer.begin_frame()
+            renderer.blits([(tile, (0, 0)), (tile, (x, 0))])
+            renderer.update()
+
+        (areas,), _ = mock_display_update.call_args
+        assert pygame.Rect(30, 0, 10, 10) in areas
+        assert pygame.Rect(60, 0, 10, 10) in areas
+
+    @patch("pygame.display.update")
+    def test_identical_frame_is_skipped(self, mock_display_update, real_surface):
+        """Test that a frame equal to the previous one is not pushed."""
+        renderer = PygameSurfaceRenderer(real_surface)
+        background = pygame.Surface(real_surface.get_size())
+
+        for _ in range(3):
+            renderer.begin_frame()
+            renderer.blit(background, (0, 0))
+            renderer.draw_rect((255, 0, 0), pygame.Rect(10, 10, 20, 20))
+            renderer.update()
+
+        mock_display_update.assert_called_once_with()
+        assert len(renderer._command_queue) == 0
+
+    @patch("pygame.display.update")
+    def test_frame_after_skip_updates_changed_areas(
+        self, mock_display_update, real_surface
+    ):
+        """Test that a change after skipped frames pushes old and new areas."""
+        renderer = PygameSurfaceRenderer(real_surface)
+        background = pygame.Surface(real_surface.get_size())
+
+        for x in (10, 10, 50):
+            renderer.begin_frame()
+            renderer.blit(background, (0, 0))
+            renderer.draw_rect((255, 0, 0), pygame.Rect(x, 10, 20, 20))
+            renderer.update()
+
+        assert mock_display_update.call_count == 2
+        (areas,), _ = mock_display_update.call_args
+        assert areas == [pygame.Rect(50, 10, 20, 20), pygame.Rect(10, 10, 20, 20)]
+
+    @pytest.mark.parametrize(
+        "event_type",
+        [
+            pygame.WINDOWEXPOSED,
+            pygame.WINDOWSHOWN,
+            pygame.WINDOWRESTORED,
+            pygame.VIDEOEXPOSE,
+        ],
+    )
+    @patch("pygame.display.update")
+    def test_exposed_window_redraws_identical_frame(
+        self, mock_display_update, real_surface, event_type
+    ):
+        """Test that an expose event makes an unchanged frame a full update."""
+        renderer = PygameSurfaceRenderer(real_surface)
+        adapter = PygameIOAdapter()
+        adapter.set_redraw_handler(renderer.invalidate)
+        background = pygame.Surface(real_surface.get_size())
+
+        for expose in (False, True):
+            if expose:
+                with patch("pygame.event.get", return_value=[Mock(type=event_type)]):
+                    adapter.get_events()
+            renderer.begin_frame()
+            renderer.blit(background, (0, 0))
+            renderer.draw_rect((255, 0, 0), pygame.Rect(10, 10, 20, 20))
+            renderer.update()
+
+        assert mock_display_update.call_args_list == [((),), ((),)]
+
+    @patch("pygame.display.update")
+    def test_input_event_keeps_identical_frame_skipped(
+        self, mock_display_update, real_surface
+    ):
+        """Test that other events do not force a redraw."""
+        renderer = PygameSurfaceRenderer(real_surface)
+        adapter = PygameIOAdapter()
+        adapter.set_redraw_handler(renderer.invalidate)
+
+        for _ in range(2):
+            with patch("pygame.event.get", return_value=[Mock(type=pygame.KEYUP)]):
+                adapter.get_events()
+            renderer.begin_frame()
+            renderer.update()
+
+        mock_display_update.assert_called_once_with()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+#
+#   Copyright (c) 2023, Monaco F. J. <monaco@usp.br>
+#
+#   This file is part of Naja.
+#
+#   Naja is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Sprite loading tests."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.io.pygame_adapter import PygameIOAdapter
+from core.rendering.sprites import clear_sprite_cache, load_sprite, to_display_format
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    """Start every test with an empty sprite cache."""
+    clear_sprite_cache()
+    yield
+    clear_sprite_cache()
+
+
+class TestLoadSprite:
+    """Test conversion of loaded sprites to the display format."""
+
+    @patch("pygame.display.get_surface", return_value=MagicMock())
+    @patch("pygame.image.load")
+    def test_converted_when_display_is_set(self, mock_load, _mock_surface):
+        """Test that a sprite is converted when a display mode exists."""
+        sprite = load_sprite("sprite.png")
+
+        mock_load.assert_called_once_with("sprite.png")
+        assert sprite is mock_load.return_value.convert_alpha.return_value
+
+    @patch("pygame.display.get_surface", return_value=None)
+    @patch("pygame.image.load")
+    def test_returned_as_decoded_without_display(self, mock_load, _mock_surface):
+        """Test that a sprite is left unconverted before set_mode."""
+        sprite = load_sprite("sprite.png")
+
+        assert sprite is mock_load.return_value
+        mock_load.return_value.convert_alpha.assert_not_called()
+
+    @patch("pygame.display.get_surface", return_value=MagicMock())
+    @patch("pygame.image.load")
+    def test_loaded_once_per_path(self, mock_load, _mock_surface):
+        """Test that every caller shares one converted sprite per path."""
+        first = load_sprite("sprite.png")
+        second = load_sprite("sprite.png")
+
+        assert first is second
+        mock_load.assert_called_once_with("sprite.png")
+
+    @patch("pygame.image.load")
+    def test_not_cached_without_display(self, mock_load):
+        """Test that an unconverted sprite is loaded again later."""
+        with patch("pygame.display.get_surface", return_value=None):
+            load_sprite("sprite.png")
+        with patch("pygame.display.get_surface", return_value=MagicMock()):
+            sprite = load_sprite("sprite.png")
+
+        assert mock_load.call_count == 2
+        assert sprite is mock_load.return_value.convert_alpha.return_value
+
+    @patch("pygame.display.set_mode")
+    @patch("pygame.display.get_surface", return_value=MagicMock())
+    @patch("pygame.image.load")
+    def test_reloaded_after_set_mode(self, mock_load, _mock_surface, _mock_set_mode):
+        """Test that a new display mode drops sprites converted for the old one."""
+        load_sprite("sprite.png")
+        PygameIOAdapter().set_mode((200, 200))
+        load_sprite("sprite.png")
+
+        assert mock_load.call_count == 2
+
+
+class TestToDisplayFormat:
+    """Test conversion of pre-rendered surfaces."""
+
+    @patch("pygame.display.get_surface", return_value=MagicMock())
+    def test_alpha_surface_keeps_alpha(self, _mock_surface):
+        """Test that per-pixel alpha is kept by default."""
+        surface = MagicMock()
+
+        assert to_display_format(surface) is surface.convert_alpha.return_value
+
+    @patch("pygame.display.get_surface", return_value=MagicMock())
+    def test_opaque_surface_is_converted(self, _mock_surface):
+        """Test that opaque surfaces use a plain convert."""
+        surface = MagicMock()
+
+        assert to_display_format(surface, alpha=False) is surface.convert.return_value
+
+    @patch("pygame.display.get_surface", return_value=None)
+    def test_unchanged_without_display(self, _mock_surface):
+        """Test that nothing is converted before set_mode."""
+        surface = MagicMock()
+
+        assert to_display_format(surface) is surface
+        surface.convert_alpha.assert_not_called()
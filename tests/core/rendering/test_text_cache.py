@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+#
+#   Copyright (c) 2023, Monaco F. J. <monaco@usp.br>
+#
+#   This file is part of Naja.
+#
+#   Naja is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for the text cache."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import pygame
+
+from core.rendering import text_cache
+from core.rendering.text_cache import clear_text_cache, get_font, render_text
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    """Initialize pygame fonts and start every test with an empty cache."""
+    pygame.font.init()
+    clear_text_cache()
+    yield
+    clear_text_cache()
+
+
+class TestGetFont:
+    """Test font caching."""
+
+    def test_font_opened_once_per_size(self):
+        """Test that the same size returns the same font object."""
+        assert get_font(20) is get_font(20)
+
+    def test_different_sizes_get_different_fonts(self):
+        """Test that each size has its own font."""
+        assert get_font(20) is not get_font(30)
+
+
+class TestRenderText:
+    """Test rendered label caching."""
+
+    def test_same_label_reuses_surface(self):
+        """Test that an unchanged label is rasterized only once."""
+        first = render_text("Score", 20, (255, 255, 255))
+        second = render_text("Score", 20, (255, 255, 255))
+
+        assert first is second
+
+    def test_changed_label_renders_new_surface(self):
+        """Test that text, size and color all take part in the key."""
+        base = render_text("Score", 20, (255, 255, 255))
+
+        assert render_text("Scores", 20, (255, 255, 255)) is not base
+        assert render_text("Score", 22, (255, 255, 255)) is not base
+        assert render_text("Score", 20, (0, 0, 0)) is not base
+
+    def test_pygame_color_is_accepted(self):
+        """Test that unhashable pygame colors are normalized for the key."""
+        first = render_text("Score", 20, pygame.Color(1, 2, 3))
+        second = render_text("Score", 20, pygame.Color(1, 2, 3))
+
+        assert first is second
+
+    def test_alpha_applied_once(self):
+        """Test that alpha is set on the cached surface and kept apart."""
+        translucent = render_text("7", 20, (255, 255, 255), alpha=64)
+        opaque = render_text("7", 20, (255, 255, 255))
+
+        assert translucent.get_alpha() == 64
+        assert translucent is not opaque
+
+    def test_cache_is_bounded(self, monkeypatch):
+        """Test that the cache is dropped once it reaches its limit."""
+        monkeypatch.setattr(text_cache, "MAX_CACHED_TEXTS", 3)
+        for i in range(3):
+            render_text(str(i), 20, (255, 255, 255))
+
+        render_text("overflow", 20, (255, 255, 255))
+
+        assert len(text_cache._texts) == 1
+
+    @patch("core.rendering.text_cache.to_display_format")
+    def test_label_converted_once(self, mock_convert):
+        """Test that a label is converted to the display format when cached."""
+        mock_convert.return_value = MagicMock()
+
+        first = render_text("Score", 20, (255, 255, 255))
+        second = render_text("Score", 20, (255, 255, 255))
+
+        assert first is second is mock_convert.return_value
+        mock_convert.assert_called_once()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+#
+#   Copyright (c) 2023, Monaco F. J. <monaco@usp.br>
+#
+#   This file is part of Naja.
+#
+#   Naja is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Tests for the main loop of the game application."""
+
+from unittest.mock import Mock
+
+from core.app import ECSGameApp
+
+
+def _app(frames):
+    """Create an app with mocked collaborators that stops after some frames."""
+    app = ECSGameApp()
+    app.clock = Mock()
+    app.clock.tick.return_value = 16.0
+    app.renderer = Mock()
+    app.scene_manager = Mock()
+
+    def update(dt_ms):
+        if app.scene_manager.update.call_count >= frames:
+            app.running = False
+
+    app.scene_manager.update.side_effect = update
+    return app
+
+
+class TestRun:
+    """Test one frame of the main loop."""
+
+    def test_frame_steps_run_in_order(self):
+        """Test that every frame ticks, updates, renders and presents."""
+        app = _app(frames=3)
+        calls = Mock()
+        calls.attach_mock(app.clock.tick, "tick")
+        calls.attach_mock(app.renderer.begin_frame, "begin_frame")
+        calls.attach_mock(app.scene_manager.update, "update")
+        calls.attach_mock(app.scene_manager.render, "render")
+        calls.attach_mock(app.renderer.update, "present")
+
+        app.run()
+
+        names = [name for name, _, _ in calls.mock_calls]
+        assert names == ["tick", "begin_frame", "update", "render", "present"] * 3
+        app.scene_manager.update.assert_called_with(16.0)
+
+    def test_quit_flag_checked_every_frame(self):
+        """Test that clearing running stops the loop after that frame."""
+        app = _app(frames=1)
+
+        app.run()
+
+        assert app.renderer.update.call_count == 1
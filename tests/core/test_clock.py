@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+#
+#   Copyright (c) 2023, Monaco F. J. <monaco@usp.br>
+#
+#   This file is part of Naja.
+#
+#   Naja is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for the game clock."""
+
+from unittest.mock import patch
+
+from core.clock import GameClock
+
+
+class TestTick:
+    """Test frame limiting and delta time."""
+
+    def test_first_tick_returns_zero(self):
+        """Test that the first tick has no previous frame to measure."""
+        clock = GameClock(target_fps=60)
+
+        assert clock.tick() == 0.0
+
+    def test_tick_sleeps_through_pygame_clock(self):
+        """Test that the frame is limited by pygame's sleeping clock."""
+        clock = GameClock(target_fps=60)
+        with patch.object(clock, "_clock") as pygame_clock:
+            pygame_clock.tick.return_value = 17
+            clock.tick()
+            delta = clock.tick()
+
+        pygame_clock.tick.assert_called_with(60)
+        assert delta == 17.0
+
+    def test_fps_limit_overrides_target(self):
+        """Test that an explicit limit is passed on to pygame."""
+        clock = GameClock(target_fps=60)
+        with patch.object(clock, "_clock") as pygame_clock:
+            pygame_clock.tick.return_value = 8
+            clock.tick(120)
+
+        pygame_clock.tick.assert_called_with(120)
+
+    def test_long_frame_is_capped(self):
+        """Test that a stall is reported as at most two frames."""
+        clock = GameClock(target_fps=50)
+        with patch.object(clock, "_clock") as pygame_clock:
+            pygame_clock.tick.return_value = 500
+            clock.tick()
+            delta = clock.tick()
+
+        assert delta == 40.0
+
+    def test_reset_makes_next_tick_first(self):
+        """Test that reset starts measuring from scratch."""
+        clock = GameClock(target_fps=60)
+        with patch.object(clock, "_clock") as pygame_clock:
+            pygame_clock.tick.return_value = 17
+            clock.tick()
+            clock.reset()
+            delta = clock.tick()
+
+        assert delta == 0.0
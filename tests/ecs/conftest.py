@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+#
+#   Copyright (c) 2023, Monaco F. J. <monaco@usp.br>
+#
+#   This file is part of Naja.
+#
+#   Naja is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Shared fixtures for the ECS tests."""
+
+import pytest
+
+from core.types.color import Color
+from ecs.components.interpolation import Interpolation
+from ecs.components.position import Position
+from ecs.components.renderable import Renderable
+from ecs.components.snake_body import SnakeBody
+from ecs.components.velocity import Velocity
+from ecs.entities.snake import Snake
+
+
+class RecordingRenderer:
+    """Renderer stub that records queued draw commands."""
+
+    def __init__(self, size=(200, 200)):
+        self.size = size
+        self.blitted = []
+        self.batches = []
+        self.rects = []
+        self.drawn_rects = []
+
+    def get_size(self):
+        """Return the target surface size."""
+        return self.size
+
+    def blit(self, surface, dest):
+        """Record a queued blit."""
+        self.blitted.append((surface, dest))
+
+    def blits(self, blit_sequence):
+        """Record a queued batch and its destination rects."""
+        self.batches.append(blit_sequence)
+        self.rects.extend(dest for _, dest in blit_sequence)
+
+    def draw_rect(self, color, rect, width=0):
+        """Record a queued rect."""
+        self.drawn_rects.append((color, rect))
+
+
+def _add_snake(world, x=5, y=5, size=1, dx=1, dy=0):
+    """Add a snake to the world and return it."""
+    snake = Snake(
+        position=Position(x=x, y=y),
+        velocity=Velocity(dx=dx, dy=dy, speed=10.0),
+        body=SnakeBody(size=size),
+        interpolation=Interpolation(),
+        renderable=Renderable(shape="square", color=Color(0, 255, 0), size=30),
+    )
+    world.registry.add(snake)
+    return snake
+
+
+@pytest.fixture
+def add_snake():
+    """Provide a factory that adds a snake to a world and returns it."""
+    return _add_snake
+
+
+@pytest.fixture
+def renderer():
+    """Provide a renderer stub that records queued draw commands."""
+    return RecordingRenderer()
@@ -202,6 +202,17 @@ class TestFontReloading:
         # Larger window should have larger fonts
         assert large_height > small_height
 
+    def test_reload_fonts_same_width_keeps_fonts(self, pygame_init):
+        """Test that reloading at an unchanged width reopens nothing."""
+        assets = AssetsSystem(800)
+        initial_big = assets.get_font("big")
+        custom = assets.get_custom_font(50)
+
+        assets.reload_fonts(800)
+
+        assert assets.get_font("big") is initial_big
+        assert assets.get_custom_font(50) is custom
+
 
 class TestSpriteManagement:
     """Tests for sprite loading and access."""
@@ -20,11 +20,16 @@
 """Tests for CollisionSystem."""
 
 import pytest
+from collections import deque
 from unittest.mock import Mock
 
 from ecs.systems.collision import CollisionSystem
 from ecs.world import World
-from ecs.board import Board
+from ecs.board import Board, Tile
+from ecs.entities.entity import EntityType
+from ecs.prefabs.apple import create_apple
+from ecs.components.position import Position
+from ecs.components.snake_body import SnakeBody
 
 
 @pytest.fixture
@@ -557,3 +562,145 @@ def test_collision_system_handles_empty_world(mock_callbacks):
     # no collisions should occur
     mock_callbacks["death"].assert_not_called()
     mock_callbacks["apple_eaten"].assert_not_called()
+
+
+# Snake Entity Tests
+
+
+def _body(cells):
+    """Build a body whose tail and occupancy map cover the given cells."""
+    return SnakeBody(
+        segments=deque(Position(x=x, y=y) for x, y in cells),
+        size=len(cells) + 1,
+        occupied={cell: 1 for cell in cells},
+    )
+
+
+class TestSelfBiteLookup:
+    """Test self-bite detection against the occupancy map."""
+
+    def test_self_bite_detected_on_next_cell(self, world, add_snake):
+        """Test that moving into a tail cell is reported as a bite."""
+        snake = add_snake(world, x=2, y=2, dx=0, dy=-1)
+        snake.body = _body([(3, 2), (3, 1), (2, 1)])
+
+        collision = CollisionSystem(settings=None)
+
+        assert collision._check_self_bite(world) is True
+
+    def test_no_self_bite_on_free_cell(self, world, add_snake):
+        """Test that a free next cell is not reported as a bite."""
+        snake = add_snake(world, x=2, y=2, dx=-1, dy=0)
+        snake.body = _body([(3, 2)])
+
+        collision = CollisionSystem(settings=None)
+
+        assert collision._check_self_bite(world) is False
+
+    def test_wall_mode_read_once_per_check(self, world, add_snake):
+        """Test that the fatal checks share one read of the wall setting."""
+        snake = add_snake(world, x=2, y=2)
+        settings = Mock()
+        settings.get.return_value = False
+
+        collision = CollisionSystem(settings=settings)
+
+        assert collision._find_fatal_collision(world, snake) is None
+        settings.get.assert_called_once_with("electric_walls")
+
+
+class TestObstacleLookup:
+    """Test obstacle detection against the board obstacle tiles."""
+
+    def test_obstacle_tile_under_head_is_detected(self, world, add_snake):
+        """Test that a head on an obstacle tile is a collision."""
+        add_snake(world, x=4, y=4)
+        world.board.set_tile(4, 4, Tile.OBSTACLE)
+
+        collision = CollisionSystem(settings=None)
+
+        assert collision._check_obstacle_collision(world) is True
+
+    def test_out_of_bounds_head_is_not_an_obstacle(self, world, add_snake):
+        """Test that an out of bounds head does not hit the obstacle index."""
+        add_snake(world, x=-1, y=4)
+
+        collision = CollisionSystem(settings=None)
+
+        assert collision._check_obstacle_collision(world) is False
+
+
+class TestFatalCollision:
+    """Test the side-effect free fatal collision detection."""
+
+    def test_free_cell_reports_no_death(self, world, add_snake):
+        """Test that a snake on a free cell survives."""
+        snake = add_snake(world, x=4, y=4)
+
+        collision = CollisionSystem(settings=None)
+
+        assert collision._find_fatal_collision(world, snake) is None
+        assert snake.body.alive
+
+    def test_obstacle_reason_does_not_kill_by_itself(self, world, add_snake):
+        """Test that detection reports the reason without killing the snake."""
+        snake = add_snake(world, x=4, y=4)
+        world.board.set_tile(4, 4, Tile.OBSTACLE)
+
+        collision = CollisionSystem(settings=None)
+
+        assert collision._find_fatal_collision(world, snake) == "obstacle"
+        assert snake.body.alive
+
+    def test_dead_snake_skips_collision_pass(self, world, add_snake):
+        """Test that a dead snake is not killed again by update."""
+        snake = add_snake(world, x=4, y=4)
+        snake.body.alive = False
+        world.board.set_tile(4, 4, Tile.OBSTACLE)
+        collision = CollisionSystem(settings=None)
+        collision._handle_death = lambda *args: pytest.fail("death handled twice")
+
+        collision.update(world)
+
+    def test_stationary_snake_skips_collision_pass(self, world, add_snake):
+        """Test that a snake without velocity is not checked."""
+        snake = add_snake(world, x=4, y=4, dx=0, dy=0)
+        world.board.set_tile(4, 4, Tile.OBSTACLE)
+        collision = CollisionSystem(settings=None)
+
+        collision.update(world)
+
+        assert snake.body.alive
+
+
+class TestAppleLookup:
+    """Test that apples are scanned once per head cell."""
+
+    def test_apples_scanned_once_per_cell(self, world, add_snake):
+        """Test that frames spent in the same cell skip the apple scan."""
+        snake = add_snake(world, x=4, y=4)
+        collision = CollisionSystem(settings=None)
+        scanned = []
+        collision._check_apple_collision = lambda world, snake: scanned.append(
+            (snake.position.x, snake.position.y)
+        )
+
+        for _ in range(3):
+            collision.update(world)
+        snake.position.x = 5
+        collision.update(world)
+
+        assert scanned == [(4, 4), (5, 4)]
+
+    def test_apple_on_entered_cell_is_eaten(self, world, add_snake):
+        """Test that moving onto an apple still eats it."""
+        snake = add_snake(world, x=4, y=4)
+        create_apple(world, x=5, y=4, grid_size=30)
+        collision = CollisionSystem(settings=None)
+        collision.update(world)
+
+        snake.position.x = 5
+        collision.update(world)
+
+        assert snake.body.size == 2
+        assert not world.registry.query_by_type(EntityType.APPLE)
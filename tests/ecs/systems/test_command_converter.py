@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+#
+#   Copyright (c) 2023, Monaco F. J. <monaco@usp.br>
+#
+#   This file is part of Naja.
+#
+#   Naja is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for the command converter."""
+
+import pygame
+
+from ecs.systems.ui.command_converter import CommandConverter
+from game.commands import MoveCommand, OpenSettingsCommand, QuitCommand
+
+
+def _key(key):
+    """Create a KEYDOWN event for a key."""
+    return pygame.event.Event(pygame.KEYDOWN, key=key)
+
+
+class TestHandleInGameEvent:
+    """Test translation of in-game key presses."""
+
+    def test_direction_key_moves(self):
+        """Test that both arrow and WASD keys produce a move."""
+        converter = CommandConverter(lambda: (1, 0))
+
+        assert converter.handle_in_game_event(_key(pygame.K_UP)) == [
+            MoveCommand(dx=0, dy=-1)
+        ]
+        assert converter.handle_in_game_event(_key(pygame.K_s)) == [
+            MoveCommand(dx=0, dy=1)
+        ]
+
+    def test_reversal_is_ignored(self):
+        """Test that a 180 degree turn produces no command."""
+        converter = CommandConverter(lambda: (1, 0))
+
+        assert converter.handle_in_game_event(_key(pygame.K_LEFT)) == []
+
+    def test_control_keys_issue_commands(self):
+        """Test that control keys map to their commands."""
+        converter = CommandConverter()
+
+        assert converter.handle_in_game_event(_key(pygame.K_q)) == [QuitCommand()]
+        assert converter.handle_in_game_event(_key(pygame.K_ESCAPE)) == [
+            OpenSettingsCommand()
+        ]
+
+    def test_control_key_skips_direction_lookup(self):
+        """Test that non-movement keys do not query the snake direction."""
+        calls = []
+        converter = CommandConverter(lambda: calls.append(1) or (1, 0))
+
+        converter.handle_in_game_event(_key(pygame.K_p))
+
+        assert calls == []
+
+    def test_unmapped_key_is_ignored(self):
+        """Test that other keys produce no command."""
+        assert CommandConverter().handle_in_game_event(_key(pygame.K_z)) == []
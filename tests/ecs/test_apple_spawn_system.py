@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+#
+#   Copyright (c) 2023, Monaco F. J. <monaco@usp.br>
+#
+#   This file is part of Naja.
+#
+#   Naja is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Apple spawn system tests."""
+
+import pytest
+
+from ecs.world import World
+from ecs.board import Board
+from ecs.systems.apple_spawn import AppleSpawnSystem
+from ecs.entities.entity import EntityType
+from ecs.prefabs.apple import create_apple
+
+
+@pytest.fixture
+def world():
+    """Create a world with a 3x3 board."""
+    return World(Board(width=3, height=3, cell_size=30))
+
+
+def _fill_with_apples(world, skip=None):
+    """Place an apple on every cell except the skipped one."""
+    for x in range(world.board.width):
+        for y in range(world.board.height):
+            if (x, y) != skip:
+                create_apple(world, x=x, y=y, grid_size=30, color=None)
+
+
+class TestFreeCellSpawn:
+    """Test apple positions drawn from the free cells."""
+
+    def test_spawns_on_last_free_cell(self, world):
+        """Test that the only free cell is found in a single draw."""
+        _fill_with_apples(world, skip=(2, 1))
+        system = AppleSpawnSystem()
+
+        assert system._find_valid_position(world) == (2, 1)
+
+    def test_full_board_returns_none(self, world):
+        """Test that a full board yields no spawn position."""
+        _fill_with_apples(world)
+        system = AppleSpawnSystem()
+
+        assert system._find_valid_position(world) is None
+
+    def test_drawn_cells_are_removed(self):
+        """Test that drawing never returns the same cell twice."""
+        system = AppleSpawnSystem()
+        free_cells = [(x, y) for x in range(3) for y in range(3)]
+
+        drawn = {system._draw_free_cell(free_cells) for _ in range(9)}
+
+        assert len(drawn) == 9
+        assert free_cells == []
+        assert system._draw_free_cell(free_cells) is None
+
+    def test_same_seed_draws_same_positions(self, world):
+        """Test that a seeded system spawns deterministically."""
+        first = AppleSpawnSystem(random_seed=7)
+        second = AppleSpawnSystem(random_seed=7)
+
+        positions = [first._find_valid_position(world) for _ in range(5)]
+
+        assert positions == [second._find_valid_position(world) for _ in range(5)]
+
+    def test_update_spawns_missing_apple(self, world):
+        """Test that update spawns the default single apple inside the board."""
+        system = AppleSpawnSystem()
+
+        system.update(world)
+
+        apples = world.registry.query_by_type(EntityType.APPLE)
+        assert len(apples) == 1
+        apple = next(iter(apples.values()))
+        assert 0 <= apple.position.x < 3
+        assert 0 <= apple.position.y < 3
+
+    def test_board_cells_rebuilt_on_resize(self, world):
+        """Test that the cached board cells follow the board size."""
+        system = AppleSpawnSystem()
+
+        assert len(system._get_board_cells(world.board)) == 9
+
+        world.board = Board(width=4, height=2, cell_size=30)
+
+        cells = system._get_board_cells(world.board)
+        assert len(cells) == 8
+        assert (3, 1) in cells
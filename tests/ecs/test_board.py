@@ -322,6 +322,34 @@ class TestBoardRowColumnAccess:
             board.get_column(5)
 
 
+class TestBoardRevision:
+    """Test the tile modification counter."""
+
+    def test_revision_bumped_by_every_modification(self):
+        """Test that set_tile, set_tiles and clear all bump the revision."""
+        board = Board(5, 5)
+        revisions = [board.revision]
+
+        board.set_tile(0, 0, Tile.WALL)
+        revisions.append(board.revision)
+        board.set_tiles([(1, 1, Tile.APPLE), (2, 2, Tile.APPLE)])
+        revisions.append(board.revision)
+        board.clear()
+        revisions.append(board.revision)
+
+        assert revisions == sorted(set(revisions))
+
+    def test_revision_unchanged_by_reads(self):
+        """Test that reading tiles does not bump the revision."""
+        board = Board(5, 5)
+        revision = board.revision
+
+        board.get_tile(1, 1)
+        board.get_row(1)
+
+        assert board.revision == revision
+
+
 class TestBoardPerformance:
     """Test board performance characteristics."""
 
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+#
+#   Copyright (c) 2023, Monaco F. J. <monaco@usp.br>
+#
+#   This file is part of Naja.
+#
+#   Naja is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Board render system tests."""
+
+import pytest
+
+from ecs.world import World
+from ecs.board import Board, Tile
+from ecs.systems.board_render import BoardRenderSystem
+
+
+@pytest.fixture
+def world():
+    """Create a world with a 10x10 board."""
+    return World(Board(width=10, height=10, cell_size=20))
+
+
+class TestBackgroundCache:
+    """Test the pre-rendered board background."""
+
+    def test_background_blitted_once_per_frame(self, world, renderer):
+        """Test that a frame is a single blit of the whole background."""
+        system = BoardRenderSystem(renderer)
+
+        system.update(world)
+
+        assert len(renderer.blitted) == 1
+        surface, dest = renderer.blitted[0]
+        assert dest == (0, 0)
+        assert surface.get_size() == (200, 200)
+
+    def test_background_reused_across_frames(self, world, renderer):
+        """Test that an unchanged board reuses the same surface."""
+        system = BoardRenderSystem(renderer)
+
+        system.update(world)
+        system.update(world)
+
+        first, second = (surface for surface, _ in renderer.blitted)
+        assert first is second
+
+    def test_background_rebuilt_on_tile_change(self, world, renderer):
+        """Test that a wall placed on the board shows up in a new surface."""
+        system = BoardRenderSystem(renderer)
+
+        system.update(world)
+        world.board.set_tile(1, 1, Tile.WALL)
+        system.update(world)
+
+        first, second = (surface for surface, _ in renderer.blitted)
+        assert first is not second
+        obstacle = system._get_color_scheme(world).obstacle.to_tuple()
+        assert tuple(second.get_at((30, 30)))[:3] == obstacle
+
+    def test_obstacle_tiles_baked_into_background(self, world, renderer):
+        """Test that obstacle tiles are drawn on the background."""
+        system = BoardRenderSystem(renderer)
+        world.board.set_tile(2, 3, Tile.OBSTACLE)
+
+        system.update(world)
+
+        surface, _ = renderer.blitted[0]
+        obstacle = system._get_color_scheme(world).obstacle.to_tuple()
+        assert tuple(surface.get_at((50, 70)))[:3] == obstacle
+
+    def test_background_rebuilt_on_new_board(self, world, renderer):
+        """Test that replacing the board (grid resize) rebuilds it."""
+        system = BoardRenderSystem(renderer)
+
+        system.update(world)
+        world.board = Board(width=20, height=20, cell_size=10)
+        system.update(world)
+
+        first, second = (surface for surface, _ in renderer.blitted)
+        assert first is not second
+
+
+class TestGridOverlay:
+    """Test the cached grid overlay."""
+
+    def test_draw_grid_is_one_blit(self, world, renderer):
+        """Test that drawing the grid queues a single overlay blit."""
+        system = BoardRenderSystem(renderer)
+
+        system.draw_grid(world)
+        system.draw_grid(world)
+
+        first, second = (surface for surface, _ in renderer.blitted)
+        assert first is second
+
+    def test_overlay_has_lines_and_transparent_cells(self, world, renderer):
+        """Test that only grid lines are opaque on the overlay."""
+        system = BoardRenderSystem(renderer)
+        color_scheme = system._get_color_scheme(world)
+
+        overlay = system._get_grid_overlay(world, color_scheme)
+
+        assert overlay.get_size() == (200, 200)
+        assert tuple(overlay.get_at((20, 5)))[:3] == color_scheme.grid.to_tuple()
+        assert overlay.get_at((10, 10)).a == 0
@@ -40,6 +40,13 @@ class TestVisualComponents:
         assert pos_default.prev_x == 0
         assert pos_default.prev_y == 0
 
+    def test_position_component_is_slotted(self):
+        """Test Position stores its fields in slots, not a per-instance dict."""
+        pos = Position(x=1, y=2)
+
+        assert not hasattr(pos, "__dict__")
+        assert set(Position.__slots__) == {"x", "y", "prev_x", "prev_y"}
+
     def test_renderable_component(self):
         """Test Renderable component creation and fields."""
         color = Color(255, 0, 0)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+#
+#   Copyright (c) 2023, Monaco F. J. <monaco@usp.br>
+#
+#   This file is part of Naja.
+#
+#   Naja is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Entity render system tests."""
+
+from unittest.mock import patch
+
+import pytest
+
+from ecs.world import World
+from ecs.board import Board
+from ecs.systems.entity_render import EntityRenderSystem
+from ecs.prefabs.apple import create_apple
+from ecs.prefabs.obstacle_field import create_obstacles
+
+
+@pytest.fixture
+def world():
+    """Create a world with a 10x10 board."""
+    return World(Board(width=10, height=10, cell_size=20))
+
+
+class TestRectCache:
+    """Test reuse of entity rects across frames."""
+
+    def test_static_entity_reuses_rect(self, world, renderer):
+        """Test that an unmoved entity is drawn with the same rect object."""
+        create_apple(world, x=2, y=3, grid_size=20)
+        system = EntityRenderSystem(renderer)
+
+        system.update(world)
+        system.update(world)
+
+        first, second = renderer.rects
+        assert first is second
+        assert tuple(first) == (40, 60, 20, 20)
+
+    def test_moved_entity_gets_new_rect(self, world, renderer):
+        """Test that a moved entity is drawn at its new position."""
+        apple_id = create_apple(world, x=2, y=3, grid_size=20)
+        system = EntityRenderSystem(renderer)
+
+        system.update(world)
+        world.registry.get(apple_id).position.x = 5
+        system.update(world)
+
+        first, second = renderer.rects
+        assert first is not second
+        assert tuple(first) == (40, 60, 20, 20)
+        assert tuple(second) == (100, 60, 20, 20)
+
+    def test_removed_entity_rect_is_dropped(self, world, renderer):
+        """Test that rects of removed entities are released."""
+        apple_id = create_apple(world, x=2, y=3, grid_size=20)
+        create_apple(world, x=4, y=4, grid_size=20)
+        system = EntityRenderSystem(renderer)
+
+        system.update(world)
+        world.registry.remove(apple_id)
+        system.update(world)
+
+        assert apple_id not in system._rects
+
+
+class TestBatchedDraw:
+    """Test batching of entities into blits calls."""
+
+    def test_same_color_entities_share_one_batch(self, world, renderer):
+        """Test that entities of one layer and color are queued together."""
+        for x in range(5):
+            create_apple(world, x=x, y=0, grid_size=20)
+        system = EntityRenderSystem(renderer)
+
+        system.update(world)
+
+        assert len(renderer.batches) == 1
+        tiles = {id(tile) for tile, _ in renderer.batches[0]}
+        assert len(tiles) == 1
+
+    def test_tile_is_filled_with_entity_color(self, world, renderer):
+        """Test that the blitted tile carries the entity color."""
+        create_apple(world, x=1, y=1, grid_size=20, color=(200, 10, 10))
+        system = EntityRenderSystem(renderer)
+
+        system.update(world)
+
+        tile, _ = renderer.batches[0][0]
+        assert tile.get_size() == (20, 20)
+        assert tuple(tile.get_at((0, 0)))[:3] == (200, 10, 10)
+
+    def test_tile_converted_to_display_format(self, world, renderer):
+        """Test that the shared tile is converted once when built."""
+        create_apple(world, x=1, y=1, grid_size=20)
+        create_apple(world, x=2, y=1, grid_size=20)
+        system = EntityRenderSystem(renderer)
+
+        with patch("ecs.systems.entity_render.to_display_format") as convert:
+            convert.side_effect = lambda surface, alpha: surface
+            system.update(world)
+
+        convert.assert_called_once()
+        assert convert.call_args.kwargs == {"alpha": False}
+
+
+class TestBakedObstacles:
+    """Test that obstacles are left to the board background."""
+
+    def test_obstacles_are_not_drawn(self, world, renderer):
+        """Test that only the apple is drawn when obstacles are baked."""
+        create_obstacles(world, "Hard", grid_size=20, random_seed=1)
+        create_apple(world, x=0, y=0, grid_size=20)
+        system = EntityRenderSystem(renderer)
+
+        system.update(world)
+
+        assert renderer.rects == [(0, 0, 20, 20)]
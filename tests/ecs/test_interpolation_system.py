@@ -360,6 +360,26 @@ class TestWillWrapAround:
         )
         assert result is True
 
+    def test_detect_wrapping_matches_helper(self, world):
+        """Test that the inlined check in _detect_wrapping agrees with it."""
+        system = InterpolationSystem(electric_walls=False)
+        labels = {
+            (False, False): "none",
+            (True, False): "x",
+            (False, True): "y",
+            (True, True): "both",
+        }
+
+        for cx, tx in ((0, 20), (0, 580), (580, 0), (300, 320), (0, 600)):
+            for cy, ty in ((0, 20), (0, 380), (380, 0), (200, 220)):
+                expected = labels[
+                    (
+                        system._will_wrap_around(cx, tx, 600, 20),
+                        system._will_wrap_around(cy, ty, 400, 20),
+                    )
+                ]
+                assert system._detect_wrapping(world, cx, cy, tx, ty) == expected
+
 
 class TestInterpolatedPositionCalculation:
     """Test smooth position calculation."""
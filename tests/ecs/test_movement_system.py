@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+#
+#   Copyright (c) 2023, Monaco F. J. <monaco@usp.br>
+#
+#   This file is part of Naja.
+#
+#   Naja is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Movement system tests."""
+
+import pytest
+from collections import deque
+
+from ecs.world import World
+from ecs.board import Board
+from ecs.systems.movement import MovementSystem
+from ecs.components.position import Position
+
+
+@pytest.fixture
+def world():
+    """Create a world with a 10x10 board."""
+    return World(Board(width=10, height=10, cell_size=30))
+
+
+def _step(system, world):
+    """Advance the movement system by exactly one move."""
+    world.set_dt_ms(1000.0)
+    system.update(world)
+
+
+def _expected_occupancy(body):
+    """Build the occupancy map from scratch for comparison."""
+    expected = {}
+    for seg in body.segments:
+        cell = (seg.x, seg.y)
+        expected[cell] = expected.get(cell, 0) + 1
+    return expected
+
+
+class TestSnakeBodyOccupancy:
+    """Test that the occupancy map mirrors the tail segments."""
+
+    def test_list_body_adopted_on_first_move(self, world, add_snake):
+        """Test that a body built from a segment list gets a deque and a map."""
+        system = MovementSystem()
+        snake = add_snake(world, x=1, y=3, size=3)
+        snake.body.segments = [Position(x=1, y=2), Position(x=1, y=1)]
+
+        _step(system, world)
+
+        assert isinstance(snake.body.segments, deque)
+        assert snake.body.occupied == _expected_occupancy(snake.body)
+
+    def test_occupancy_follows_growth_and_moves(self, world, add_snake):
+        """Test that the map matches segments while growing and moving."""
+        system = MovementSystem()
+        snake = add_snake(world)
+
+        for step in range(12):
+            if step % 3 == 0:
+                snake.body.size += 1
+            _step(system, world)
+            assert snake.body.occupied == _expected_occupancy(snake.body)
+
+    def test_occupancy_follows_shrink(self, world, add_snake):
+        """Test that trimmed segments are released from the map."""
+        system = MovementSystem()
+        snake = add_snake(world, size=5)
+        for _ in range(5):
+            _step(system, world)
+
+        snake.body.size = 2
+        _step(system, world)
+
+        assert len(snake.body.segments) == 1
+        assert snake.body.occupied == _expected_occupancy(snake.body)
+
+
+class TestTailAdvance:
+    """Test that the rotated tail follows the head's path."""
+
+    def test_segments_trail_head_path(self, world, add_snake):
+        """Test that each segment sits on an earlier head cell."""
+        system = MovementSystem()
+        snake = add_snake(world, x=1, y=1, size=4)
+        path = []
+
+        for _ in range(6):
+            path.append((snake.position.x, snake.position.y))
+            _step(system, world)
+
+        cells = [(seg.x, seg.y) for seg in snake.body.segments]
+        assert cells == path[::-1][:3]
+
+    def test_segments_interpolate_from_cell_behind(self, world, add_snake):
+        """Test that each segment's previous cell is the one it left."""
+        system = MovementSystem()
+        snake = add_snake(world, x=1, y=1, size=4)
+        for _ in range(6):
+            _step(system, world)
+        before = [(seg.x, seg.y) for seg in snake.body.segments]
+
+        _step(system, world)
+
+        prevs = [(seg.prev_x, seg.prev_y) for seg in snake.body.segments]
+        assert prevs == before
@@ -22,9 +22,11 @@
 import pytest
 
 from ecs.world import World
-from ecs.board import Board
+from ecs.board import Board, Tile
+from ecs.systems.collision import CollisionSystem
 from ecs.systems.obstacle_generation import ObstacleGenerationSystem
 from ecs.entities.entity import EntityType
+from ecs.prefabs.snake import create_snake
 
 
 @pytest.fixture
@@ -281,6 +283,18 @@ class TestTrapDetection:
         # this should detect the trap
         assert would_trap
 
+    def test_is_blocked_checks_bounds_and_blocked_set(
+        self, world_small, obstacle_system
+    ):
+        """Test that out of bounds and blocked cells are reported blocked."""
+        board = world_small.board
+        blocked = {(0, 0)}
+
+        assert obstacle_system._is_blocked(0, 0, blocked, board)
+        assert obstacle_system._is_blocked(-1, 0, blocked, board)
+        assert obstacle_system._is_blocked(0, board.height, blocked, board)
+        assert not obstacle_system._is_blocked(1, 0, blocked, board)
+
 
 class TestGenerateObstaclesByDifficulty:
     """Test generation by difficulty level."""
@@ -434,3 +448,49 @@ class TestIntegration:
 
         # should be different IDs
         assert set(ids1).isdisjoint(set(ids2))
+
+
+class TestObstacleIndex:
+    """Test that generated obstacles are indexed on the board."""
+
+    def _world(self):
+        """Create a world whose cells are one unit wide, with a snake at (5, 5)."""
+        world = World(Board(width=10, height=10, cell_size=1))
+        snake = world.registry.get(create_snake(world, grid_size=1))
+        return world, snake
+
+    def test_generated_obstacles_mark_board_tiles(self):
+        """Test that every generated obstacle cell is an obstacle tile."""
+        world, _ = self._world()
+        system = ObstacleGenerationSystem(random_seed=42)
+
+        obstacle_ids = system.generate_obstacles(world, 5, (5, 5))
+
+        assert len(obstacle_ids) == 5
+        for oid in obstacle_ids:
+            position = world.registry.get(oid).position
+            assert world.board.get_tile(position.x, position.y) is Tile.OBSTACLE
+
+    def test_snake_dies_on_generated_obstacle(self):
+        """Test that the collision system kills a snake on a generated obstacle."""
+        world, snake = self._world()
+        system = ObstacleGenerationSystem(random_seed=42)
+        obstacle_ids = system.generate_obstacles(world, 5, (5, 5))
+        obstacle = world.registry.get(obstacle_ids[0])
+
+        snake.position.x = obstacle.position.x
+        snake.position.y = obstacle.position.y
+        CollisionSystem(settings=None).update(world)
+
+        assert not snake.body.alive
+
+    def test_failed_attempt_clears_tiles(self):
+        """Test that a discarded attempt leaves no obstacle tiles behind."""
+        world, _ = self._world()
+        system = ObstacleGenerationSystem(random_seed=42)
+
+        result = system._attempt_generation(world, 100, (5, 5), world.board, 1)
+
+        assert result is None
+        tiles = [tile for x in range(10) for tile in world.board.get_column(x)]
+        assert Tile.OBSTACLE not in tiles
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+#
+#   Copyright (c) 2023, Monaco F. J. <monaco@usp.br>
+#
+#   This file is part of Naja.
+#
+#   Naja is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Overlay render system tests."""
+
+import pygame
+
+from ecs.systems.overlay_render import OverlayRenderSystem
+
+
+class TestOverlayCache:
+    """Test reuse of the dimmed overlay backgrounds."""
+
+    def setup_method(self):
+        """Initialize pygame fonts for the overlay labels."""
+        pygame.font.init()
+
+    def test_pause_overlay_reused_across_frames(self, renderer):
+        """Test that paused frames blit the same overlay surface."""
+        system = OverlayRenderSystem(renderer)
+
+        system.draw_pause_overlay(200, 200)
+        system.draw_pause_overlay(200, 200)
+
+        overlays = [s for s, dest in renderer.blitted if dest == (0, 0)]
+        assert len(overlays) == 2
+        assert overlays[0] is overlays[1]
+        assert overlays[0].get_alpha() == 128
+
+    def test_overlay_rebuilt_on_resize(self, renderer):
+        """Test that a new window size gets a new overlay."""
+        system = OverlayRenderSystem(renderer)
+
+        first = system._get_overlay(200, 200, 128)
+        second = system._get_overlay(300, 300, 128)
+
+        assert first is not second
+        assert second.get_size() == (300, 300)
+        assert list(system._overlays) == [(300, 300, 128)]
+
+    def test_alpha_levels_have_separate_overlays(self, renderer):
+        """Test that pause and settings overlays do not share a surface."""
+        system = OverlayRenderSystem(renderer)
+
+        pause = system._get_overlay(200, 200, 128)
+        settings = system._get_overlay(200, 200, 200)
+
+        assert pause is not settings
+        assert settings.get_alpha() == 200
@@ -20,7 +20,7 @@
 """Tests for entity prefab factories."""
 
 from ecs.world import World
-from ecs.board import Board
+from ecs.board import Board, Tile
 from ecs.entities.entity import EntityType
 from ecs.prefabs.snake import create_snake
 from ecs.prefabs.apple import create_apple
@@ -88,7 +88,7 @@ class TestSnakePrefab:
         snake = world.registry.get(snake_id)
 
         # assert - should start with no tail segments
-        assert snake.body.segments == []
+        assert list(snake.body.segments) == []
         assert snake.body.size == 1
         assert snake.body.alive is True
 
@@ -472,3 +472,37 @@ class TestObstaclePrefab:
         # assert
         assert isinstance(result, list)
         assert len(result) == 0
+
+    def test_create_obstacles_marks_board_tiles(self):
+        """Test obstacle cells are indexed as obstacle tiles on the board."""
+        # arrange
+        board = Board(width=20, height=20, cell_size=20)  # 20x20 tiles
+        world = World(board)
+
+        # act
+        obstacle_ids = create_obstacles(world, "Hard", grid_size=20, random_seed=42)
+
+        # assert
+        obstacle_cells = set()
+        for obstacle_id in obstacle_ids:
+            obstacle = world.registry.get(obstacle_id)
+            obstacle_cells.add((obstacle.position.x, obstacle.position.y))
+        for x in range(board.width):
+            for y in range(board.height):
+                is_obstacle = board.get_tile(x, y) is Tile.OBSTACLE
+                assert is_obstacle == ((x, y) in obstacle_cells)
+
+    def test_create_obstacles_share_renderable(self):
+        """Test obstacles of one field share a single tag and renderable."""
+        # arrange
+        board = Board(width=20, height=20, cell_size=20)  # 20x20 tiles
+        world = World(board)
+
+        # act
+        obstacle_ids = create_obstacles(world, "Hard", grid_size=20, random_seed=42)
+
+        # assert
+        obstacles = [world.registry.get(oid) for oid in obstacle_ids]
+        assert len({id(o.renderable) for o in obstacles}) == 1
+        assert len({id(o.tag) for o in obstacles}) == 1
+        assert len({(o.position.x, o.position.y) for o in obstacles}) == len(obstacles)
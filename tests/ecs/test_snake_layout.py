@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+#
+#   Copyright (c) 2023, Monaco F. J. <monaco@usp.br>
+#
+#   This file is part of Naja.
+#
+#   Naja is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Tests for the pixel layout of interpolated snake cells."""
+
+from ecs.components.position import Position
+from ecs.systems.snake_layout import (
+    cell_destinations,
+    linear_destinations,
+    quantize_alpha,
+    wrapped_destinations,
+)
+
+
+def test_quantize_alpha_snaps_to_whole_pixels():
+    """Test that progress below the next pixel is dropped."""
+    assert quantize_alpha(0.52, 20) == 0.5
+    assert quantize_alpha(1.0, 20) == 1.0
+
+
+def test_linear_destinations_match_float_interpolation():
+    """Test that integer pixel steps give the float interpolation result."""
+    positions = [
+        Position(x=2, y=1, prev_x=1, prev_y=1),
+        Position(x=1, y=1, prev_x=1, prev_y=2),
+        Position(x=1, y=2, prev_x=1, prev_y=3),
+        Position(x=0, y=3, prev_x=1, prev_y=3),
+    ]
+
+    for raw_alpha in (0.0, 0.13, 0.5, 0.77, 0.99, 1.0):
+        alpha = quantize_alpha(raw_alpha, 20)
+        expected = [
+            (
+                int((p.prev_x * 20 + (p.x * 20 - p.prev_x * 20) * alpha) % 200),
+                int((p.prev_y * 20 + (p.y * 20 - p.prev_y * 20) * alpha) % 200),
+            )
+            for p in positions
+        ]
+
+        destinations = linear_destinations(positions, round(alpha * 20), 20, 200, 200)
+
+        assert destinations == expected
+
+
+def test_wrapped_destinations_match_linear_away_from_edges():
+    """Test that cells far from the wrapped edges move linearly."""
+    positions = [
+        Position(x=5, y=5, prev_x=4, prev_y=5),
+        Position(x=4, y=5, prev_x=4, prev_y=4),
+    ]
+
+    for alpha in (0.0, 0.25, 0.5, 1.0):
+        linear = linear_destinations(positions, round(alpha * 20), 20, 200, 200)
+
+        for wrap_x, wrap_y in ((True, False), (False, True), (True, True)):
+            wrapped = wrapped_destinations(
+                positions, alpha, wrap_x, wrap_y, 20, 200, 200
+            )
+            assert wrapped == linear
+
+
+def test_wrapped_destinations_continue_across_edge():
+    """Test that a cell crossing an edge keeps its direction and is duplicated."""
+    positions = [Position(x=0, y=1, prev_x=9, prev_y=1)]
+
+    assert wrapped_destinations(positions, 0.5, True, False, 20, 200, 200) == [
+        (190, 20),
+        (-10, 20),
+    ]
+
+
+def test_wrapped_destinations_only_on_wrapped_axis():
+    """Test that a jump on an axis that did not wrap is interpolated linearly."""
+    positions = [Position(x=0, y=1, prev_x=9, prev_y=1)]
+
+    assert wrapped_destinations(positions, 0.5, False, True, 20, 200, 200) == [(90, 20)]
+
+
+def test_wrapped_destinations_duplicate_on_both_axes():
+    """Test that a cell in a corner gets one duplicate across both edges."""
+    positions = [Position(x=0, y=0, prev_x=9, prev_y=9)]
+
+    assert wrapped_destinations(positions, 0.5, True, True, 20, 200, 200) == [
+        (190, 190),
+        (-10, -10),
+    ]
+
+
+def test_cell_destinations_picks_layout_by_axis():
+    """Test that unwrapped frames use the linear layout."""
+    positions = [Position(x=0, y=1, prev_x=9, prev_y=1)]
+
+    assert cell_destinations(positions, 0.5, "none", 20, 200, 200) == [(90, 20)]
+    assert cell_destinations(positions, 0.5, "x", 20, 200, 200) == [
+        (190, 20),
+        (-10, 20),
+    ]
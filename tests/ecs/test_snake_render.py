@@ -20,6 +20,7 @@
 """Tests for snake rendering with interpolation."""
 
 import pytest
+import pygame
 from ecs.entities.snake import Snake
 from ecs.components.position import Position
 from ecs.components.velocity import Velocity
@@ -29,6 +30,7 @@ from ecs.components.renderable import Renderable
 from ecs.world import World
 from ecs.board import Board
 from ecs.systems.board_render import BoardRenderSystem
+from ecs.systems.snake_render import SnakeRenderSystem
 
 
 class MockRenderer:
@@ -52,6 +54,102 @@ class MockRenderer:
         self.drawn_lines.append((color, start, end, width))
 
 
+def _grid_snake(segments, alpha, wrapped_axis="none"):
+    """Create a snake in grid coordinates with the given tail."""
+    return Snake(
+        position=Position(x=3, y=1, prev_x=2, prev_y=1),
+        velocity=Velocity(dx=1, dy=0),
+        body=SnakeBody(segments=segments, size=len(segments) + 1),
+        interpolation=Interpolation(alpha=alpha, wrapped_axis=wrapped_axis),
+        renderable=None,
+    )
+
+
+def test_tail_drawn_as_single_batch(renderer):
+    """Test that the tail is one blit batch of interpolated positions."""
+    world = World(Board(width=10, height=10, cell_size=20))
+    snake = _grid_snake(
+        [
+            Position(x=2, y=1, prev_x=1, prev_y=1),
+            Position(x=1, y=1, prev_x=1, prev_y=2),
+        ],
+        alpha=0.5,
+    )
+    world.registry.add(snake)
+
+    SnakeRenderSystem(renderer).update(world)
+
+    assert len(renderer.batches) == 1
+    (batch,) = renderer.batches
+    assert [dest for _, dest in batch] == [(30, 20), (20, 30)]
+    # every segment shares one cached tile
+    assert len({id(tile) for tile, _ in batch}) == 1
+    # only the head is still drawn as a rect
+    assert len(renderer.drawn_rects) == 1
+
+
+def test_wrapped_tail_batch_includes_duplicates(renderer):
+    """Test that segments crossing an edge also get their duplicate."""
+    world = World(Board(width=10, height=10, cell_size=20))
+    snake = _grid_snake([Position(x=0, y=1, prev_x=9, prev_y=1)], alpha=0.5)
+    snake.interpolation.wrapped_axis = "x"
+    world.registry.add(snake)
+
+    SnakeRenderSystem(renderer).update(world)
+
+    (batch,) = renderer.batches
+    assert [dest for _, dest in batch] == [(190, 20), (-10, 20)]
+
+
+def test_wrapped_head_drawn_with_duplicate(renderer):
+    """Test that a head crossing an edge is also drawn on the opposite edge."""
+    world = World(Board(width=10, height=10, cell_size=20))
+    snake = _grid_snake([], alpha=0.5, wrapped_axis="x")
+    snake.position = Position(x=0, y=1, prev_x=9, prev_y=1)
+    world.registry.add(snake)
+
+    SnakeRenderSystem(renderer).update(world)
+
+    assert [rect for _, rect in renderer.drawn_rects] == [
+        (190, 20, 20, 20),
+        (-10, 20, 20, 20),
+    ]
+
+
+def test_tail_batch_reused_within_same_pixel(renderer):
+    """Test that sub-pixel progress reuses the previous tail batch."""
+    world = World(Board(width=10, height=10, cell_size=20))
+    snake = _grid_snake([Position(x=2, y=1, prev_x=1, prev_y=1)], alpha=0.50)
+    world.registry.add(snake)
+    system = SnakeRenderSystem(renderer)
+
+    system.update(world)
+    snake.interpolation.alpha = 0.52  # 10.4px, same whole pixel as 10px
+    system.update(world)
+    snake.interpolation.alpha = 0.60
+    system.update(world)
+
+    first, second, third = renderer.batches
+    assert second is first
+    assert third is not first
+    assert [dest for _, dest in third] == [(32, 20)]
+
+
+def test_head_position_quantized_to_pixels(renderer):
+    """Test that the head rect only moves in whole-pixel steps."""
+    world = World(Board(width=10, height=10, cell_size=20))
+    snake = _grid_snake([], alpha=0.50)
+    world.registry.add(snake)
+    system = SnakeRenderSystem(renderer)
+
+    system.update(world)
+    snake.interpolation.alpha = 0.52
+    system.update(world)
+
+    (_, first), (_, second) = renderer.drawn_rects
+    assert first == second == pygame.Rect(50, 20, 20, 20)
+
+
 def test_snake_render_basic():
     """Test basic snake rendering without interpolation."""
     # Create a world with a board
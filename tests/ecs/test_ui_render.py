@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+#
+#   Copyright (c) 2023, Monaco F. J. <monaco@usp.br>
+#
+#   This file is part of Naja.
+#
+#   Naja is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""UI render system tests."""
+
+from unittest.mock import Mock, patch
+
+import pygame
+import pytest
+
+from core.rendering.sprites import clear_sprite_cache
+from ecs.board import Board
+from ecs.components.score import Score
+from ecs.systems.ui_render import UIRenderSystem
+from ecs.world import World
+
+
+@pytest.fixture(autouse=True)
+def fresh_sprites():
+    """Make every test load the speaker sprites itself."""
+    clear_sprite_cache()
+    yield
+    clear_sprite_cache()
+
+
+class TestMusicIndicator:
+    """Test the cached speaker icon."""
+
+    @patch("pygame.transform.scale")
+    @patch("pygame.image.load")
+    def test_icon_loaded_and_scaled_once(self, mock_load, mock_scale, renderer):
+        """Test that repeated frames reuse the scaled speaker icon."""
+        pygame.font.init()
+        mock_scale.return_value = pygame.Surface((20, 20))
+        system = UIRenderSystem(renderer)
+
+        for _ in range(3):
+            system.draw_music_indicator(500, 500, music_on=True)
+
+        mock_load.assert_called_once()
+        mock_scale.assert_called_once_with(mock_load.return_value, (20, 20))
+        icons = [surface for surface, _ in renderer.blitted[::2]]
+        assert all(icon is mock_scale.return_value for icon in icons)
+
+    @patch("pygame.transform.scale")
+    @patch("pygame.image.load")
+    def test_icon_rescaled_on_resize_and_state(self, mock_load, mock_scale, renderer):
+        """Test that a new width or music state gets its own icon."""
+        pygame.font.init()
+        system = UIRenderSystem(renderer)
+
+        system.draw_music_indicator(500, 500, music_on=True)
+        system.draw_music_indicator(500, 500, music_on=False)
+        system.draw_music_indicator(750, 750, music_on=True)
+
+        assert mock_scale.call_count == 3
+
+    @patch("pygame.transform.scale")
+    @patch("pygame.image.load")
+    def test_old_sizes_dropped_on_resize(self, mock_load, mock_scale, renderer):
+        """Test that icons scaled for a previous window are released."""
+        pygame.font.init()
+        system = UIRenderSystem(renderer)
+
+        system.draw_music_indicator(500, 500, music_on=True)
+        system.draw_music_indicator(500, 500, music_on=False)
+        system.draw_music_indicator(750, 750, music_on=True)
+
+        assert list(system._hud._speaker_icons) == [(True, 30)]
+
+
+class ScoreEntity:
+    """Minimal entity holding a score component."""
+
+    def __init__(self):
+        self.score = Score()
+
+    def get_type(self):
+        """Return no entity type, like the game's score entity."""
+        return None
+
+
+class TestScore:
+    """Test the cached score label."""
+
+    def _world(self):
+        """Create a world holding a score entity."""
+        world = World(Board(width=10, height=10, cell_size=20))
+        entity = ScoreEntity()
+        world.registry.add(entity)
+        return world, entity.score
+
+    def test_unchanged_score_reuses_blit(self, renderer):
+        """Test that frames with the same score queue the same label and rect."""
+        pygame.font.init()
+        world, _ = self._world()
+        system = UIRenderSystem(renderer)
+
+        system.draw_score(world, 500, 500)
+        system.draw_score(world, 500, 500)
+
+        first, second = renderer.blitted
+        assert first[0] is second[0] and first[1] is second[1]
+
+    def test_new_score_renders_new_label(self, renderer):
+        """Test that a score change lays the label out again."""
+        pygame.font.init()
+        world, score = self._world()
+        system = UIRenderSystem(renderer)
+
+        system.draw_score(world, 500, 500)
+        score.current = 1
+        system.draw_score(world, 500, 500)
+
+        first, second = renderer.blitted
+        assert first[0] is not second[0]
+
+
+class TestSpeedBar:
+    """Test the cached speed bar surface."""
+
+    def _system(self, renderer):
+        """Create a UI system with speed settings drawing to a renderer."""
+        pygame.font.init()
+        settings = Mock()
+        settings.get.side_effect = {"initial_speed": 4, "max_speed": 20}.get
+        return UIRenderSystem(renderer, settings), renderer
+
+    def test_unchanged_speed_reuses_bar(self, renderer):
+        """Test that frames at the same speed blit the same bar surface."""
+        system, renderer = self._system(renderer)
+        world = World(Board(width=10, height=10, cell_size=20))
+
+        system.draw_speed_bar(world, 500, 500)
+        system.draw_speed_bar(world, 500, 500)
+
+        bars = [surface for surface, _ in renderer.blitted[::2]]
+        assert bars[0] is bars[1]
+
+    def test_resize_builds_new_bar(self, renderer):
+        """Test that a new window size gets a bar of the new width."""
+        system, renderer = self._system(renderer)
+        world = World(Board(width=10, height=10, cell_size=20))
+
+        system.draw_speed_bar(world, 500, 500)
+        system.draw_speed_bar(world, 800, 800)
+
+        first, second = (surface for surface, _ in renderer.blitted[::2])
+        assert first is not second
+        assert second.get_width() == 200
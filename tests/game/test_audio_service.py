@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+#
+#   Copyright (c) 2023, Monaco F. J. <monaco@usp.br>
+#
+#   This file is part of Naja.
+#
+#   Naja is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for the audio service sound effect cache."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from game.services.audio_service import AudioService
+
+
+class FakeSettings:
+    """Settings stub with sound effects enabled."""
+
+    def get(self, key):
+        """Return True for every audio toggle."""
+        return True
+
+
+class TestSoundCache:
+    """Test that sound effects are decoded once."""
+
+    @patch("pygame.mixer.Sound")
+    def test_sound_loaded_once(self, mock_sound):
+        """Test that playing a sound twice loads the file once."""
+        service = AudioService(settings=FakeSettings())
+
+        assert service.play_sound("eat.flac")
+        assert service.play_sound("eat.flac")
+
+        mock_sound.assert_called_once_with("eat.flac")
+        assert mock_sound.return_value.play.call_count == 2
+
+    @patch("pygame.mixer.Sound")
+    def test_preload_decodes_ahead_of_time(self, mock_sound):
+        """Test that preloaded sounds are not loaded again when played."""
+        service = AudioService(settings=FakeSettings())
+
+        service.preload_sounds("eat.flac", "gameover.wav")
+        service.play_sound("gameover.wav")
+
+        assert mock_sound.call_count == 2
+
+    @patch("pygame.mixer.Sound", side_effect=FileNotFoundError)
+    def test_failed_preload_is_reported(self, mock_sound, capsys):
+        """Test that a missing file is reported without breaking playback."""
+        service = AudioService(settings=FakeSettings())
+
+        service.preload_sounds("missing.wav")
+
+        assert "missing.wav" in capsys.readouterr().out
+        assert service.play_sound("missing.wav") is False
+
+    @patch("pygame.mixer.Sound", side_effect=TypeError)
+    def test_unexpected_preload_error_propagates(self, mock_sound):
+        """Test that errors other than load failures are not swallowed."""
+        service = AudioService(settings=FakeSettings())
+
+        with pytest.raises(TypeError):
+            service.preload_sounds("eat.flac")
+
+    @patch("pygame.mixer.Channel")
+    @patch("pygame.mixer.Sound")
+    def test_priority_sound_uses_reserved_channel(self, mock_sound, mock_channel):
+        """Test that priority sounds play on the reserved channel."""
+        service = AudioService(settings=FakeSettings())
+
+        service.play_sound("gameover.wav", priority=True)
+
+        mock_channel.assert_called_once_with(AudioService.PRIORITY_CHANNEL)
+        mock_channel.return_value.play.assert_called_once_with(mock_sound.return_value)
+        mock_sound.return_value.play.assert_not_called()
+
+    def test_disabled_sound_effects_play_nothing(self):
+        """Test that nothing is loaded when sound effects are off."""
+        settings = MagicMock()
+        settings.get.return_value = False
+        service = AudioService(settings=settings)
+
+        with patch("pygame.mixer.Sound") as mock_sound:
+            assert service.play_sound("eat.flac") is False
+
+        mock_sound.assert_not_called()
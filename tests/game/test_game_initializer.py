@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+#
+#   Copyright (c) 2023, Monaco F. J. <monaco@usp.br>
+#
+#   This file is part of Naja.
+#
+#   Naja is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Tests for the initial apple placement of the game initializer."""
+
+from collections import deque
+
+from core.types.color import Color
+from ecs.board import Board
+from ecs.components.apple_config import AppleConfig
+from ecs.components.interpolation import Interpolation
+from ecs.components.position import Position
+from ecs.components.renderable import Renderable
+from ecs.components.snake_body import SnakeBody
+from ecs.components.velocity import Velocity
+from ecs.entities.entity import EntityType
+from ecs.entities.snake import Snake
+from ecs.systems.apple_spawn import AppleSpawnSystem
+from ecs.world import World
+from game.services.game_initializer import GameInitializer
+
+
+class AppleConfigEntity:
+    """Minimal entity holding the desired apple count."""
+
+    def __init__(self, desired_count):
+        self.apple_config = AppleConfig(desired_count=desired_count)
+
+    def get_type(self):
+        """Return no entity type, like the game's config entity."""
+        return None
+
+
+def _world(width, height, desired_count):
+    """Create a world with a snake at (0, 0) and an apple config."""
+    world = World(Board(width=width, height=height, cell_size=20))
+    world.registry.add(
+        Snake(
+            position=Position(x=0, y=0),
+            velocity=Velocity(dx=-1, dy=0),
+            body=SnakeBody(
+                segments=deque([Position(x=1, y=0)]), size=2, occupied={(1, 0): 1}
+            ),
+            interpolation=Interpolation(),
+            renderable=Renderable(shape="square", color=Color(0, 255, 0), size=20),
+        )
+    )
+    world.registry.add(AppleConfigEntity(desired_count))
+    return world
+
+
+def _apple_cells(world):
+    """Get the cells of every apple in the world."""
+    apples = world.registry.query_by_type(EntityType.APPLE)
+    return [(apple.position.x, apple.position.y) for apple in apples.values()]
+
+
+class TestInitialApples:
+    """Test placement of the apples created with a new game."""
+
+    def test_apples_on_distinct_free_cells(self):
+        """Test that apples avoid the snake and each other."""
+        world = _world(5, 5, desired_count=10)
+
+        GameInitializer()._create_initial_apples(world)
+
+        cells = _apple_cells(world)
+        assert len(cells) == 10
+        assert len(set(cells)) == 10
+        assert not {(0, 0), (1, 0)} & set(cells)
+
+    def test_crowded_board_fills_every_free_cell(self):
+        """Test that a board with fewer free cells than apples is filled."""
+        world = _world(2, 2, desired_count=5)
+
+        GameInitializer()._create_initial_apples(world)
+
+        assert sorted(_apple_cells(world)) == [(0, 1), (1, 1)]
+
+    def test_placement_follows_spawn_system_seed(self):
+        """Test that initial apples come from the spawn system's seeded RNG."""
+        placements = []
+        for _ in range(2):
+            world = _world(6, 6, desired_count=5)
+            initializer = GameInitializer(
+                apple_spawn_system=AppleSpawnSystem(random_seed=7)
+            )
+
+            initializer._create_initial_apples(world)
+
+            placements.append(_apple_cells(world))
+
+        assert placements[0] == placements[1]
+
+    def test_no_apples_without_config(self):
+        """Test that nothing is placed before the apple config exists."""
+        world = World(Board(width=5, height=5, cell_size=20))
+
+        GameInitializer()._create_initial_apples(world)
+
+        assert not _apple_cells(world)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+#
+#   Copyright (c) 2023, Monaco F. J. <monaco@usp.br>
+#
+#   This file is part of Naja.
+#
+#   Naja is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for the menu scene: idle input waiting and label reuse."""
+
+from unittest.mock import Mock
+
+import pygame
+
+from game.scenes.base_scene import IDLE_EVENT_TIMEOUT_MS
+from game.scenes.menu import MenuScene
+from game.scenes.scene_manager import SceneManager
+
+
+def _menu_scene():
+    """Create a menu scene with a mocked adapter and no pending input."""
+    adapter = Mock()
+    adapter.get_events.return_value = []
+    adapter.wait_for_events.return_value = []
+    settings = Mock()
+    settings.get.return_value = False
+    scene = MenuScene(adapter, Mock(), 600, 600, Mock(), settings)
+    return scene, adapter
+
+
+class TestIdleInputWait:
+    """Test that static scenes sleep on the event queue between inputs."""
+
+    def test_first_frame_polls_without_waiting(self):
+        """Test that a newly entered scene draws its first frame at once."""
+        scene, adapter = _menu_scene()
+
+        scene.update(16.0)
+
+        adapter.get_events.assert_called_once()
+        adapter.wait_for_events.assert_not_called()
+
+    def test_later_frames_wait_for_input(self):
+        """Test that an idle menu blocks on the queue after its first frame."""
+        scene, adapter = _menu_scene()
+
+        scene.update(16.0)
+        scene.update(16.0)
+
+        adapter.wait_for_events.assert_called_once_with(IDLE_EVENT_TIMEOUT_MS)
+
+    def test_reentering_scene_polls_again(self):
+        """Test that the scene manager resets the wait on each transition."""
+        scene, adapter = _menu_scene()
+        manager = SceneManager()
+        manager.register_scene("menu", scene)
+        scene.update(16.0)
+        scene.update(16.0)
+
+        manager.set_scene("menu")
+        manager.update(16.0)
+
+        assert adapter.get_events.call_count == 2
+
+
+class TestMenuRedraw:
+    """Test that an unchanged menu reuses its rendered labels."""
+
+    def _scene(self):
+        """Create a menu scene whose assets render real surfaces."""
+        assets = Mock()
+        assets.render_custom.side_effect = lambda *args: pygame.Surface((10, 5))
+        assets.render_small.side_effect = lambda *args: pygame.Surface((10, 5))
+        renderer = Mock()
+        scene = MenuScene(Mock(), renderer, 600, 600, assets, Mock())
+        return scene, assets, renderer
+
+    def test_idle_frames_reuse_labels(self):
+        """Test that idle frames queue the same batch without new labels."""
+        scene, assets, renderer = self._scene()
+
+        scene.render()
+        scene.render()
+
+        assert assets.render_small.call_count == 3
+        first, second = (c.args[0] for c in renderer.blits.call_args_list)
+        assert first is second
+
+    def test_selection_change_lays_out_again(self):
+        """Test that moving the selection renders the items again."""
+        scene, assets, renderer = self._scene()
+
+        scene.render()
+        scene._selected_index = 1
+        scene.render()
+
+        assert assets.render_small.call_count == 6
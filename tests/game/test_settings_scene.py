@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+#
+#   Copyright (c) 2023, Monaco F. J. <monaco@usp.br>
+#
+#   This file is part of Naja.
+#
+#   Naja is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for redrawing the settings scene only when it changed."""
+
+from unittest.mock import Mock
+
+import pygame
+
+from game.scenes.settings import SettingsScene
+
+FIELDS = [
+    {"key": "speed", "label": "Speed"},
+    {"key": "sound_effects", "label": "Sound effects"},
+]
+
+
+def _settings_scene():
+    """Create a settings scene with mocked assets and two fields."""
+    values = {"speed": 4.0, "sound_effects": True}
+    settings = Mock()
+    settings.MENU_FIELDS = FIELDS
+    settings.get.side_effect = values.get
+    settings.format_setting_value.side_effect = lambda f, v, w, g: str(v)
+    assets = Mock()
+    assets.render_custom.side_effect = lambda text, color, px: pygame.Surface((10, 5))
+    renderer = Mock()
+    scene = SettingsScene(Mock(), renderer, 600, 600, assets, settings)
+    return scene, assets, renderer, values
+
+
+class TestMenuRedraw:
+    """Test that unchanged menus reuse their rendered labels."""
+
+    def test_unchanged_menu_is_not_rendered_again(self):
+        """Test that idle frames queue the same batch without new labels."""
+        scene, assets, renderer, _ = _settings_scene()
+
+        scene.render()
+        calls = assets.render_custom.call_count
+        scene.render()
+
+        assert assets.render_custom.call_count == calls
+        first, second = (c.args[0] for c in renderer.blits.call_args_list)
+        assert first is second
+
+    def test_changed_selection_renders_again(self):
+        """Test that moving the selection lays the menu out again."""
+        scene, assets, renderer, _ = _settings_scene()
+
+        scene.render()
+        calls = assets.render_custom.call_count
+        scene._selected_index = 1
+        scene.render()
+
+        assert assets.render_custom.call_count == 2 * calls
+
+    def test_changed_value_renders_again(self):
+        """Test that a changed setting value is shown on the next frame."""
+        scene, assets, renderer, values = _settings_scene()
+
+        scene.render()
+        values["speed"] = 5.0
+        scene.render()
+
+        labels = [c.args[0] for c in assets.render_custom.call_args_list]
+        assert "Speed: 5.0" in labels